@@ -0,0 +1,12 @@
+"""Benchmarks of the wrapper layer, run with `asv <https://asv.readthedocs.io/>`_.
+
+The benchmarks run against the in-memory backend, so they measure the cost of
+the Python side of ``wellcad.com`` and need neither Windows nor WellCAD.
+"""
+import wellcad.com
+
+
+def memory_application():
+    """Starts a fresh in-memory WellCAD application."""
+    wellcad.com.set_backend("memory")
+    return wellcad.com.Application(new_instance=True)
@@ -0,0 +1,34 @@
+from . import memory_application
+
+CONFIG = "\n".join(["[FilterLog]", "FilterType = Median", "FilterWidth = 5", "MaxDepthRange = yes",
+                    "TopDepth = 5.0", "BottomDepth = 10.0", "CircularData = no"])
+
+
+class ProcessingSuite:
+    """Marshalling the arguments of ``Borehole`` processing calls.
+
+    The in-memory server does not model these processes, so only the cost
+    of getting the call and its arguments to the server is measured.
+    """
+
+    def setup(self):
+        self.app = memory_application()
+        self.borehole = self.app.new_borehole()
+        self.logs = []
+        for i in range(20):
+            log = self.borehole.insert_new_log(1)
+            log.name = f"LOG{i}"
+            self.logs.append(log.name)
+        self.log_list = ",".join(self.logs)
+
+    def teardown(self):
+        self.app.quit(False)
+
+    def time_filter_log(self):
+        self.borehole.filter_log("LOG0", False, CONFIG)
+
+    def time_extract_well_log_statistics(self):
+        self.borehole.extract_well_log_statistics(self.log_list, False, CONFIG)
+
+    def time_zonation(self):
+        self.borehole.zonation(self.log_list, False, "NbOutputIntervals = 2")
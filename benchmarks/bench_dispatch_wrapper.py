@@ -0,0 +1,47 @@
+import wellcad.com
+from . import memory_application
+
+
+class DispatchWrapperSuite:
+    """Construction of wrapper objects and single property and method calls.
+
+    The ``raw`` benchmarks make the same calls on the dispatch object
+    directly, as a baseline for the overhead of the wrapper layer.
+    """
+
+    def setup(self):
+        self.app = memory_application()
+        self.borehole = self.app.new_borehole()
+        self.log = self.borehole.insert_new_log(1)
+        self.log.name = "GR"
+        self.dispatch = self.log._dispatch
+        # No wrapper is kept for this log, so each construction misses the
+        # identity cache, whose entries die with their wrapper.
+        self.uncached_dispatch = self.borehole.insert_new_log(1)._dispatch
+
+    def teardown(self):
+        self.app.quit(False)
+
+    def time_construct(self):
+        wellcad.com.Log(self.uncached_dispatch)
+
+    def time_construct_cached(self):
+        wellcad.com.Log(self.dispatch)
+
+    def time_construct_none(self):
+        wellcad.com.Log(None)
+
+    def time_property_get(self):
+        self.log.name
+
+    def time_property_get_raw(self):
+        self.dispatch.Name
+
+    def time_property_set(self):
+        self.log.name = "GR"
+
+    def time_property_set_raw(self):
+        self.dispatch.Name = "GR"
+
+    def time_get_log(self):
+        self.borehole.get_log("GR")
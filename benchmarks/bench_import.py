@@ -0,0 +1,8 @@
+class ImportSuite:
+    """Import time of the package, each run in a fresh interpreter."""
+
+    def timeraw_import(self):
+        return "import wellcad.com"
+
+    def timeraw_import_log(self):
+        return "from wellcad.com import Log"
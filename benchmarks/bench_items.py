@@ -0,0 +1,93 @@
+from . import memory_application
+
+
+class ItemIterationSuite:
+    """Reading the items of Structure and Litho Logs one by one."""
+
+    params = [100, 1_000]
+    param_names = ["items"]
+
+    def setup(self, items):
+        self.app = memory_application()
+        borehole = self.app.new_borehole()
+        self.structures = borehole.insert_new_log(6)
+        self.structures.data_table = (("Depth", "Azimuth", "Dip", "Aperture"),) + tuple(
+            (i * 0.5, i % 360, i % 90, 0.01) for i in range(items))
+        self.litho = borehole.insert_new_log(7)
+        self.litho.data_table = (("Top Depth", "Bottom Depth", "Litho Code", "Value"),) + tuple(
+            (i * 1.0, i + 1.0, "SST", 0.5) for i in range(items))
+
+    def teardown(self, items):
+        self.app.quit(False)
+
+    def time_iterate_structures(self, items):
+        log = self.structures
+        for i in range(log.nb_of_data):
+            structure = log.structure(i)
+            structure.depth, structure.azimuth, structure.tilt
+
+    def time_iterate_litho_beds(self, items):
+        log = self.litho
+        for i in range(log.nb_of_data):
+            bed = log.get_litho_bed(i)
+            bed.top_depth, bed.bottom_depth, bed.litho_code
+
+    def time_iterate_structure_view(self, items):
+        for structure in self.structures.structures:
+            structure.depth, structure.azimuth, structure.tilt
+
+    def time_iterate_litho_bed_view(self, items):
+        for bed in self.litho.litho_beds:
+            bed.top_depth, bed.bottom_depth, bed.litho_code
+
+
+class PickInsertionSuite:
+    """Inserting structure picks one by one and in bulk."""
+
+    params = [100, 1_000]
+    param_names = ["items"]
+
+    def setup(self, items):
+        import numpy
+        self.app = memory_application()
+        self.borehole = self.app.new_borehole()
+        self.picks = numpy.column_stack((numpy.arange(items) * 0.5, numpy.arange(items) % 360,
+                                         numpy.arange(items) % 90, numpy.zeros(items)))
+
+    def teardown(self, items):
+        self.app.quit(False)
+
+    def time_insert_new_structure_ex(self, items):
+        log = self.borehole.insert_new_log(6)
+        for depth, azimuth, dip, aperture in self.picks.tolist():
+            log.insert_new_structure_ex(depth, azimuth, dip, aperture)
+
+    def time_insert_structures(self, items):
+        self.borehole.insert_new_log(6).insert_structures(self.picks)
+
+
+class IntervalQuerySuite:
+    """Point queries on a Litho Log, through the server and an interval index."""
+
+    params = [100, 1_000]
+    param_names = ["items"]
+
+    def setup(self, items):
+        self.app = memory_application()
+        self.litho = self.app.new_borehole().insert_new_log(7)
+        self.litho.data_table = (("Top Depth", "Bottom Depth", "Litho Code", "Value"),) + tuple(
+            (i * 1.0, i + 1.0, "SST", 0.5) for i in range(items))
+        self.depths = [i + 0.5 for i in range(items)]
+
+    def teardown(self, items):
+        self.app.quit(False)
+
+    def time_litho_bed_at_depth(self, items):
+        for depth in self.depths:
+            self.litho.get_litho_bed_at_depth(depth)
+
+    def time_interval_index(self, items):
+        self.litho.invalidate_interval_index()
+        index = self.litho.interval_index()
+        for depth in self.depths:
+            index.at_depth(depth)
@@ -0,0 +1,41 @@
+import numpy as np
+from . import memory_application
+
+
+class DataTableSuite:
+    """Bulk transfer of Well Log data through ``Log.data_table`` and the
+    NumPy conversions built on it."""
+
+    params = [10_000, 100_000, 1_000_000]
+    param_names = ["rows"]
+    timeout = 300
+
+    def setup(self, rows):
+        self.app = memory_application()
+        self.borehole = self.app.new_borehole()
+        self.depths = np.arange(rows) * 0.1
+        self.values = np.sin(self.depths)
+        self.table = (("Depth", "GR"),) + tuple(zip(self.depths.tolist(), self.values.tolist()))
+        self.log = self.borehole.insert_new_log(1)
+        self.log.data_table = self.table
+
+    def teardown(self, rows):
+        self.app.quit(False)
+
+    def time_data_table_get(self, rows):
+        self.log.data_table
+
+    def time_data_table_set(self, rows):
+        self.log.data_table = self.table
+
+    def time_to_numpy(self, rows):
+        self.log.to_numpy()
+
+    def time_to_numpy_masked(self, rows):
+        self.log.to_numpy(masked=True)
+
+    def time_from_numpy(self, rows):
+        self.log.from_numpy(self.depths, self.values)
+
+    def peakmem_to_numpy(self, rows):
+        self.log.to_numpy()
@@ -0,0 +1,25 @@
+import numpy as np
+import wellcad.com
+
+
+class DipCorrectionSuite:
+    """Apparent to true dip correction of structure picks in NumPy."""
+
+    params = [1_000, 100_000]
+    param_names = ["picks"]
+
+    def setup(self, picks):
+        rng = np.random.default_rng(0)
+        self.deviation = wellcad.com.Deviation(np.linspace(0.0, 1000.0, 2000), np.linspace(0.0, 720.0, 2000) % 360.0,
+                                               np.linspace(0.0, 80.0, 2000))
+        self.picks = np.zeros(picks, [("depth", float), ("azimuth", float), ("dip", float), ("aperture", float)])
+        self.picks["depth"] = np.sort(rng.uniform(0.0, 1000.0, picks))
+        self.picks["azimuth"] = rng.uniform(0.0, 360.0, picks)
+        self.picks["dip"] = rng.uniform(0.0, 90.0, picks)
+        self.wells = [self.picks[i::100] for i in range(100)]
+
+    def time_apparent_to_true(self, picks):
+        wellcad.com.apparent_to_true(self.picks, self.deviation)
+
+    def time_apparent_to_true_hundred_wells(self, picks):
+        wellcad.com.apparent_to_true(self.wells, [self.deviation] * 100, "high side")
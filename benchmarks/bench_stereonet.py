@@ -0,0 +1,29 @@
+import numpy as np
+import wellcad.com
+
+
+class ZoneStatisticsSuite:
+    """Per zone rose, mean vector and density statistics for 100 wells."""
+
+    params = [1_000, 10_000]
+    param_names = ["picks_per_well"]
+    timeout = 300
+
+    def setup(self, picks):
+        rng = np.random.default_rng(0)
+        self.wells = []
+        for _ in range(100):
+            well = np.zeros(picks, [("depth", float), ("azimuth", float), ("dip", float), ("aperture", float)])
+            well["depth"] = np.sort(rng.uniform(0.0, 2000.0, picks))
+            well["azimuth"] = rng.uniform(0.0, 360.0, picks)
+            well["dip"] = rng.uniform(0.0, 90.0, picks)
+            self.wells.append(well)
+
+    def time_rose_histograms(self, picks):
+        wellcad.com.rose_histograms(self.wells, 50.0)
+
+    def time_mean_vectors(self, picks):
+        wellcad.com.mean_vectors(self.wells, 50.0)
+
+    def time_density_grids(self, picks):
+        wellcad.com.density_grids(self.wells[:10], 200.0, method="fisher")
@@ -0,0 +1,10 @@
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def make_picks(depth, azimuth, dip):
+    picks = numpy.zeros(len(depth), [("depth", float), ("azimuth", float), ("dip", float), ("aperture", float)])
+    picks["depth"], picks["azimuth"], picks["dip"] = depth, azimuth, dip
+    return picks
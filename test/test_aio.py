@@ -0,0 +1,115 @@
+import asyncio
+import threading
+import unittest
+import wellcad.com
+import wellcad.aio
+
+
+class TestAio(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        wellcad.com.set_backend("memory")
+
+    @classmethod
+    def tearDownClass(cls):
+        wellcad.com.set_backend(None)
+
+    def run_app(self, body, timeout=None):
+        async def main():
+            async with await wellcad.aio.Application.create(new_instance=True, timeout=timeout) as app:
+                return await body(app)
+        return asyncio.run(main())
+
+    def test_mirrors(self):
+        async def body(app):
+            borehole = await app.new_borehole()
+            self.assertIsInstance(borehole, wellcad.aio.Borehole)
+            log = await borehole.insert_new_log(1)
+            self.assertIsInstance(log, wellcad.aio.Log)
+            await log.set("name", "GR")
+            await log.set("data_table", (("Depth", "GR"), (1.0, 2.0)))
+            self.assertEqual(await log.name, "GR")
+            self.assertEqual(await borehole.nb_of_logs, 1)
+            same = await borehole.get_log("GR")
+            self.assertEqual(await same.get_data_at_depth(1.0), 2.0)
+            self.assertIsInstance(await borehole.header, wellcad.aio.AsyncWrapper)
+            with self.assertRaises(AttributeError):
+                log.name = "GR2"
+            with self.assertRaises(AttributeError):
+                log.no_such_member
+            return await log.run(lambda wrapped: threading.current_thread().name)
+        self.assertEqual(self.run_app(body), "wellcad-aio")
+
+    def test_calls_run_on_one_thread_in_order(self):
+        async def body(app):
+            borehole = await app.new_borehole()
+            log = await borehole.insert_new_log(3)
+            await asyncio.gather(*(log.insert_data_at_depth(float(i), float(i)) for i in range(20)))
+            threads = await asyncio.gather(*(log.run(lambda wrapped: threading.get_ident()) for _ in range(5)))
+            return await log.nb_of_data, set(threads)
+        count, threads = self.run_app(body)
+        self.assertEqual(count, 20)
+        self.assertEqual(len(threads), 1)
+        self.assertNotEqual(threads, {threading.get_ident()})
+
+    def test_cancel_queued_calls(self):
+        release = threading.Event()
+        ran = []
+
+        async def body(app):
+            borehole = await app.new_borehole()
+            blocker = asyncio.ensure_future(borehole.run(lambda wrapped: release.wait(5)))
+            await asyncio.sleep(0.05)
+            with self.assertRaises(asyncio.TimeoutError):
+                await asyncio.wait_for(borehole.run(lambda wrapped: ran.append(1)), 0.1)
+            queued = asyncio.ensure_future(borehole.run(lambda wrapped: ran.append(2)))
+            await asyncio.sleep(0.05)
+            queued.cancel()
+            await asyncio.sleep(0.01)
+            release.set()
+            self.assertTrue(await blocker)
+            with self.assertRaises(asyncio.CancelledError):
+                await queued
+            return await borehole.nb_of_logs
+
+        self.assertEqual(self.run_app(body), 0)
+        self.assertEqual(ran, [])
+
+    def test_timeout(self):
+        release = threading.Event()
+
+        async def body(app):
+            borehole = await app.new_borehole()
+            with self.assertRaises(asyncio.TimeoutError):
+                await borehole.run(lambda wrapped: release.wait(5))
+            release.set()
+            return await borehole.nb_of_logs
+
+        self.assertEqual(self.run_app(body, timeout=0.1), 0)
+
+    def test_lazy_results(self):
+        async def body(app):
+            borehole = await app.new_borehole()
+            log = await borehole.insert_new_log(6)
+            for depth in (1.0, 2.0, 3.0):
+                await log.insert_new_structure_ex(depth, 90.0, 30.0, 0.0)
+            structures = await log.structures
+            self.assertIsInstance(structures, list)
+            self.assertTrue(all(isinstance(s, wellcad.aio.AsyncWrapper) for s in structures))
+            depths = [await structure.depth for structure in structures]
+            with self.assertRaises(TypeError):
+                await borehole.bulk_edit()
+            return depths
+        self.assertEqual(self.run_app(body), [1.0, 2.0, 3.0])
+
+    def test_errors_propagate(self):
+        async def body(app):
+            borehole = await app.new_borehole()
+            with self.assertRaises(ZeroDivisionError):
+                await borehole.run(lambda wrapped: 1 / 0)
+            return await borehole.nb_of_logs
+        self.assertEqual(self.run_app(body), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,125 @@
+import concurrent.futures
+import os
+import pathlib
+import tempfile
+import time
+import unittest
+import wellcad.com
+
+
+def log_names(borehole):
+    return os.getpid(), [borehole.get_log(i).name for i in range(borehole.nb_of_logs)]
+
+
+def export_log(borehole, name, folder):
+    return borehole.get_log(name).file_export(folder, borehole.name, "csv")
+
+
+def fail(borehole):
+    raise ValueError(borehole.name)
+
+
+def sleep(borehole, seconds):
+    time.sleep(seconds)
+    return seconds
+
+
+def crash(borehole):
+    os._exit(1)
+
+
+def refuse():
+    raise ValueError("Cannot be unpickled")
+
+
+class Unpicklable:
+    def __reduce__(self):
+        return refuse, ()
+
+
+class TestApplicationPool(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        wellcad.com.set_backend("memory")
+        cls.temp_dir = tempfile.TemporaryDirectory()
+        cls.paths = []
+        app = wellcad.com.Application()
+        for i in range(5):
+            borehole = app.new_borehole()
+            borehole.name = f"Well {i}"
+            log = borehole.insert_new_log(1)
+            log.name = f"GR{i}"
+            log.data_table = (("Depth", log.name), (1.0, float(i)))
+            path = os.path.join(cls.temp_dir.name, f"well{i}.wcl")
+            borehole.save_as(path)
+            app.close_borehole(False)
+            cls.paths.append(path)
+        app.quit(False)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.temp_dir.cleanup()
+        wellcad.com.set_backend(None)
+
+    def test_map(self):
+        with wellcad.com.ApplicationPool(size=2) as pool:
+            results = list(pool.map(log_names, self.paths))
+        self.assertEqual([names for pid, names in results], [[f"GR{i}"] for i in range(5)])
+        self.assertNotIn(os.getpid(), {pid for pid, names in results})
+
+    def test_recycling(self):
+        with wellcad.com.ApplicationPool(size=1, max_documents_per_worker=2) as pool:
+            pids = [pool.submit(log_names, path).result()[0] for path in self.paths]
+        self.assertEqual(len(set(pids)), 3)
+        self.assertEqual(pids[0], pids[1])
+        self.assertNotEqual(pids[1], pids[2])
+
+    def test_files_returned(self):
+        with wellcad.com.ApplicationPool(size=2) as pool:
+            futures = [pool.submit(export_log, path, f"GR{i}", self.temp_dir.name)
+                       for i, path in enumerate(self.paths)]
+            self.assertTrue(all(future.result(timeout=30) for future in futures))
+        self.assertTrue(pathlib.Path(self.temp_dir.name, "Well 3.csv").exists())
+
+    def test_errors(self):
+        with wellcad.com.ApplicationPool(size=1) as pool:
+            with self.assertRaises(ValueError):
+                pool.submit(fail, None).result()
+            with self.assertRaises(OSError):
+                pool.submit(log_names, os.path.join(self.temp_dir.name, "missing.wcl")).result()
+            self.assertEqual(pool.submit(log_names, self.paths[0]).result()[1], ["GR0"])
+        with self.assertRaises(RuntimeError):
+            pool.submit(log_names, self.paths[0])
+
+    def test_cancel(self):
+        with wellcad.com.ApplicationPool(size=1) as pool:
+            running = pool.submit(sleep, None, 0.5)
+            queued = pool.submit(log_names, self.paths[0])
+            self.assertTrue(queued.cancel())
+            self.assertEqual(running.result(timeout=30), 0.5)
+            self.assertTrue(queued.cancelled())
+
+    def test_shutdown_cancel_futures(self):
+        pool = wellcad.com.ApplicationPool(size=1)
+        running = pool.submit(sleep, None, 0.5)
+        queued = [pool.submit(log_names, path) for path in self.paths]
+        pool.shutdown(cancel_futures=True)
+        self.assertTrue(all(future.cancelled() for future in queued))
+        with self.assertRaises(RuntimeError):
+            running.result(timeout=0)
+
+    def test_unpicklable_job(self):
+        with wellcad.com.ApplicationPool(size=1, max_documents_per_worker=1) as pool:
+            with self.assertRaises(ValueError):
+                pool.submit(sleep, None, Unpicklable()).result(timeout=30)
+            self.assertEqual(pool.submit(log_names, self.paths[2]).result(timeout=30)[1], ["GR2"])
+
+    def test_dead_worker(self):
+        with wellcad.com.ApplicationPool(size=1) as pool:
+            with self.assertRaises(concurrent.futures.process.BrokenProcessPool):
+                pool.submit(crash, None).result(timeout=30)
+            self.assertEqual(pool.submit(log_names, self.paths[1]).result(timeout=30)[1], ["GR1"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+import unittest
+import wellcad.com
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+@unittest.skipIf(numpy is None, "numpy is not installed")
+class TestBoreholeFrame(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        wellcad.com.set_backend("memory")
+        cls.app = wellcad.com.Application()
+        cls.server = cls.app._dispatch
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.app.quit(False)
+        wellcad.com.set_backend(None)
+
+    def setUp(self):
+        self.borehole = self.app.new_borehole()
+        gr_log = self.borehole.insert_new_log(1)
+        gr_log.name = "GR"
+        gr_log.data_table = (("Depth", "GR"), (1.0, 10.0), (2.0, 20.0), (3.0, -999.25), (4.0, 40.0))
+        den_log = self.borehole.insert_new_log(1)
+        den_log.name = "DEN"
+        den_log.data_table = (("Depth", "DEN"), (2.5, 2.0), (3.5, 3.0))
+        image_log = self.borehole.insert_new_log(5)
+        image_log.data_table = (("Depth", "0", "1"), (1.0, 1, 2))
+
+    def tearDown(self):
+        self.app.close_borehole(False)
+
+    def to_dict(self, frame):
+        if isinstance(frame, dict):
+            return frame
+        return {"Depth": frame.index.to_numpy(), **{name: frame[name].to_numpy() for name in frame.columns}}
+
+    def test_to_frame_union(self):
+        frame = self.to_dict(self.borehole.to_frame())
+        self.assertEqual(list(frame), ["Depth", "GR", "DEN"])
+        numpy.testing.assert_array_equal(frame["Depth"], [1.0, 2.0, 2.5, 3.0, 3.5, 4.0])
+        numpy.testing.assert_array_equal(frame["GR"], [10.0, 20.0, 20.0, numpy.nan, numpy.nan, 40.0])
+        numpy.testing.assert_array_equal(frame["DEN"], [numpy.nan, numpy.nan, 2.0, 2.0, 3.0, numpy.nan])
+
+    def test_to_frame_linear_step(self):
+        frame = self.to_dict(self.borehole.to_frame(["GR", 1], step=0.5, method="linear"))
+        numpy.testing.assert_array_equal(frame["Depth"], numpy.arange(1.0, 4.5, 0.5))
+        numpy.testing.assert_array_equal(frame["GR"][:3], [10.0, 15.0, 20.0])
+        numpy.testing.assert_array_equal(frame["DEN"][3:6], [2.0, 2.5, 3.0])
+
+    def test_to_frame_fetches_each_log_once(self):
+        self.server.reset_calls()
+        self.borehole.to_frame(threaded=True)
+        self.assertEqual(self.server.calls["DataTable"], 2)
+        self.assertEqual(self.server.calls["GetLog"], 3)
+
+    def test_to_frame_threaded(self):
+        frame = self.to_dict(self.borehole.to_frame(threaded=True))
+        expected = self.to_dict(self.borehole.to_frame())
+        for name in expected:
+            numpy.testing.assert_array_equal(frame[name], expected[name])
+
+    def test_to_frame_duplicate_names(self):
+        frame = self.to_dict(self.borehole.to_frame(["GR", "GR"]))
+        self.assertEqual(list(frame), ["Depth", "GR", "GR_1"])
+
+    def test_to_frame_errors(self):
+        with self.assertRaises(ValueError):
+            self.borehole.to_frame(["NOPE"])
+        with self.assertRaises(ValueError):
+            self.borehole.to_frame(method="cubic")
+        with self.assertRaises(ValueError):
+            self.borehole.to_frame([self.borehole.insert_new_log(13)])
+
+
+if __name__ == '__main__':
+    unittest.main()
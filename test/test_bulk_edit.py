@@ -0,0 +1,66 @@
+import unittest
+from unittest import mock
+import wellcad.com
+
+
+class TestBulkEdit(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        wellcad.com.set_backend("memory")
+        cls.app = wellcad.com.Application()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.app.quit(False)
+        wellcad.com.set_backend(None)
+
+    def setUp(self):
+        self.borehole = self.app.new_borehole()
+        self.server_borehole = self.borehole._dispatch
+
+    def tearDown(self):
+        self.app.close_borehole(False)
+
+    def test_bulk_edit(self):
+        with self.borehole.bulk_edit() as edit:
+            self.assertFalse(self.borehole.auto_update)
+            self.assertEqual(self.server_borehole.draft_mode, 2)
+            log = self.borehole.insert_new_log(1)
+            for i in range(10):
+                log.insert_data_at_depth(float(i), float(i))
+            self.assertEqual(self.server_borehole.refresh_count, 0)
+        self.assertTrue(self.borehole.auto_update)
+        self.assertEqual(self.server_borehole.draft_mode, 0)
+        self.assertEqual(self.server_borehole.refresh_count, 1)
+        self.assertEqual(edit.calls["Log.InsertDataAtDepth"], 10)
+        self.assertEqual(edit.com_calls, 1 + 1 + 10)
+        self.assertGreaterEqual(edit.elapsed, 0.0)
+        self.assertIn("12 COM calls", repr(edit))
+
+    def test_restores_on_exception(self):
+        self.borehole.auto_update = False
+        with self.assertRaises(ZeroDivisionError):
+            with self.borehole.bulk_edit(restore_mode=1):
+                1 / 0
+        self.assertFalse(self.borehole.auto_update)
+        self.assertEqual(self.server_borehole.draft_mode, 1)
+        self.assertEqual(self.server_borehole.refresh_count, 1)
+        self.assertEqual(wellcad.com._hooks.installed(), ())
+
+    def test_refreshes_after_restoring(self):
+        states = []
+        with mock.patch.object(type(self.server_borehole), "RefreshWindow", autospec=True,
+                               side_effect=lambda server: states.append((server.AutoUpdate, server.draft_mode))):
+            with self.borehole.bulk_edit():
+                self.borehole.insert_new_log(1)
+        self.assertEqual(states, [(True, 0)])
+
+    def test_without_draft(self):
+        with self.borehole.bulk_edit(draft=False):
+            pass
+        self.assertEqual(self.server_borehole.draft_mode, 0)
+        self.assertEqual(self.server_borehole.refresh_count, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+import unittest
+import wellcad.com
+
+
+class TestDepthIndex(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        wellcad.com.set_backend("memory")
+        cls.app = wellcad.com.Application()
+        cls.server = cls.app._dispatch
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.app.quit(False)
+        wellcad.com.set_backend(None)
+
+    def setUp(self):
+        self.borehole = self.app.new_borehole()
+        self.gr_log = self.borehole.insert_new_log(1)
+        self.gr_log.name = "GR"
+        self.gr_log.data_table = (("Depth", "GR"),) + tuple((10.0 + i * 0.5, float(i)) for i in range(11))
+        self.mud_log = self.borehole.insert_new_log(3)
+        self.mud_log.name = "ROP"
+        self.mud_log.data_table = (("Depth", "ROP"), (1.0, 5.0), (2.5, 6.0), (4.0, 7.0))
+
+    def tearDown(self):
+        self.app.close_borehole(False)
+
+    def test_matches_server(self):
+        for log in (self.gr_log, self.mud_log):
+            index = log.depth_index()
+            self.assertEqual(len(index), log.nb_of_data)
+            for i in range(len(index)):
+                self.assertEqual(index.depth(i), log.data_depth(i))
+                self.assertEqual(index.index(log.data_depth(i) + 0.1), i)
+
+    def test_queries_without_com_calls(self):
+        index = self.gr_log.depth_index()
+        self.server.reset_calls()
+        self.assertIs(self.gr_log.depth_index(), index)
+        self.assertEqual(index.index(10.0), 10)
+        self.assertEqual(index.index(9.0), 10)
+        self.assertIsNone(index.index(9.0, tolerance=0.5))
+        self.assertEqual(index.slice(11.0, 12.0), slice(6, 9))
+        self.assertEqual(self.mud_log.depth_index().slice(2.0, 10.0), slice(1, 3))
+        self.assertEqual(index.slice(20.0, 30.0), slice(0, 0))
+        self.assertEqual(self.server.call_count, 2)
+        with self.assertRaises(IndexError):
+            index.depth(11)
+
+    def test_invalidated_by_log_edits(self):
+        index = self.mud_log.depth_index()
+        self.mud_log.insert_data_at_depth(3.0, 1.0)
+        self.assertIsNot(self.mud_log.depth_index(), index)
+        self.assertEqual(self.mud_log.depth_index().depths, [1.0, 2.5, 3.0, 4.0])
+        self.mud_log.remove_data(0)
+        self.assertEqual(self.mud_log.depth_index().depths, [2.5, 3.0, 4.0])
+
+    def test_invalidated_by_borehole_processing(self):
+        index = self.gr_log.depth_index()
+        self.borehole.depth_shift_log("GR", 1.0)
+        self.assertFalse(index.is_valid)
+        self.assertEqual(self.gr_log.depth_index().depth(10), 11.0)
+        self.borehole.extend_log("GR", 5.0, 20.0)
+        self.assertEqual(self.gr_log.depth_index().depths[0], 5.0)
+
+    def test_invalidated_by_clear_log_contents(self):
+        index = self.mud_log.depth_index()
+        self.borehole.clear_log_contents("ROP")
+        self.assertFalse(index.is_valid)
+        self.assertEqual(len(self.mud_log.depth_index()), 0)
+
+    def test_shared_by_wrappers_of_the_same_log(self):
+        index = self.gr_log.depth_index()
+        self.borehole.get_log("GR").insert_data_at_depth(20.0, 1.0)
+        self.assertIsNot(self.gr_log.depth_index(), index)
+
+    def test_explicit_invalidation(self):
+        index = self.gr_log.depth_index()
+        self.gr_log._dispatch.InsertDataAtDepth(20.0, 1.0)
+        self.assertIs(self.gr_log.depth_index(), index)
+        self.gr_log.invalidate_depth_index()
+        self.assertEqual(len(self.gr_log.depth_index()), self.gr_log.nb_of_data)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,117 @@
+import unittest
+import wellcad.com
+from wellcad.com._dispatch_wrapper import DispatchWrapper
+
+try:
+    import pywintypes
+    from win32com.client import build, dynamic
+    from wellcad.com._pywin32_backend import Pywin32Backend, DISP_E_UNKNOWNNAME
+except ImportError:
+    pywintypes = None
+
+
+class Thing(DispatchWrapper):
+    _DISPATCH_METHODS = ("GetLog", "InsertNewLog", "NotInThisVersion")
+    _DISPATCH_ATTRIBUTES = ("AutoUpdate",)
+
+
+class TestDispatchWrapper(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        wellcad.com.set_backend("memory")
+        cls.app = wellcad.com.Application()
+        cls.server = cls.app._dispatch
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.app.quit(False)
+        wellcad.com.set_backend(None)
+
+    def setUp(self):
+        DispatchWrapper.dispatch_cache_clear()
+        self.server.reset_calls()
+
+    def test_not_a_dispatch(self):
+        self.assertIsNone(Thing(None))
+        self.assertIsNone(Thing("Borehole"))
+
+    def test_names_resolved_once(self):
+        for _ in range(3):
+            Thing(self.server.NewBorehole())
+        self.assertEqual(self.server.name_lookups, 4)
+
+    def test_cache_info(self):
+        for _ in range(3):
+            Thing(self.server.NewBorehole())
+        self.assertEqual(Thing.dispatch_cache_info(), (2, 1, 1))
+        self.assertEqual(DispatchWrapper.dispatch_cache_info(), (2, 1, 1))
+        self.assertEqual(wellcad.com.Log.dispatch_cache_info(), (0, 0, 0))
+
+    def test_cache_clear(self):
+        Thing(self.server.NewBorehole())
+        DispatchWrapper.dispatch_cache_clear()
+        self.assertEqual(DispatchWrapper.dispatch_cache_info(), (0, 0, 0))
+
+    def test_same_object_same_wrapper(self):
+        dispatch = self.server.NewBorehole()
+        thing = Thing(dispatch)
+        self.server.reset_calls()
+        self.assertIs(Thing(dispatch), thing)
+        self.assertEqual(self.server.name_lookups, 0)
+        self.assertEqual(Thing.dispatch_cache_info().hits, 0)
+        self.assertIsNot(Thing(self.server.NewBorehole()), thing)
+        # Another wrapper class has its own wrapper object.
+        self.assertIsInstance(wellcad.com.Borehole(dispatch), wellcad.com.Borehole)
+
+    def test_identity_cache_is_weak(self):
+        dispatch = self.server.NewBorehole()
+        borehole = wellcad.com.Borehole(dispatch)
+        key = (wellcad.com.Borehole, wellcad.com.get_backend(), dispatch)
+        self.assertIs(DispatchWrapper._identity_cache[key], borehole)
+        del borehole
+        self.assertNotIn(key, DispatchWrapper._identity_cache)
+
+    def test_slots(self):
+        log = wellcad.com.Application().new_borehole().insert_new_log(1)
+        self.assertFalse(hasattr(log, "__dict__"))
+        with self.assertRaises(AttributeError):
+            log.colour = 1
+
+
+class FakeOleObject:
+    """An in-process stand-in for a PyIDispatch that counts name lookups."""
+    DISPIDS = {"GetThing": 1, "SetThing": 2, "Colour": 3}
+
+    def __init__(self):
+        self.lookups = 0
+
+    def GetIDsOfNames(self, lcid, name):
+        self.lookups += 1
+        try:
+            return self.DISPIDS[name]
+        except KeyError:
+            raise pywintypes.com_error(DISP_E_UNKNOWNNAME, "Unknown name.", None, None)
+
+
+@unittest.skipIf(pywintypes is None, "pywin32 is not installed")
+class TestPywin32Names(unittest.TestCase):
+    def setUp(self):
+        self.backend = Pywin32Backend()
+        self.ole = FakeOleObject()
+        self.dispatch = dynamic.CDispatch(self.ole, build.DispatchItem(), "Fake")
+
+    def test_resolve_names(self):
+        entries = self.backend.resolve_names(self.dispatch, ("GetThing", "NotInThisVersion"))
+        self.assertEqual(list(entries), ["GetThing"])
+        self.assertEqual(entries["GetThing"].dispid, 1)
+
+    def test_register_names(self):
+        methods = self.backend.resolve_names(self.dispatch, ("GetThing", "SetThing"))
+        attributes = self.backend.resolve_names(self.dispatch, ("Colour",))
+        self.backend.register_names(self.dispatch, methods, attributes)
+        self.assertEqual(set(self.dispatch._olerepr_.mapFuncs), {"GetThing", "SetThing"})
+        self.assertEqual(self.dispatch._olerepr_.propMap["Colour"].dispid, 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,42 @@
+import subprocess
+import sys
+import unittest
+
+
+def import_times(statement):
+    """Runs a statement in a fresh interpreter under ``python -X importtime``.
+
+    Returns a dict mapping each imported module to its cumulative import
+    time in microseconds.
+    """
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", statement],
+                            capture_output=True, text=True, check=True)
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+class TestImportTime(unittest.TestCase):
+    def test_wrapper_modules_not_imported(self):
+        times = import_times("import wellcad.com")
+        loaded = {name for name in times if name.startswith("wellcad.com.")}
+        self.assertEqual(loaded, {"wellcad.com._backend"})
+
+    def test_log_not_imported_by_application(self):
+        times = import_times("import wellcad.com; wellcad.com.set_backend('memory'); "
+                             "wellcad.com.Application().new_borehole()")
+        self.assertIn("wellcad.com._borehole", times)
+        self.assertNotIn("wellcad.com._log", times)
+
+    def test_lazy_attributes(self):
+        times = import_times("from wellcad.com import Log, Structure")
+        self.assertIn("wellcad.com._log", times)
+        self.assertNotIn("wellcad.com._application", times)
+
+
+if __name__ == '__main__':
+    unittest.main()
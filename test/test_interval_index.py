@@ -0,0 +1,118 @@
+import random
+import unittest
+import wellcad.com
+from wellcad.com import _depth_index
+
+
+class TestIntervalIndex(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        wellcad.com.set_backend("memory")
+        cls.app = wellcad.com.Application()
+        cls.server = cls.app._dispatch
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.app.quit(False)
+        wellcad.com.set_backend(None)
+
+    def setUp(self):
+        self.borehole = self.app.new_borehole()
+        self.litho_log = self.borehole.insert_new_log(7)
+        self.litho_log.data_table = (("Top Depth", "Bottom Depth", "Litho Code", "Value"),) + tuple(
+            (float(i), i + 1.0, "SST" if i % 2 else "SHL", 0.5) for i in range(20))
+
+    def tearDown(self):
+        self.app.close_borehole(False)
+
+    def test_matches_brute_force(self):
+        rng = random.Random(0)
+        intervals = [(top, top + rng.uniform(0.0, 20.0)) for top in (rng.uniform(0.0, 100.0) for _ in range(300))]
+        index = wellcad.com.IntervalIndex([i[0] for i in intervals], [i[1] for i in intervals])
+        by_top = sorted(range(len(intervals)), key=lambda i: intervals[i][0])
+        self.assertEqual(len(index), 300)
+        self.assertEqual(index.interval(7), intervals[7])
+        for _ in range(200):
+            top = rng.uniform(-10.0, 130.0)
+            bottom = top + rng.uniform(0.0, 15.0)
+            self.assertEqual(index.at_depth(top), [i for i in by_top if intervals[i][0] <= top <= intervals[i][1]])
+            self.assertEqual(index.overlapping(top, bottom),
+                             [i for i in by_top if intervals[i][0] <= bottom and intervals[i][1] >= top])
+            self.assertEqual(index.within(top, bottom),
+                             [i for i in by_top if intervals[i][0] >= top and intervals[i][1] <= bottom])
+            self.assertEqual(index.enclosing(top, bottom),
+                             [i for i in by_top if intervals[i][0] <= top and intervals[i][1] >= bottom])
+        empty = wellcad.com.IntervalIndex([], [])
+        self.assertEqual(empty.at_depth(1.0), [])
+        self.assertEqual(repr(empty), "IntervalIndex([])")
+        with self.assertRaises(IndexError):
+            index.interval(300)
+
+    def test_matches_server(self):
+        index = self.litho_log.interval_index()
+        self.assertEqual(len(index), self.litho_log.nb_of_data)
+        for depth in (0.5, 7.25, 19.9):
+            (i,) = index.at_depth(depth)
+            self.assertEqual(self.litho_log.get_litho_bed(i).top_depth,
+                             self.litho_log.get_litho_bed_at_depth(depth).top_depth)
+        self.assertEqual(index.at_depth(3.0), [2, 3])
+        self.assertEqual(index.within(2.0, 5.5), [2, 3, 4])
+        self.assertEqual(index.enclosing(4.2, 4.8), [4])
+
+    def test_queries_without_com_calls(self):
+        index = self.litho_log.interval_index()
+        self.server.reset_calls()
+        self.assertIs(self.litho_log.interval_index(), index)
+        for depth in range(100):
+            index.at_depth(depth * 0.2)
+            index.overlapping(depth * 0.2, depth * 0.2 + 3.0)
+        self.assertEqual(sum(self.server.calls.values()), 0)
+
+    def test_rebuilt_after_changes(self):
+        index = self.litho_log.interval_index()
+        self.litho_log.insert_new_litho_bed(20.0, 25.0, "LST", 0.5, 0.5)
+        index = self.litho_log.interval_index()
+        self.assertEqual(index.at_depth(22.0), [20])
+        self.litho_log.remove_litho_bed(20)
+        self.assertEqual(self.litho_log.interval_index().at_depth(22.0), [])
+        self.litho_log.data_table = (("Top Depth", "Bottom Depth", "Litho Code", "Value"), (0.0, 50.0, "SST", 0.5))
+        self.assertEqual(self.litho_log.interval_index().at_depth(22.0), [0])
+        index = self.litho_log.interval_index()
+        _depth_index.invalidate_all()
+        self.assertFalse(index.is_valid)
+        self.assertIsNot(self.litho_log.interval_index(), index)
+        index = self.litho_log.interval_index()
+        self.litho_log.invalidate_interval_index()
+        self.assertIsNot(self.litho_log.interval_index(), index)
+
+    def test_rebuilt_after_litho_bed_and_borehole_changes(self):
+        index = self.litho_log.interval_index()
+        self.litho_log.set_litho_bed(0, self.litho_log.get_litho_bed(1))
+        self.assertIsNot(self.litho_log.interval_index(), index)
+        index = self.litho_log.interval_index()
+        self.litho_log.set_litho_bed_at_depth(0.5, self.litho_log.get_litho_bed(2))
+        self.assertIsNot(self.litho_log.interval_index(), index)
+        index = self.litho_log.interval_index()
+        self.borehole.clear_log_contents(self.litho_log.name)
+        self.assertFalse(index.is_valid)
+        self.assertEqual(len(self.litho_log.interval_index()), 0)
+
+    def test_other_logs(self):
+        comments = self.borehole.insert_new_log(8)
+        comments.insert_new_comment_box(5.0, 30.0, "Long")
+        comments.insert_new_comment_box(10.0, 12.0, "Short")
+        self.assertEqual(comments.interval_index().at_depth(11.0), [0, 1])
+        engineering = self.borehole.insert_new_log(9)
+        engineering.insert_new_drill_item(10.0, 0.3)
+        engineering.insert_new_drill_item(25.0, 0.2)
+        index = engineering.interval_index()
+        self.assertEqual(index.interval(1), (10.0, 25.0))
+        self.assertEqual(index.at_depth(20.0), [1])
+        engineering.remove_drill_item(0)
+        self.assertEqual(len(engineering.interval_index()), 1)
+        with self.assertRaises(ValueError):
+            self.borehole.insert_new_log(6).interval_index()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+import unittest
+import wellcad.com
+
+
+class TestItemSequence(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        wellcad.com.set_backend("memory")
+        cls.app = wellcad.com.Application()
+        cls.server = cls.app._dispatch
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.app.quit(False)
+        wellcad.com.set_backend(None)
+
+    def setUp(self):
+        self.borehole = self.app.new_borehole()
+        self.log = self.borehole.insert_new_log(6)
+        self.log.data_table = (("Depth", "Azimuth", "Dip", "Aperture"),) + tuple(
+            (float(i), float(i), 45.0, 0.0) for i in range(150))
+
+    def tearDown(self):
+        self.app.close_borehole(False)
+
+    def test_iteration(self):
+        with wellcad.com.ComTracer(stacks=False) as tracer:
+            structures = self.log.structures
+            self.assertEqual(len(structures), 150)
+            depths = [s.depth for s in structures]
+        self.assertEqual(depths, [float(i) for i in range(150)])
+        self.assertEqual(tracer.stats()["Log.NbOfData"].count, 1)
+        self.assertEqual(tracer.stats()["Log.Structure"].count, 150)
+        self.assertEqual([s.depth for s in reversed(structures)], depths[::-1])
+
+    def test_indexing(self):
+        structures = self.log.structures
+        self.assertEqual(structures[0].depth, 0.0)
+        self.assertEqual(structures[-1].depth, 149.0)
+        self.assertIsInstance(structures[5], wellcad.com.Structure)
+        with self.assertRaises(IndexError):
+            structures[150]
+        with self.assertRaises(IndexError):
+            structures[-151]
+        with wellcad.com.ComTracer(stacks=False) as tracer:
+            structures[70]
+            structures[71]
+        self.assertEqual(tracer.stats()["Log.Structure"].count, 64)
+
+    def test_slicing(self):
+        structures = self.log.structures
+        self.assertEqual([s.depth for s in structures[10:13]], [10.0, 11.0, 12.0])
+        self.assertEqual([s.depth for s in structures[-2:]], [148.0, 149.0])
+        self.assertEqual([s.depth for s in structures[5:0:-2]], [5.0, 3.0, 1.0])
+        self.assertEqual([s.depth for s in structures[12:9:-1]], [12.0, 11.0, 10.0])
+        self.assertEqual(structures[200:], [])
+        self.assertEqual(structures.index(structures[42]), 42)
+
+    def test_other_collections(self):
+        litho = self.borehole.insert_new_log(7)
+        litho.insert_new_litho_bed(1.0, 2.0, "SST", 0.5, 0.5)
+        litho.insert_new_litho_bed(2.0, 3.0, "SHL", 0.5, 0.5)
+        self.assertEqual([bed.litho_code for bed in litho.litho_beds], ["SST", "SHL"])
+        engineering = self.borehole.insert_new_log(9)
+        engineering.insert_new_drill_item(10.0, 0.2)
+        self.assertEqual(len(engineering.drill_items), 1)
+        self.assertEqual(len(engineering.eqp_items), 0)
+        self.assertEqual(list(self.borehole.insert_new_log(24).markers), [])
+
+    def test_threaded(self):
+        app = wellcad.com.Application(threaded=True)
+        log = app.get_active_borehole().get_log(self.log.name)
+        self.assertEqual([s.depth for s in log.structures[:3]], [0.0, 1.0, 2.0])
+        self.assertEqual(len(list(log.structures)), 150)
+
+
+if __name__ == '__main__':
+    unittest.main()
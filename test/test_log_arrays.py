@@ -0,0 +1,315 @@
+import unittest
+import wellcad.com
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+@unittest.skipIf(numpy is None, "numpy is not installed")
+class TestLogArrays(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        wellcad.com.set_backend("memory")
+        cls.app = wellcad.com.Application()
+        cls.server = cls.app._dispatch
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.app.quit(False)
+        wellcad.com.set_backend(None)
+
+    def setUp(self):
+        self.borehole = self.app.new_borehole()
+        self.gr_log = self.borehole.insert_new_log(1)
+        self.gr_log.name = "GR"
+        self.gr_log.data_table = (("Depth", "GR"), (10.0, 50.0), (10.5, -999.25), (11.0, 70.0))
+
+    def tearDown(self):
+        self.app.close_borehole(False)
+
+    def test_to_numpy(self):
+        depths, values = self.gr_log.to_numpy()
+        self.assertEqual(depths.dtype, numpy.float64)
+        self.assertTrue(depths.flags.c_contiguous)
+        self.assertTrue(values.flags.c_contiguous)
+        numpy.testing.assert_array_equal(depths, [10.0, 10.5, 11.0])
+        numpy.testing.assert_array_equal(values, [50.0, numpy.nan, 70.0])
+
+    def test_to_numpy_masked(self):
+        _, values = self.gr_log.to_numpy(masked=True)
+        numpy.testing.assert_array_equal(values.mask, [False, True, False])
+        self.assertEqual(values.mean(), 60.0)
+
+    def test_to_numpy_single_call(self):
+        self.server.reset_calls()
+        self.gr_log.to_numpy()
+        self.assertEqual(self.server.calls["DataTable"], 1)
+        self.assertEqual(self.server.call_count, 2)
+
+    def test_to_numpy_interval_log(self):
+        log = self.borehole.insert_new_log(13)
+        log.insert_new_interval_item(1.0, 2.0, 5.0)
+        log.insert_new_interval_item(2.0, 4.0, 7.0)
+        depths, values = log.to_numpy()
+        numpy.testing.assert_array_equal(depths, [[1.0, 2.0], [2.0, 4.0]])
+        numpy.testing.assert_array_equal(values, [5.0, 7.0])
+
+    def test_to_numpy_empty_cells(self):
+        mud_log = self.borehole.insert_new_log(3)
+        mud_log.data_table = (("Depth", "ROP"), (1.0, None), (2.0, 3.0))
+        _, values = mud_log.to_numpy()
+        numpy.testing.assert_array_equal(values, [numpy.nan, 3.0])
+
+    def test_to_numpy_large_log(self):
+        n = 500000
+        self.gr_log.data_table = (("Depth", "GR"),) + tuple((i * 0.1, float(i % 200)) for i in range(n))
+        self.server.reset_calls()
+        depths, values = self.gr_log.to_numpy()
+        self.assertEqual(self.server.calls["DataTable"], 1)
+        self.assertEqual(len(values), n)
+
+    def test_from_numpy(self):
+        depths = numpy.arange(0.0, 10.0, 0.5)
+        values = numpy.sin(depths)
+        values[3] = numpy.nan
+        log = self.borehole.insert_new_log(1)
+        log.name = "SIN"
+        self.server.reset_calls()
+        log.from_numpy(depths, values, null_value=-1.0)
+        self.assertEqual(self.server.calls["DataTable"], 1)
+        table = log.data_table
+        self.assertEqual(log.null_value, -1.0)
+        self.assertEqual(table[0], ("Depth", "SIN"))
+        self.assertEqual(len(table), 21)
+        self.assertEqual(table[4], (1.5, -1.0))
+        self.assertEqual(table[5], (2.0, values[4]))
+
+    def test_from_numpy_round_trip(self):
+        depths = numpy.linspace(100.0, 200.0, 1001)
+        values = numpy.ma.MaskedArray(numpy.cos(depths), mask=depths > 150.0)
+        log = self.borehole.insert_new_log(1)
+        log.from_numpy(depths, values)
+        read_depths, read_values = log.to_numpy(masked=True)
+        numpy.testing.assert_array_equal(read_depths, depths)
+        numpy.testing.assert_array_equal(read_values.mask, values.mask)
+        numpy.testing.assert_array_equal(read_values.compressed(), values.compressed())
+
+    def test_from_numpy_interval_log(self):
+        log = self.borehole.insert_new_log(13)
+        log.from_numpy([[1.0, 2.0], [2.0, 4.0]], [5.0, 7.0])
+        depths, values = log.to_numpy()
+        numpy.testing.assert_array_equal(depths, [[1.0, 2.0], [2.0, 4.0]])
+        numpy.testing.assert_array_equal(values, [5.0, 7.0])
+        with self.assertRaises(ValueError):
+            log.from_numpy([[1.0, 2.0], [3.0, 2.5]], [5.0, 7.0])
+
+    def test_from_numpy_validation(self):
+        table = self.gr_log.data_table
+        self.server.reset_calls()
+        with self.assertRaisesRegex(ValueError, "strictly increasing"):
+            self.gr_log.from_numpy([1.0, 3.0, 2.0], [1.0, 2.0, 3.0])
+        with self.assertRaises(ValueError):
+            self.gr_log.from_numpy([1.0, numpy.nan], [1.0, 2.0])
+        with self.assertRaises(ValueError):
+            self.gr_log.from_numpy([1.0, 2.0], [1.0, 2.0, 3.0])
+        self.assertEqual(self.server.calls["DataTable"], 0)
+        self.assertEqual(self.gr_log.data_table, table)
+
+    def test_from_numpy_replaces_data(self):
+        self.gr_log.from_numpy([10.5, 12.0], [55.0, 80.0])
+        self.assertEqual(self.gr_log.data_table[1:], ((10.5, 55.0), (12.0, 80.0)))
+
+    def test_from_numpy_rejected_leaves_null_value(self):
+        null_value = self.gr_log.null_value
+        with self.assertRaises(ValueError):
+            self.gr_log.from_numpy([1.0, 0.0], [1.0, 2.0], null_value=-1.0)
+        self.assertEqual(self.gr_log.null_value, null_value)
+        self.gr_log.from_numpy([1.0, 2.0], [numpy.nan, 2.0], null_value=-1.0)
+        self.assertEqual(self.gr_log.null_value, -1.0)
+        self.assertEqual(self.gr_log.data_table[1:], ((1.0, -1.0), (2.0, 2.0)))
+
+    def test_trace_array(self):
+        image_log = self.borehole.insert_new_log(5)
+        image_log.trace_offset = 0.0
+        image_log.trace_sample_rate = 90.0
+        image_log.data_table = (("Depth", "0", "90", "180", "270"),
+                                (1.0, 1, 2, 3, 4), (1.5, 5, -999.25, 7, 8), (2.0, 9, 10, 11, 12))
+        self.server.reset_calls()
+        depths, positions, values = image_log.trace_array()
+        self.assertEqual(self.server.calls["DataTable"], 1)
+        numpy.testing.assert_array_equal(depths, [1.0, 1.5, 2.0])
+        numpy.testing.assert_array_equal(positions, [0.0, 90.0, 180.0, 270.0])
+        self.assertEqual(values.shape, (3, 4))
+        self.assertTrue(values.flags.c_contiguous)
+        self.assertTrue(numpy.isnan(values[1, 1]))
+        numpy.testing.assert_array_equal(values[2], [9, 10, 11, 12])
+
+    def test_trace_array_index_order(self):
+        for log_type in (4, 5, 10, 14, 15):
+            log = self.borehole.insert_new_log(log_type)
+            log.data_table = (("Depth", "0", "1"), (1.0, 1, 2), (2.0, 3, 4), (3.0, 5, 6))
+            _, _, values = log.trace_array(index_order=True)
+            for depth_index in range(3):
+                for trace_index in range(2):
+                    self.assertEqual(values[depth_index, trace_index],
+                                     log.get_trace_data(depth_index, trace_index), log_type)
+
+    def test_set_trace_array(self):
+        image_log = self.borehole.insert_new_log(5)
+        depths = numpy.arange(100.0, 110.0, 0.01)
+        image = numpy.random.default_rng(0).random((len(depths), 360))
+        image[5, 7] = numpy.nan
+        self.server.reset_calls()
+        image_log.set_trace_array(depths, image, null_value=-1.0, trace_offset=0.0, trace_sample_rate=1.0)
+        self.assertEqual(self.server.calls["DataTable"], 1)
+        self.assertEqual(image_log.trace_length, 360)
+        self.assertEqual(image_log.get_trace_data_at_depth(depths[5], 7.0), -1.0)
+        read_depths, positions, values = image_log.trace_array()
+        numpy.testing.assert_array_equal(read_depths, depths)
+        numpy.testing.assert_array_equal(positions, numpy.arange(360.0))
+        numpy.testing.assert_array_equal(values, image)
+
+    def test_set_trace_array_index_order(self):
+        fws_log = self.borehole.insert_new_log(4)
+        values = numpy.array([[5.0, 6.0], [3.0, 4.0], [1.0, 2.0]])
+        fws_log.set_trace_array([3.0, 2.0, 1.0], values, index_order=True)
+        self.assertEqual(fws_log.data_table[1:], ((1.0, 1.0, 2.0), (2.0, 3.0, 4.0), (3.0, 5.0, 6.0)))
+        self.assertEqual(fws_log.get_trace_data(0, 0), 5.0)
+        with self.assertRaises(ValueError):
+            fws_log.set_trace_array([1.0, 2.0, 3.0], values, index_order=True)
+        with self.assertRaises(ValueError):
+            fws_log.set_trace_array([1.0, 2.0], values)
+        null_value = fws_log.null_value
+        with self.assertRaises(ValueError):
+            fws_log.set_trace_array([1.0, 3.0, 2.0], values, null_value=-1.0)
+        self.assertEqual(fws_log.null_value, null_value)
+
+    def test_iter_windows(self):
+        depths = numpy.arange(0.0, 100.0, 0.5)
+        log = self.borehole.insert_new_log(1)
+        log.from_numpy(depths, depths * 10.0)
+        windows = list(log.iter_windows(10.0))
+        self.assertEqual(len(windows), 10)
+        for i, (window_depths, values) in enumerate(windows):
+            numpy.testing.assert_array_equal(window_depths, depths[i * 20:(i + 1) * 20])
+            numpy.testing.assert_array_equal(values, window_depths * 10.0)
+
+    def test_iter_windows_overlap(self):
+        image_log = self.borehole.insert_new_log(5)
+        depths = numpy.arange(0.0, 30.0)
+        image_log.set_trace_array(depths, numpy.outer(depths, numpy.ones(4)))
+        windows = list(image_log.iter_windows(10.0, overlap=2.0))
+        numpy.testing.assert_array_equal([w[0][0] for w in windows], [0.0, 8.0, 18.0])
+        numpy.testing.assert_array_equal(windows[1][0], numpy.arange(8.0, 20.0))
+        self.assertEqual(windows[1][1].shape, (12, 4))
+        numpy.testing.assert_array_equal(windows[1][1][:, 0], numpy.arange(8.0, 20.0))
+
+    def test_iter_windows_gaps_and_nulls(self):
+        self.gr_log.from_numpy([10.0, 10.5, 11.0, 11.5, 45.0], [50.0, numpy.nan, 70.0, 1.0, 2.0])
+        windows = list(self.gr_log.iter_windows(5.0, masked=True))
+        numpy.testing.assert_array_equal([w[0][0] for w in windows], [10.0, 45.0])
+        numpy.testing.assert_array_equal(windows[0][1].mask, [False, True, False, False])
+        with self.assertRaises(ValueError):
+            next(self.gr_log.iter_windows(0.0))
+
+    def test_structures_to_array(self):
+        log = self.borehole.insert_new_log(6)
+        log.insert_new_attribute("Type")
+        log.insert_new_attribute("Confidence")
+        log.data_table = (("Depth", "Azimuth", "Dip", "Aperture", "Type", "Confidence"),
+                          (12.0, 90.0, 30.0, 0.01, "Fracture", "0.9"),
+                          (11.0, 180.0, 60.0, 0.0, "Bedding", ""))
+        self.server.reset_calls()
+        picks = log.structures_to_array()
+        self.assertEqual(self.server.calls["DataTable"], 1)
+        self.assertEqual(picks.dtype.names, ("depth", "azimuth", "dip", "aperture", "type", "confidence"))
+        numpy.testing.assert_array_equal(picks["depth"], [11.0, 12.0])
+        numpy.testing.assert_array_equal(picks["dip"], [60.0, 30.0])
+        numpy.testing.assert_array_equal(picks["type"], ["Bedding", "Fracture"])
+        numpy.testing.assert_array_equal(picks["confidence"], [numpy.nan, 0.9])
+
+    def test_breakouts_and_lineations_to_array(self):
+        breakouts = self.borehole.insert_new_log(25)
+        breakouts.insert_new_breakout_ex(5.0, 45.0, 2.0, 0.5, 30.0)
+        self.assertEqual(breakouts.structures_to_array().dtype.names,
+                         ("depth", "azimuth", "tilt", "length", "opening"))
+        self.assertEqual(breakouts.structures_to_array()["opening"][0], 30.0)
+        lineations = self.borehole.insert_new_log(27)
+        lineations.insert_new_lineation_ex(5.0, 120.0, 15.0, 0.0)
+        picks = lineations.structures_to_array()
+        self.assertEqual(picks.dtype.names, ("depth", "trend", "plunge", "eccentricity"))
+        self.assertEqual(picks["trend"][0], 120.0)
+        self.assertEqual(len(self.borehole.insert_new_log(6).structures_to_array()), 0)
+        with self.assertRaises(ValueError):
+            self.gr_log.structures_to_array()
+
+    def test_structures_to_array_large_log(self):
+        log = self.borehole.insert_new_log(6)
+        log.data_table = (("Depth", "Azimuth", "Dip", "Aperture"),) + tuple(
+            (i * 0.01, i % 360, i % 90, 0.0) for i in range(50000))
+        self.server.reset_calls()
+        picks = log.structures_to_array()
+        self.assertEqual(self.server.calls["DataTable"], 1)
+        self.assertEqual(self.server.call_count, 2)
+        self.assertEqual(len(picks), 50000)
+
+    def test_insert_structures(self):
+        log = self.borehole.insert_new_log(6)
+        log.insert_new_structure_ex(10.0, 90.0, 30.0, 0.0)
+        self.server.reset_calls()
+        duplicates = log.insert_structures([(12.0, 45.0, 20.0, 0.01), (11.0, 180.0, 60.0, 0.0),
+                                            (10.005, 0.0, 10.0, 0.0), (11.0, 10.0, 5.0, 0.0)], tolerance=0.01)
+        self.assertEqual(self.server.calls["DataTable"], 2)
+        numpy.testing.assert_array_equal(duplicates, [2, 3])
+        picks = log.structures_to_array()
+        numpy.testing.assert_array_equal(picks["depth"], [10.0, 10.005, 11.0, 11.0, 12.0])
+        numpy.testing.assert_array_equal(picks["dip"], [30.0, 10.0, 60.0, 5.0, 20.0])
+        duplicates = log.insert_structures([(10.0, 1.0, 1.0, 0.0), (20.0, 1.0, 1.0, 0.0)], on_duplicate="skip")
+        numpy.testing.assert_array_equal(duplicates, [0])
+        numpy.testing.assert_array_equal(log.structures_to_array()["depth"], [10.0, 10.005, 11.0, 11.0, 12.0, 20.0])
+        with self.assertRaises(ValueError):
+            log.insert_structures([(20.0, 1.0, 1.0, 0.0)], on_duplicate="raise")
+        self.assertEqual(log.nb_of_data, 6)
+
+    def test_insert_structures_attributes(self):
+        log = self.borehole.insert_new_log(6)
+        log.insert_new_attribute("Type")
+        log.insert_new_structure_ex(10.0, 90.0, 30.0, 0.0)
+        picks = numpy.array([(11.0, 45.0, 20.0, 0.0, "Fracture", 0.9)],
+                            [("depth", float), ("azimuth", float), ("dip", float), ("aperture", float),
+                             ("type", "U10"), ("confidence", float)])
+        with wellcad.com.ComTracer(stacks=False) as tracer:
+            log.insert_structures(picks, borehole=self.borehole)
+        self.assertEqual(tracer.stats()["Borehole.AutoUpdate="].count, 2)
+        picks = log.structures_to_array()
+        self.assertEqual(picks.dtype.names, ("depth", "azimuth", "dip", "aperture", "type", "confidence"))
+        numpy.testing.assert_array_equal(picks["type"], ["", "Fracture"])
+        numpy.testing.assert_array_equal(picks["confidence"], [numpy.nan, 0.9])
+
+    def test_insert_breakouts_and_lineations(self):
+        breakouts = self.borehole.insert_new_log(25)
+        breakouts.insert_breakouts(numpy.array([[5.0, 45.0, 2.0, 0.5, 30.0]]))
+        self.assertEqual(breakouts.structures_to_array()["opening"][0], 30.0)
+        lineations = self.borehole.insert_new_log(27)
+        lineations.insert_lineations(numpy.array([[6.0, 120.0, 15.0, -0.5], [5.0, 10.0, 5.0, 0.0]]))
+        numpy.testing.assert_array_equal(lineations.structures_to_array()["trend"], [10.0, 120.0])
+
+    def test_insert_picks_validation(self):
+        log = self.borehole.insert_new_log(6)
+        for picks in ([(1.0, 400.0, 10.0, 0.0)], [(1.0, 10.0, 95.0, 0.0)], [(1.0, 10.0, 10.0, -1.0)],
+                      [(numpy.nan, 10.0, 10.0, 0.0)], [(1.0, 10.0, 10.0)]):
+            with self.assertRaises(ValueError):
+                log.insert_structures(picks)
+        with self.assertRaises(ValueError):
+            log.insert_structures([(1.0, 10.0, 10.0, 0.0)], on_duplicate="ignore")
+        with self.assertRaises(ValueError):
+            self.borehole.insert_new_log(27).insert_lineations([(1.0, 10.0, 10.0, 2.0)])
+        with self.assertRaises(ValueError):
+            self.gr_log.insert_structures([(1.0, 10.0, 10.0, 0.0)])
+        self.assertEqual(log.nb_of_data, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,96 @@
+import unittest
+import wellcad.com
+
+
+class TestLogSnapshot(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        wellcad.com.set_backend("memory")
+        cls.app = wellcad.com.Application()
+        cls.server = cls.app._dispatch
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.app.quit(False)
+        wellcad.com.set_backend(None)
+
+    def setUp(self):
+        self.borehole = self.app.new_borehole()
+        self.source = self.borehole.insert_new_log(1)
+        self.source.pen_color = 255
+        self.source.pen_width = 3
+        self.source.scale_low = 1.0
+        self.source.scale_high = 1000.0
+        self.source.scale_mode = 1
+        self.target = self.borehole.insert_new_log(1)
+
+    def tearDown(self):
+        self.app.close_borehole(False)
+
+    def test_snapshot(self):
+        snapshot = self.source.snapshot()
+        self.assertIsInstance(snapshot, wellcad.com.LogSnapshot)
+        self.assertEqual(snapshot.pen_color, 255)
+        self.assertEqual(snapshot.scale_high, 1000.0)
+        self.assertEqual(snapshot, self.source.snapshot())
+        with self.assertRaises(AttributeError):
+            snapshot.pen_color = 0
+
+    def test_snapshot_fields(self):
+        snapshot = self.source.snapshot(["pen_color", "pen_width"])
+        self.assertEqual(snapshot.captured(), {"pen_color": 255, "pen_width": 3})
+        with self.assertRaises(ValueError):
+            self.source.snapshot(["name"])
+
+    def test_apply_writes_differences_only(self):
+        snapshot = self.source.snapshot()
+        self.server.reset_calls()
+        # Nothing is known about the target yet: a blind put, without reads.
+        self.target.apply(snapshot)
+        self.assertEqual(self.server.call_count, len(snapshot))
+        self.assertEqual(self.target.snapshot(), snapshot)
+        self.server.reset_calls()
+        self.assertEqual(self.target.apply(snapshot._replace(pen_color=0)), {"pen_color": 0})
+        self.assertEqual(self.target.apply(snapshot), {"pen_color": 255})
+        self.assertEqual(self.target.apply(snapshot), {})
+        self.assertEqual(self.server.call_count, 2)
+        self.assertEqual(self.server.calls["PenColor"], 2)
+
+    def test_apply_after_snapshot(self):
+        snapshot = self.source.snapshot()
+        self.target.snapshot()
+        self.server.reset_calls()
+        changes = self.target.apply(snapshot)
+        self.assertEqual(list(changes), ["scale_mode", "scale_low", "scale_high", "pen_color", "pen_width"])
+        self.assertEqual(self.server.call_count, 5)
+        self.assertLess(self.server.call_count, len(snapshot))
+
+    def test_apply_after_direct_change(self):
+        snapshot = self.source.snapshot()
+        self.target.apply(snapshot)
+        self.target.pen_width = 7
+        self.server.reset_calls()
+        self.assertEqual(self.target.apply(snapshot), {"pen_width": 3})
+        self.assertEqual(self.server.call_count, 1)
+        self.assertEqual(self.target.pen_width, 3)
+
+    def test_apply_with_current(self):
+        snapshot = self.source.snapshot()
+        self.target.apply(snapshot)
+        self.target._dispatch.PenColor = 0  # Changed behind the wrapper.
+        self.assertEqual(self.target.apply(snapshot), {})
+        self.server.reset_calls()
+        changes = self.target.apply(snapshot, snapshot._replace(pen_color=0))
+        self.assertEqual(changes, {"pen_color": 255})
+        self.assertEqual(self.server.call_count, 1)
+        self.assertEqual(self.target.pen_color, 255)
+
+    def test_apply_partial(self):
+        self.target.pen_width = 5
+        self.target.apply(self.source.snapshot(["pen_color"]))
+        self.assertEqual(self.target.pen_color, 255)
+        self.assertEqual(self.target.pen_width, 5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,134 @@
+import pathlib
+import tempfile
+import unittest
+import wellcad.com
+from wellcad.com._memory_backend import MemoryComError
+
+
+class TestMemoryBackend(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        wellcad.com.set_backend("memory")
+        cls.app = wellcad.com.Application()
+        cls.server = cls.app._dispatch
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.app.quit(False)
+        wellcad.com.set_backend(None)
+
+    def setUp(self):
+        self.borehole = self.app.new_borehole()
+        self.gr_log = self.borehole.insert_new_log(1)
+        self.gr_log.name = "GR"
+        self.gr_log.data_table = (("Depth", "GR"), (10.0, 50.0), (10.5, 60.0), (11.0, 70.0))
+
+    def tearDown(self):
+        self.app.close_borehole(False)
+
+    def test_application(self):
+        self.assertTrue(self.app.show_window())
+        self.assertIs(self.app.get_active_borehole()._dispatch, self.borehole._dispatch)
+        self.assertIsNone(self.app.get_borehole(100))
+        self.assertIsNone(self.app.open_borehole("does not exist.wcl"))
+
+    def test_get_log(self):
+        self.assertEqual(self.borehole.nb_of_logs, 1)
+        self.assertEqual(self.borehole.get_log("GR").name, "GR")
+        self.assertEqual(self.borehole.get_log(0).name, "GR")
+        self.assertIsNone(self.borehole.get_log("Missing"))
+
+    def test_well_log_data(self):
+        self.assertEqual(self.gr_log.nb_of_data, 3)
+        self.assertEqual(self.gr_log.top_depth, 10.0)
+        self.assertEqual(self.gr_log.bottom_depth, 11.0)
+        # Index 0 is the bottom depth for logs with a constant sample step.
+        self.assertEqual(self.gr_log.data_depth(0), 11.0)
+        self.assertEqual(self.gr_log.get_data(0), 70.0)
+        self.assertEqual(self.gr_log.get_data_at_depth(10.4), 60.0)
+        self.assertEqual(self.gr_log.data_max, 70.0)
+        self.assertEqual(self.gr_log.get_data(10), self.gr_log.null_value)
+
+    def test_mud_log_data(self):
+        mud_log = self.borehole.insert_new_log(3)
+        mud_log.insert_data_at_depth(5.0, 1.0)
+        mud_log.insert_data_at_depth(2.0, 2.0)
+        self.assertEqual(mud_log.data_depth(0), 2.0)
+        self.assertEqual(mud_log.data_table[1:], ((2.0, 2.0), (5.0, 1.0)))
+        mud_log.remove_data_at_depth(2.0)
+        self.assertEqual(mud_log.nb_of_data, 1)
+
+    def test_trace_data_ordering(self):
+        image_log = self.borehole.insert_new_log(5)
+        image_log.data_table = (("Depth", "0", "1"), (1.0, 1, 2), (2.0, 3, 4))
+        self.assertEqual(image_log.trace_length, 2)
+        self.assertEqual(image_log.get_trace_data(0, 1), 4)
+        percent_log = self.borehole.insert_new_log(15)
+        percent_log.data_table = (("Depth", "A", "B"), (1.0, 1, 2), (2.0, 3, 4))
+        self.assertEqual(percent_log.get_trace_data(0, 1), 2)
+
+    def test_structures(self):
+        log = self.borehole.insert_new_log(6)
+        log.insert_new_structure_ex(12.0, 90.0, 30.0, 0.0)
+        log.insert_new_structure_ex(11.0, 180.0, 45.0, 0.1)
+        self.assertEqual(log.nb_of_data, 2)
+        self.assertEqual(log.structure(0).depth, 11.0)
+        self.assertEqual(log.structure_at_depth(11.9).azimuth, 90.0)
+        self.assertIsNone(log.structure(2))
+        self.assertEqual(log.data_table[0], ("Depth", "Azimuth", "Dip", "Aperture"))
+        log.remove_structure(0)
+        self.assertEqual(log.nb_of_data, 1)
+
+    def test_interval_items(self):
+        log = self.borehole.insert_new_log(13)
+        log.insert_new_interval_item(1.0, 2.0, 5.0)
+        log.insert_new_interval_item(2.0, 4.0, 7.0)
+        self.assertEqual(log.interval_item_at_depth(3.0).value, 7.0)
+        self.assertEqual(log.get_data_at_depth(1.5), 5.0)
+        self.assertEqual(log.bottom_depth, 4.0)
+
+    def test_read_only_property(self):
+        with self.assertRaises(MemoryComError):
+            self.gr_log._dispatch.NbOfData = 0
+
+    def test_display_properties(self):
+        self.gr_log.pen_width = 3
+        self.assertEqual(self.gr_log.pen_width, 3)
+        self.assertEqual(self.gr_log.font.name, "Arial")
+
+    def test_depth_shift_log(self):
+        self.borehole.depth_shift_log("GR", 1.0)
+        self.assertEqual(self.gr_log.top_depth, 11.0)
+
+    def test_call_counting(self):
+        self.server.reset_calls()
+        self.gr_log.name
+        self.gr_log.get_data(0)
+        self.gr_log.pen_color = 255
+        self.assertEqual(self.server.call_count, 3)
+        self.assertEqual(self.server.calls["GetData"], 1)
+
+    def test_unmodelled_call(self):
+        self.borehole.filter_log("GR", False)
+        self.assertEqual(self.server.unmodelled_calls[-1], ("MemoryBorehole", "FilterLog", ("GR", False, None)))
+
+    def test_save_and_open(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = str(pathlib.Path(directory) / "saved.wcl")
+            self.borehole.save_as(path)
+            opened = self.app.open_borehole(path)
+            self.assertEqual(opened.get_log("GR").data_table, self.gr_log.data_table)
+            self.app.close_borehole(False)
+
+    def test_file_import(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = pathlib.Path(directory) / "imported.csv"
+            path.write_text("Depth,GR,DEN\n1.0,10,2.1\n2.0,20,2.2\n")
+            imported = self.app.file_import(str(path))
+            self.assertEqual(imported.nb_of_logs, 2)
+            self.assertEqual(imported.get_log("DEN").get_data_at_depth(2.0), 2.2)
+            self.app.close_borehole(False)
+
+
+if __name__ == '__main__':
+    unittest.main()
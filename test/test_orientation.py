@@ -0,0 +1,112 @@
+import unittest
+import wellcad.com
+from ._picks import make_picks
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+@unittest.skipIf(numpy is None, "NumPy is not installed")
+class TestOrientation(unittest.TestCase):
+    def assertAnglesEqual(self, first, second):
+        difference = (numpy.asarray(first) - numpy.asarray(second) + 180.0) % 360.0 - 180.0
+        numpy.testing.assert_allclose(difference, 0.0, atol=1e-9)
+
+    def test_vertical_borehole(self):
+        deviation = wellcad.com.Deviation([0.0, 100.0], [0.0, 0.0], [0.0, 0.0])
+        picks = make_picks([10.0, 20.0, 30.0], [45.0, 180.0, 300.0], [10.0, 45.0, 80.0])
+        for reference in ("north", "high side"):
+            corrected = wellcad.com.apparent_to_true(picks, deviation, reference)
+            self.assertAnglesEqual(corrected["azimuth"], picks["azimuth"])
+            numpy.testing.assert_allclose(corrected["dip"], picks["dip"])
+            numpy.testing.assert_array_equal(corrected["depth"], picks["depth"])
+
+    def test_deviated_borehole(self):
+        # A plane perpendicular to a borehole tilted 30 degrees to the east
+        # dips 30 degrees to the west. A plane dipping 30 degrees towards the
+        # high side of that borehole is horizontal.
+        deviation = wellcad.com.Deviation([0.0, 100.0], [90.0, 90.0], [30.0, 30.0])
+        corrected = wellcad.com.apparent_to_true(make_picks([50.0], [0.0], [0.0]), deviation)
+        self.assertAnglesEqual(corrected["azimuth"], [270.0])
+        numpy.testing.assert_allclose(corrected["dip"], [30.0])
+        corrected = wellcad.com.apparent_to_true(make_picks([50.0], [0.0], [30.0]), deviation, "high side")
+        numpy.testing.assert_allclose(corrected["dip"], [0.0], atol=1e-6)
+        corrected = wellcad.com.apparent_to_true(make_picks([50.0], [90.0], [30.0]), deviation, "north")
+        numpy.testing.assert_allclose(corrected["dip"], [0.0], atol=1e-6)
+
+    def test_round_trip(self):
+        rng = numpy.random.default_rng(0)
+        deviation = wellcad.com.Deviation([0.0, 50.0, 100.0], [350.0, 10.0, 40.0], [5.0, 40.0, 75.0])
+        picks = make_picks(numpy.sort(rng.uniform(-10.0, 110.0, 500)), rng.uniform(0.0, 360.0, 500),
+                           rng.uniform(1.0, 89.0, 500))
+        for reference in ("north", "high side"):
+            corrected = wellcad.com.apparent_to_true(picks, deviation, reference)
+            self.assertTrue(((corrected["dip"] >= 0.0) & (corrected["dip"] <= 90.0)).all())
+            apparent = wellcad.com.true_to_apparent(corrected, deviation, reference)
+            self.assertAnglesEqual(apparent["azimuth"], picks["azimuth"])
+            numpy.testing.assert_allclose(apparent["dip"], picks["dip"])
+
+    def test_interpolation(self):
+        deviation = wellcad.com.Deviation([100.0, 0.0], [350.0, 10.0], [20.0, 20.0])
+        axis = deviation.direction([50.0, -5.0, 200.0])
+        self.assertAlmostEqual(numpy.degrees(numpy.arctan2(axis[0, 1], axis[0, 0])), 0.0)
+        numpy.testing.assert_allclose(numpy.linalg.norm(axis, axis=1), 1.0)
+        numpy.testing.assert_allclose(axis[1], wellcad.com.Deviation([0.0], [10.0], [20.0]).direction([0.0])[0])
+        numpy.testing.assert_allclose(axis[2], wellcad.com.Deviation([0.0], [350.0], [20.0]).direction([0.0])[0])
+
+    def test_batch(self):
+        surveys = [wellcad.com.Deviation([0.0, 100.0], [azimuth, azimuth], [tilt, tilt])
+                   for azimuth, tilt in ((0.0, 10.0), (120.0, 60.0), (250.0, 35.0))]
+        wells = [make_picks([10.0, 20.0], [30.0, 200.0], [20.0, 70.0]) for _ in surveys]
+        corrected = wellcad.com.apparent_to_true(wells, surveys, "high side")
+        self.assertEqual(len(corrected), 3)
+        for picks, survey, result in zip(wells, surveys, corrected):
+            single = wellcad.com.apparent_to_true(picks, survey, "high side")
+            numpy.testing.assert_allclose(result["azimuth"], single["azimuth"])
+            numpy.testing.assert_allclose(result["dip"], single["dip"])
+        self.assertEqual(wells[0]["azimuth"][0], 30.0)
+
+    def test_validation(self):
+        deviation = wellcad.com.Deviation([0.0], [0.0], [10.0])
+        picks = make_picks([1.0], [0.0], [10.0])
+        with self.assertRaises(ValueError):
+            wellcad.com.apparent_to_true(picks, deviation, "south")
+        with self.assertRaises(ValueError):
+            wellcad.com.apparent_to_true([picks, picks], [deviation])
+        with self.assertRaises(ValueError):
+            wellcad.com.apparent_to_true(picks[["depth", "dip"]], deviation)
+        with self.assertRaises(ValueError):
+            wellcad.com.Deviation([0.0, 1.0], [0.0], [10.0])
+        with self.assertRaises(ValueError):
+            wellcad.com.Deviation([numpy.nan], [0.0], [10.0])
+
+
+@unittest.skipIf(numpy is None, "NumPy is not installed")
+class TestDeviationFromLogs(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        wellcad.com.set_backend("memory")
+        cls.app = wellcad.com.Application()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.app.quit(False)
+        wellcad.com.set_backend(None)
+
+    def test_from_logs(self):
+        borehole = self.app.new_borehole()
+        azimuth_log = borehole.insert_new_log(1)
+        azimuth_log.from_numpy([0.0, 10.0, 20.0], [90.0, numpy.nan, 90.0])
+        tilt_log = borehole.insert_new_log(1)
+        tilt_log.from_numpy([0.0, 20.0], [0.0, 40.0])
+        deviation = wellcad.com.Deviation.from_logs(azimuth_log, tilt_log)
+        numpy.testing.assert_array_equal(deviation.depth, [0.0, 20.0])
+        numpy.testing.assert_allclose(deviation.tilt, [0.0, 40.0])
+        self.assertIn("2 stations", repr(deviation))
+        self.app.close_borehole(False)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,131 @@
+import unittest
+import wellcad.com
+from wellcad.com import _hooks
+
+
+class TestPropertyCache(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        wellcad.com.set_backend("memory")
+        cls.app = wellcad.com.Application()
+        cls.server = cls.app._dispatch
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.app.quit(False)
+        wellcad.com.set_backend(None)
+
+    def setUp(self):
+        self.borehole = self.app.new_borehole()
+        self.gr_log = self.borehole.insert_new_log(1)
+        self.gr_log.name = "GR"
+        self.gr_log.data_table = (("Depth", "GR"), (10.0, 50.0), (10.5, 60.0), (11.0, 70.0))
+
+    def tearDown(self):
+        self.app.close_borehole(False)
+
+    def test_reads_are_cached(self):
+        with self.borehole.cached() as cache:
+            self.server.reset_calls()
+            for _ in range(10):
+                self.assertEqual(self.gr_log.name, "GR")
+                self.assertEqual(self.gr_log.bottom_depth, 11.0)
+            self.assertEqual(self.server.calls["Name"], 1)
+            self.assertEqual(self.server.calls["BottomDepth"], 1)
+        self.assertEqual(cache.cache_info(wellcad.com.Log), (18, 2, 0))
+        self.assertEqual(cache.hit_rates(), {"Log": 0.9})
+        self.assertEqual(self.gr_log.name, "GR")
+        self.assertEqual(self.server.calls["Name"], 2)
+
+    def test_cache_is_per_object(self):
+        other = self.borehole.insert_new_log(1)
+        with self.borehole.cached() as cache:
+            self.server.reset_calls()
+            self.gr_log.name
+            other.name
+            self.gr_log.name
+            self.assertEqual(self.server.calls["Name"], 2)
+            self.assertEqual(cache.cache_info().currsize, 1 + 1)
+
+    def test_put_invalidates(self):
+        with self.borehole.cached():
+            self.assertEqual(self.gr_log.name, "GR")
+            self.gr_log.name = "GR2"
+            self.assertEqual(self.gr_log.name, "GR2")
+
+    def test_processing_invalidates(self):
+        with self.borehole.cached() as cache:
+            self.assertEqual(self.gr_log.top_depth, 10.0)
+            self.assertEqual(self.borehole.nb_of_logs, 1)
+            self.borehole.depth_shift_log("GR", 1.0)
+            self.assertEqual(cache.cache_info().currsize, 0)
+            self.assertEqual(self.gr_log.top_depth, 11.0)
+            self.gr_log.insert_data_at_depth(5.0, 1.0)
+            self.assertEqual(self.gr_log.top_depth, 5.0)
+
+    def test_queries_keep_cache(self):
+        with self.borehole.cached() as cache:
+            self.gr_log.name
+            self.gr_log.get_data(0)
+            self.gr_log.data_depth(0)
+            log = self.borehole.get_log(0)
+            self.assertEqual(cache.cache_info(wellcad.com.Log).currsize, 1)
+            self.assertEqual(log.name, "GR")
+
+    def test_exception_uninstalls(self):
+        with self.assertRaises(RuntimeError):
+            with self.borehole.cached():
+                raise RuntimeError()
+        self.assertEqual(_hooks.installed(), ())
+        self.assertTrue(wellcad.com.get_backend().is_dispatch(self.gr_log._dispatch))
+
+
+class TestHooks(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        wellcad.com.set_backend("memory")
+        cls.app = wellcad.com.Application()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.app.quit(False)
+        wellcad.com.set_backend(None)
+
+    def test_calls_are_routed(self):
+        events = []
+
+        class Recorder(_hooks.DispatchHook):
+            def get(self, wrapper, name, fetch):
+                events.append(("get", type(wrapper).__name__, name))
+                return fetch()
+
+            def put(self, wrapper, name, value, store):
+                events.append(("put", type(wrapper).__name__, name, value))
+                store()
+
+            def invoke(self, wrapper, name, args, call):
+                events.append(("invoke", type(wrapper).__name__, name, len(args)))
+                return call()
+
+        hook = Recorder()
+        _hooks.install(hook)
+        try:
+            borehole = self.app.new_borehole()
+            log = borehole.insert_new_log(1)
+            log.name = "GR"
+            self.assertEqual(borehole.add_log(log).name, "GR")
+        finally:
+            _hooks.uninstall(hook)
+        self.assertEqual(events, [
+            ("invoke", "Application", "NewBorehole", 1),
+            ("invoke", "Borehole", "InsertNewLog", 1),
+            ("put", "Log", "Name", "GR"),
+            ("invoke", "Borehole", "AddLog", 1),
+            ("get", "Log", "Name"),
+        ])
+        self.assertNotIsInstance(log._dispatch, _hooks.HookedDispatch)
+        self.app.close_borehole(False)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,100 @@
+import gc
+import os
+import pickle
+import gzip
+import tempfile
+import unittest
+import wellcad.com
+from wellcad.com._session_backend import ReplayComError, ReplayError
+
+
+def pipeline(app):
+    borehole = app.new_borehole()
+    log = borehole.insert_new_log(1)
+    log.name = "GR"
+    log.data_table = (("Depth", "GR"), (1.0, 10.0), (2.0, 20.0), (3.0, 30.0))
+    log = borehole.get_log("GR")
+    return log.name, log.nb_of_data, log.data_table
+
+
+class TestSessionBackend(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "session.wcs")
+        wellcad.com.set_backend("memory")
+        with wellcad.com.RecordingBackend(self.path) as self.recorder:
+            self.expected = pipeline(wellcad.com.Application())
+
+    def tearDown(self):
+        wellcad.com.set_backend(None)
+        self.directory.cleanup()
+
+    def test_record_restores_backend(self):
+        self.assertIsInstance(wellcad.com.get_backend(), wellcad.com.MemoryBackend)
+        self.assertTrue(os.path.exists(self.path))
+        self.assertGreater(len(self.recorder.events), 0)
+
+    def test_replay(self):
+        replay = wellcad.com.set_backend(wellcad.com.ReplayBackend(self.path))
+        self.assertEqual(pipeline(wellcad.com.Application()), self.expected)
+        self.assertEqual(replay.remaining, 0)
+        with self.assertRaises(ReplayError):
+            wellcad.com.Application()
+        replay.rewind()
+        self.assertEqual(pipeline(wellcad.com.Application()), self.expected)
+
+    def test_unrecorded_call(self):
+        wellcad.com.set_backend(wellcad.com.ReplayBackend(self.path))
+        app = wellcad.com.Application()
+        with self.assertRaises(ReplayError):
+            app.get_active_borehole()
+
+    def test_strict(self):
+        wellcad.com.set_backend(wellcad.com.ReplayBackend(self.path))
+        borehole = wellcad.com.Application().new_borehole()
+        borehole.insert_new_log(2)  # The arguments are not checked by default.
+        wellcad.com.set_backend(wellcad.com.ReplayBackend(self.path, strict=True))
+        borehole = wellcad.com.Application().new_borehole()
+        with self.assertRaises(ReplayError):
+            borehole.insert_new_log(2)
+
+    def test_errors(self):
+        with wellcad.com.RecordingBackend(self.path):
+            log = wellcad.com.Application().new_borehole().insert_new_log(1)
+            with self.assertRaises(wellcad.com._memory_backend.MemoryComError):
+                log._dispatch.NbOfData = 3
+        wellcad.com.set_backend(wellcad.com.ReplayBackend(self.path))
+        log = wellcad.com.Application().new_borehole().insert_new_log(1)
+        with self.assertRaises(ReplayComError) as context:
+            log._dispatch.NbOfData = 3
+        self.assertEqual(context.exception.args[1], "NbOfData is read-only")
+
+    def test_identities_released(self):
+        with wellcad.com.RecordingBackend(self.path) as recorder:
+            app = wellcad.com.Application()
+            borehole = app.new_borehole()
+            self.assertIs(app.get_active_borehole(), borehole)
+            del borehole
+            gc.collect()
+            self.assertEqual(len(recorder._dispatches), 1)
+            app.get_active_borehole()
+        ids = [event[4].id for event in recorder.events if event[2] in ("NewBorehole", "GetActiveBorehole")]
+        self.assertEqual(ids, [1, 1, 2])
+
+    def test_threaded(self):
+        path = os.path.join(self.directory.name, "threaded.wcs")
+        with wellcad.com.RecordingBackend(path):
+            app = wellcad.com.Application(threaded=True)
+            expected = pipeline(app)
+        wellcad.com.set_backend(wellcad.com.ReplayBackend(path))
+        self.assertEqual(pipeline(wellcad.com.Application()), expected)
+
+    def test_rejects_other_files(self):
+        with gzip.open(self.path, "wb") as f:
+            pickle.dump({"format": "wellcad-session", "version": 1, "events": [os.getcwd]}, f)
+        with self.assertRaises(pickle.UnpicklingError):
+            wellcad.com.ReplayBackend(self.path)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,110 @@
+import unittest
+import wellcad.com
+from ._picks import make_picks
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+@unittest.skipIf(numpy is None, "NumPy is not installed")
+class TestStereonet(unittest.TestCase):
+    def setUp(self):
+        rng = numpy.random.default_rng(0)
+        self.random = make_picks(numpy.sort(rng.uniform(0.0, 100.0, 2000)), rng.uniform(0.0, 360.0, 2000),
+                                 numpy.degrees(numpy.arccos(rng.uniform(0.0, 1.0, 2000))))
+
+    def test_rose_histograms(self):
+        picks = make_picks([1.0, 2.0, 10.0, 15.0, 25.0], [5.0, 95.0, 355.0, 100.0, 0.0], [30.0] * 5)
+        intervals, counts = wellcad.com.rose_histograms(picks, [[10.0, 20.0], [0.0, 10.0]], bins=4)
+        numpy.testing.assert_array_equal(intervals, [[0.0, 10.0], [10.0, 20.0]])
+        numpy.testing.assert_array_equal(counts, [[1, 1, 0, 0], [0, 1, 0, 1]])
+        _, counts = wellcad.com.rose_histograms(picks, [[0.0, 10.0]], bins=4, measure="strike")
+        numpy.testing.assert_array_equal(counts, [[1, 0, 1, 1]])
+        _, counts = wellcad.com.rose_histograms(picks, [[0.0, 10.0]], bins=4, measure="strike", bidirectional=True)
+        numpy.testing.assert_array_equal(counts, [[2, 1, 2, 1]])
+        intervals, counts = wellcad.com.rose_histograms(picks, 10.0)
+        numpy.testing.assert_array_equal(intervals, [[0.0, 10.0], [10.0, 20.0], [20.0, 30.0]])
+        numpy.testing.assert_array_equal(counts.sum(axis=1), [2, 2, 1])
+        self.assertEqual(counts.shape, (3, 36))
+
+    def test_intervals_from_polar_and_rose_log(self):
+        wellcad.com.set_backend("memory")
+        app = wellcad.com.Application()
+        try:
+            borehole = app.new_borehole()
+            rose = borehole.insert_new_log(20)
+            rose.insert_new_schmit_box(50.0, 100.0, "Lower")
+            rose.insert_new_schmit_box(0.0, 50.0, "Upper")
+            intervals, counts = wellcad.com.rose_histograms(self.random, rose)
+            numpy.testing.assert_array_equal(intervals, [[0.0, 50.0], [50.0, 100.0]])
+            self.assertEqual(counts.sum(), 2000)
+            with self.assertRaises(ValueError):
+                wellcad.com.rose_histograms(self.random, borehole.insert_new_log(6))
+        finally:
+            app.quit(False)
+            wellcad.com.set_backend(None)
+
+    def test_mean_vectors(self):
+        picks = make_picks([1.0, 2.0, 3.0, 11.0, 12.0], [120.0, 120.0, 120.0, 0.0, 180.0], [40.0, 40.0, 40.0, 89.0, 89.0])
+        intervals, means = wellcad.com.mean_vectors(picks, [[0.0, 10.0], [10.0, 20.0], [20.0, 30.0]])
+        numpy.testing.assert_array_equal(means["count"], [3, 2, 0])
+        numpy.testing.assert_allclose(means["azimuth"][0], 120.0)
+        numpy.testing.assert_allclose(means["dip"][0], 40.0)
+        numpy.testing.assert_allclose(means["resultant_length"][0], 1.0)
+        # Nearly vertical planes dipping in opposite directions average to a
+        # vertical plane, not to a horizontal one.
+        numpy.testing.assert_allclose(means["dip"][1], 90.0, atol=1e-6)
+        self.assertGreater(means["resultant_length"][1], 0.99)
+        self.assertTrue(numpy.isnan(means["azimuth"][2]))
+        lineations = numpy.zeros(2, [("depth", float), ("trend", float), ("plunge", float)])
+        lineations["depth"], lineations["trend"], lineations["plunge"] = [1.0, 2.0], [350.0, 10.0], [20.0, 20.0]
+        _, means = wellcad.com.mean_vectors(lineations, [[0.0, 10.0]])
+        self.assertEqual(means.dtype.names[1:3], ("trend", "plunge"))
+        numpy.testing.assert_allclose(means["trend"], [0.0], atol=1e-9)
+        self.assertGreater(means["plunge"][0], 20.0)
+
+    def test_density_grids(self):
+        for method in ("kamb", "fisher"):
+            intervals, densities = wellcad.com.density_grids(self.random, [[0.0, 100.0]], method=method, grid=21)
+            self.assertEqual(densities.shape, (1, 21, 21))
+            self.assertTrue(numpy.isnan(densities[0, 0, 0]))
+            self.assertAlmostEqual(numpy.nanmean(densities[0]), 1.0, delta=0.25)
+            flat = make_picks(numpy.linspace(0.0, 1.0, 50), numpy.zeros(50), numpy.full(50, 1.0))
+            _, densities = wellcad.com.density_grids(flat, [[0.0, 10.0], [10.0, 20.0]], method=method, grid=21)
+            self.assertEqual(densities[0, 10, 10], numpy.nanmax(densities[0]))
+            self.assertLess(numpy.nanmin(densities[0]), 0.5)
+            self.assertTrue(numpy.isnan(densities[1]).all())
+
+    def test_batch(self):
+        wells = [self.random[:700], self.random[700:]]
+        results = wellcad.com.mean_vectors(wells, 20.0)
+        self.assertEqual(len(results), 2)
+        for well, (intervals, means) in zip(wells, results):
+            single_intervals, single = wellcad.com.mean_vectors(well, 20.0)
+            numpy.testing.assert_array_equal(intervals, single_intervals)
+            numpy.testing.assert_allclose(means["azimuth"], single["azimuth"])
+        results = wellcad.com.rose_histograms(wells, [[[0.0, 50.0]], [[0.0, 100.0]]])
+        self.assertEqual(results[0][1].sum(), (wells[0]["depth"] <= 50.0).sum())
+        self.assertEqual(results[1][1].sum(), 1300)
+        results = wellcad.com.density_grids(wells, [[[0.0, 50.0]], numpy.empty((0, 2))], grid=11)
+        self.assertEqual(results[1][1].shape, (0, 11, 11))
+
+    def test_validation(self):
+        with self.assertRaises(ValueError):
+            wellcad.com.rose_histograms(self.random, 10.0, measure="dip")
+        with self.assertRaises(ValueError):
+            wellcad.com.rose_histograms(self.random, 0.0)
+        with self.assertRaises(ValueError):
+            wellcad.com.rose_histograms(self.random, [[10.0, 5.0]])
+        with self.assertRaises(ValueError):
+            wellcad.com.density_grids(self.random, 10.0, method="gauss")
+        with self.assertRaises(ValueError):
+            wellcad.com.mean_vectors([self.random], [[[0.0, 1.0]], [[1.0, 2.0]]])
+        with self.assertRaises(ValueError):
+            wellcad.com.mean_vectors(self.random[["azimuth", "dip"]], 10.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+import concurrent.futures
+import gc
+import threading
+import unittest
+import wellcad.com
+
+
+class Tracked:
+    """Records the thread it is released on."""
+
+    def __init__(self, threads):
+        self.threads = threads
+
+    def __del__(self):
+        self.threads.append(threading.current_thread().name)
+
+
+class TestThreadedApplication(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        wellcad.com.set_backend("memory")
+        cls.app = wellcad.com.Application(new_instance=True, threaded=True)
+        cls.borehole = cls.app.new_borehole()
+        for i in range(8):
+            log = cls.borehole.insert_new_log(1)
+            log.name = f"LOG{i}"
+            log.data_table = (("Depth", log.name),) + tuple((d * 0.5, float(i)) for d in range(100))
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.app.quit(False)
+        wellcad.com.set_backend(None)
+
+    def spy(self, raw, name):
+        threads = []
+        method = getattr(raw, name)
+
+        def spied(*args):
+            threads.append(threading.current_thread().name)
+            return method(*args)
+
+        object.__setattr__(raw, name, spied)
+        self.addCleanup(object.__delattr__, raw, name)
+        return threads
+
+    def test_released_on_owner_thread(self):
+        apartment = wellcad.com._apartment.Apartment("owner")
+        threads = []
+        dispatch = wellcad.com._funnel.FunneledDispatch(Tracked(threads), apartment)
+        del dispatch
+        gc.collect()
+        apartment.shutdown()
+        self.assertEqual(threads, ["owner"])
+        dispatch = wellcad.com._funnel.FunneledDispatch(Tracked(threads), apartment)
+        del dispatch
+        gc.collect()
+        self.assertEqual(threads, ["owner"])  # Leaked, not released here.
+        self.assertIsInstance(wellcad.com._apartment._leaked[-1][0], Tracked)
+        wellcad.com._apartment._leaked.pop()
+
+    def test_wrappers_are_funneled(self):
+        self.assertIsInstance(self.borehole._dispatch, wellcad.com._funnel.FunneledDispatch)
+        log = self.borehole.get_log("LOG1")
+        self.assertIsInstance(log, wellcad.com.Log)
+        self.assertIsInstance(log._dispatch, wellcad.com._funnel.FunneledDispatch)
+        self.assertIsNone(self.borehole.get_log("NOPE"))
+
+    def test_calls_run_on_owner_thread(self):
+        threads = self.spy(self.borehole._dispatch._target, "GetLog")
+
+        def read(name):
+            log = self.borehole.get_log(name)
+            return log.name, sum(row[1] for row in log.data_table[1:])
+
+        with concurrent.futures.ThreadPoolExecutor(4) as executor:
+            results = list(executor.map(read, [f"LOG{i}" for i in range(8)] * 4))
+        self.assertEqual(results, [(f"LOG{i}", 100.0 * i) for i in range(8)] * 4)
+        self.assertEqual(set(threads), {"wellcad-application"})
+
+    def test_arguments_are_unwrapped(self):
+        borehole = self.app.new_borehole()
+        log = borehole.insert_new_log(3)
+        log.name = "ROP"
+        copy = borehole.add_log(log)
+        self.assertEqual(copy.name, "ROP")
+        with borehole.cached():
+            self.assertEqual(copy.name, "ROP")
+            self.assertEqual(borehole.add_log(copy).name, "ROP")
+        self.app.close_borehole(False)
+
+    def test_errors_propagate(self):
+        log = self.borehole.get_log("LOG0")
+        log.lock_log_data = True
+        try:
+            with self.assertRaises(wellcad.com._memory_backend.MemoryComError):
+                log.data_table = (("Depth", "LOG0"),)
+        finally:
+            log.lock_log_data = False
+
+
+if __name__ == '__main__':
+    unittest.main()
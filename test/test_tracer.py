@@ -0,0 +1,95 @@
+import json
+import os
+import tempfile
+import unittest
+import wellcad.com
+
+
+class TestComTracer(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        wellcad.com.set_backend("memory")
+        cls.app = wellcad.com.Application()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.app.quit(False)
+        wellcad.com.set_backend(None)
+
+    def setUp(self):
+        self.borehole = self.app.new_borehole()
+        self.log = self.borehole.insert_new_log(1)
+        self.log.data_table = (("Depth", "GR"), (1.0, 10.0), (2.0, 20.0), (3.0, 30.0))
+
+    def tearDown(self):
+        self.app.close_borehole(False)
+
+    def test_stats(self):
+        with wellcad.com.ComTracer() as tracer:
+            for _ in range(5):
+                self.log.insert_data_at_depth(4.0, 40.0)
+            self.log.data_table
+            self.log.name = "GR2"
+        stats = tracer.stats()
+        self.assertEqual(stats["Log.InsertDataAtDepth"].count, 5)
+        self.assertEqual(stats["Log.InsertDataAtDepth"].args_size, 10)
+        self.assertEqual(stats["Log.DataTable"].count, 1)
+        self.assertEqual(stats["Log.DataTable"].result_size, 2 * (1 + 3 + 5))
+        self.assertEqual(stats["Log.Name="].args_size, 1)
+        for s in stats.values():
+            self.assertLessEqual(s.p50, s.p99)
+            self.assertLessEqual(s.p99, s.total)
+        self.assertEqual(list(stats), sorted(stats, key=lambda key: stats[key].total, reverse=True))
+        self.assertIn("Log.InsertDataAtDepth", tracer.report())
+
+    def test_disabled_outside_block(self):
+        with wellcad.com.ComTracer() as tracer:
+            pass
+        self.assertEqual(wellcad.com._hooks.installed(), ())
+        self.assertIs(vars(wellcad.com._dispatch_wrapper.DispatchWrapper)["_dispatch"],
+                      wellcad.com._dispatch_wrapper._dispatch_slot)
+        self.log.name
+        self.assertEqual(tracer.stats(), {})
+
+    def test_errors(self):
+        class Failing(wellcad.com._hooks.DispatchHook):
+            def invoke(self, wrapper, name, args, call):
+                raise RuntimeError(name)
+
+        failing = Failing()
+        with wellcad.com.ComTracer() as tracer:
+            wellcad.com._hooks.install(failing)
+            try:
+                with self.assertRaises(RuntimeError):
+                    self.log.insert_data_at_depth(4.0, 40.0)
+            finally:
+                wellcad.com._hooks.uninstall(failing)
+        stats = tracer.stats()["Log.InsertDataAtDepth"]
+        self.assertEqual((stats.count, stats.errors), (1, 1))
+
+    def test_exports(self):
+        with wellcad.com.ComTracer() as tracer:
+            self.log.name
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "trace.json")
+            text = tracer.to_json(path)
+            with open(path, encoding="utf-8") as f:
+                self.assertEqual(json.load(f), json.loads(text))
+        self.assertEqual(json.loads(text)["Log.Name"]["count"], 1)
+        lines = tracer.to_collapsed().splitlines()
+        self.assertEqual(len(lines), 1)
+        stack, microseconds = lines[0].rsplit(" ", 1)
+        self.assertTrue(stack.endswith(";wellcad.com._log:name;Log.Name"))
+        self.assertIn(f"{__name__}:test_exports;", stack)
+        self.assertNotIn("wellcad.com._hooks", stack)
+        self.assertGreaterEqual(int(microseconds), 1)
+
+    def test_without_stacks(self):
+        with wellcad.com.ComTracer(stacks=False) as tracer:
+            self.log.name
+        self.assertEqual(tracer.stats()["Log.Name"].count, 1)
+        self.assertEqual(tracer.to_collapsed(), "")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,10 @@
+"""An asyncio interface to WellCAD.
+
+The classes in this package mirror ``wellcad.com.Application``,
+``Borehole`` and ``Log`` (and any other wrapper class), but every property
+read and method call is run on a dedicated COM apartment thread and awaited,
+so the event loop keeps running while WellCAD is busy.
+"""
+from ._async_wrapper import AsyncWrapper, Application, Borehole, Log
+
+__all__ = ["AsyncWrapper", "Application", "Borehole", "Log"]
@@ -0,0 +1,228 @@
+import asyncio
+import collections.abc
+import functools
+import inspect
+import wellcad.com
+from wellcad.com._apartment import Apartment
+from wellcad.com._dispatch_wrapper import DispatchWrapper
+from wellcad.com._item_sequence import ItemSequence
+
+# Maps the wrapper classes of wellcad.com to their mirror in this module.
+_MIRRORS = {}
+
+
+class AsyncWrapper:
+    """The asynchronous mirror of a ``wellcad.com`` wrapper object.
+
+    All members of the wrapped object are available, but run on the COM
+    apartment thread shared by all objects obtained from the same
+    :class:`Application`:
+
+    * Methods become coroutine functions, e.g.
+      ``await borehole.filter_log("GR", 3)``.
+    * Properties are read with ``await``, e.g. ``await log.name``, and
+      written with :meth:`set`, e.g. ``await log.set("name", "GR")``.
+    * Wrapper objects returned by methods or properties are mirrored too, so
+      ``await borehole.get_log("GR")`` returns a :class:`Log`.
+    * Generators and item sequences are read into lists on the apartment
+      thread, so ``await log.structures`` returns a list of mirrored
+      structures and ``await log.iter_windows(10.0)`` a list of windows.
+    * Context managers such as ``bulk_edit()`` and ``cached()`` would make
+      COM calls outside the apartment thread, so they raise a ``TypeError``;
+      use them inside a function passed to :meth:`run` instead.
+
+    Calls are queued and run one at a time, in order. If a timeout is set on
+    the application, a call that does not complete in time raises
+    ``asyncio.TimeoutError``. A call that is cancelled, or times out, before
+    it has started is removed from the queue. A call already running in
+    WellCAD cannot be interrupted; its result is discarded.
+
+    Parameters
+    ----------
+    wrapped : wellcad.com.DispatchWrapper
+        The wrapper object to mirror.
+    apartment : Apartment
+        The apartment thread that owns ``wrapped``.
+    timeout : float, optional
+        The default timeout of each call in seconds.
+    """
+
+    _WRAPPED_CLASS = None
+
+    def __init__(self, wrapped, apartment, timeout=None):
+        object.__setattr__(self, "_wrapped", wrapped)
+        object.__setattr__(self, "_apartment", apartment)
+        object.__setattr__(self, "_timeout", timeout)
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if cls._WRAPPED_CLASS is not None:
+            _MIRRORS[cls._WRAPPED_CLASS] = cls
+
+    def __repr__(self):
+        return f"<{__name__.rsplit('.', 1)[0]}.{type(self).__name__} mirroring {self._wrapped!r}>"
+
+    @property
+    def wrapped(self):
+        """wellcad.com.DispatchWrapper: The mirrored wrapper object. It must
+        only be used through :meth:`run`."""
+        return self._wrapped
+
+    def __getattr__(self, name):
+        wrapped = self._wrapped
+        member = inspect.getattr_static(type(wrapped), name, None)
+        if member is None or name.startswith("_"):
+            raise AttributeError(f"{type(wrapped).__name__!r} object has no attribute {name!r}")
+        if isinstance(member, property):
+            return self._call(getattr, wrapped, name)
+        method = getattr(wrapped, name)
+
+        @functools.wraps(method)
+        async def call(*args, **kwargs):
+            return await self._call(method, *args, **kwargs)
+
+        return call
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"Use 'await obj.set({name!r}, value)' to set properties asynchronously")
+
+    async def set(self, name, value):
+        """Sets a property of the mirrored object.
+
+        Parameters
+        ----------
+        name : str
+            The name of the property, e.g. ``"pen_color"``.
+        value : object
+            The new value.
+        """
+        await self._call(setattr, self._wrapped, name, value)
+
+    async def run(self, fn, *args, **kwargs):
+        """Runs a function on the apartment thread.
+
+        Use this to run several calls in one go, e.g. a loop over the samples
+        of a log, without a round-trip through the event loop for each.
+
+        Parameters
+        ----------
+        fn : callable
+            Called as ``fn(wrapped, *args, **kwargs)``, where ``wrapped`` is
+            the mirrored ``wellcad.com`` object.
+
+        Returns
+        -------
+        object
+            The result of ``fn``, with wrapper objects mirrored.
+        """
+        return await self._call(fn, self._wrapped, *args, **kwargs)
+
+    async def _call(self, fn, *args, **kwargs):
+        args = tuple(_unwrap(arg) for arg in args)
+        kwargs = {key: _unwrap(value) for key, value in kwargs.items()}
+        future = asyncio.wrap_future(self._apartment.submit(_run, fn, args, kwargs))
+        if self._timeout is None:
+            result = await future
+        else:
+            result = await asyncio.wait_for(future, self._timeout)
+        return self._mirror(result)
+
+    def _mirror(self, value):
+        if isinstance(value, DispatchWrapper):
+            cls = next((_MIRRORS[base] for base in type(value).__mro__ if base in _MIRRORS), AsyncWrapper)
+            return cls(value, self._apartment, self._timeout)
+        if type(value) in (list, tuple):
+            return type(value)(self._mirror(item) for item in value)
+        return value
+
+
+def _unwrap(value):
+    return value._wrapped if isinstance(value, AsyncWrapper) else value
+
+
+def _run(fn, args, kwargs):
+    """Runs a call on the apartment thread and turns lazy results, which
+    would make COM calls when used, into lists."""
+    value = fn(*args, **kwargs)
+    if isinstance(value, (collections.abc.Iterator, ItemSequence)):
+        return list(value)
+    if hasattr(type(value), "__enter__"):
+        raise TypeError(f"{type(value).__name__} objects make COM calls when used and can not be returned to "
+                        f"the event loop; use them in a function passed to run() instead")
+    return value
+
+
+class Application(AsyncWrapper):
+    """The asynchronous mirror of ``wellcad.com.Application``.
+
+    Create it with :meth:`create`, which starts the COM apartment thread all
+    the objects obtained from it share. Closing the application (or leaving
+    its ``async with`` block) stops that thread, but leaves WellCAD running.
+
+    Example
+    -------
+    >>> async def export(path):
+    ...     async with await wellcad.aio.Application.create(timeout=600) as app:
+    ...         borehole = await app.open_borehole(path)
+    ...         await borehole.filter_log("GR", 5)
+    ...         gr = await borehole.get_log("GR")
+    ...         return await gr.to_numpy()
+    """
+
+    _WRAPPED_CLASS = wellcad.com.Application
+
+    @classmethod
+    async def create(cls, new_instance=False, timeout=None):
+        """Connects to WellCAD on a new apartment thread.
+
+        Parameters
+        ----------
+        new_instance : bool, optional
+            If True, start a new WellCAD instance instead of connecting to an
+            existing one.
+        timeout : float, optional
+            The default timeout of each call, in seconds. By default calls
+            wait for as long as WellCAD takes.
+
+        Returns
+        -------
+        Application
+            The application.
+        """
+        apartment = Apartment("wellcad-aio")
+        try:
+            future = asyncio.wrap_future(apartment.submit(wellcad.com.Application, new_instance))
+            wrapped = await (future if timeout is None else asyncio.wait_for(future, timeout))
+        except BaseException:
+            apartment.shutdown(wait=False)
+            raise
+        return cls(wrapped, apartment, timeout)
+
+    async def close(self):
+        """Stops the apartment thread once the queued calls have run.
+
+        The objects obtained from this application can not be used anymore.
+        """
+        apartment = self._apartment
+        # Release the COM objects on the thread that owns them.
+        apartment.submit(object.__setattr__, self, "_wrapped", None)
+        apartment.shutdown(wait=False)
+        await asyncio.get_running_loop().run_in_executor(None, apartment.thread.join)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+
+class Borehole(AsyncWrapper):
+    """The asynchronous mirror of ``wellcad.com.Borehole``."""
+
+    _WRAPPED_CLASS = wellcad.com.Borehole
+
+
+class Log(AsyncWrapper):
+    """The asynchronous mirror of ``wellcad.com.Log``."""
+
+    _WRAPPED_CLASS = wellcad.com.Log
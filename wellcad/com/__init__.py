@@ -1,23 +1,64 @@
-from ._application import Application
-from ._borehole import Borehole
-from ._depth import Depth
-from ._header import Header
-from ._log import Log
-from ._odbc import Odbc
-from ._page import Page
-from ._title import Title
-from ._workspace import Workspace
-from ._font import Font
-from ._interval_item import IntervalItem
-from ._polar_and_rose_box import PolarAndRoseBox
-from ._drill_item import DrillItem
-from ._equipment_item import EquipmentItem
-from ._structure import Structure
-from ._litho_bed import LithoBed
-from ._cross_section_box import CrossSectionBox
-from ._marker_item import MarkerItem
-from ._comment_box import CommentBox
-from ._stacking_pattern_item import StackingPatternItem
-from ._litho_dictionary import LithoDictionary
-from ._litho_pattern import LithoPattern
-from ._fossil_item import FossilItem
+from ._backend import Backend, get_backend, set_backend
+
+# The wrapper classes are only imported when they are first accessed, so
+# short-lived scripts don't pay for loading modules they never use.
+_LAZY_NAMES = {
+    "MemoryBackend": "._memory_backend",
+    "RecordingBackend": "._session_backend",
+    "ReplayBackend": "._session_backend",
+    "Application": "._application",
+    "ApplicationPool": "._application_pool",
+    "Borehole": "._borehole",
+    "Depth": "._depth",
+    "Header": "._header",
+    "Log": "._log",
+    "Odbc": "._odbc",
+    "Page": "._page",
+    "Title": "._title",
+    "Workspace": "._workspace",
+    "Font": "._font",
+    "IntervalItem": "._interval_item",
+    "PolarAndRoseBox": "._polar_and_rose_box",
+    "DrillItem": "._drill_item",
+    "EquipmentItem": "._equipment_item",
+    "Structure": "._structure",
+    "LithoBed": "._litho_bed",
+    "CrossSectionBox": "._cross_section_box",
+    "MarkerItem": "._marker_item",
+    "CommentBox": "._comment_box",
+    "StackingPatternItem": "._stacking_pattern_item",
+    "LithoDictionary": "._litho_dictionary",
+    "LithoPattern": "._litho_pattern",
+    "FossilItem": "._fossil_item",
+    "DepthIndex": "._depth_index",
+    "IntervalIndex": "._interval_index",
+    "ItemSequence": "._item_sequence",
+    "PropertyCache": "._property_cache",
+    "LogSnapshot": "._log_snapshot",
+    "BulkEdit": "._bulk_edit",
+    "ComTracer": "._tracer",
+    "Deviation": "._orientation",
+    "apparent_to_true": "._orientation",
+    "true_to_apparent": "._orientation",
+    "rose_histograms": "._stereonet",
+    "mean_vectors": "._stereonet",
+    "density_grids": "._stereonet",
+}
+
+__all__ = ["Backend", "get_backend", "set_backend", *_LAZY_NAMES]
+
+
+# Module __getattr__ (PEP 562) needs Python 3.7, see python_requires.
+def __getattr__(name):
+    try:
+        module_name = _LAZY_NAMES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    from ._lazy import import_name
+    value = import_name(module_name, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_NAMES))
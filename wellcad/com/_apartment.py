@@ -0,0 +1,151 @@
+import concurrent.futures
+import queue
+import threading
+from . import _backend
+
+# The COM objects dropped after their apartment thread had stopped.
+_leaked = []
+
+
+class Apartment:
+    """A thread that owns COM objects and runs every call made on them.
+
+    WellCAD is a single-threaded apartment (STA) server: its dispatch objects
+    may only be used from the thread that created them. An apartment starts
+    one thread, initializes COM on it with the active backend and then runs
+    the functions queued with :meth:`submit` one after the other, in order.
+    Functions that have not started yet can be cancelled through their
+    future.
+
+    Parameters
+    ----------
+    name : str, optional
+        The name of the thread.
+    """
+
+    def __init__(self, name="wellcad-apartment"):
+        self._queue = queue.SimpleQueue()
+        self._backend = _backend.get_backend()
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._lock = threading.Lock()
+        self._shutdown = False
+        self._thread.start()
+
+    @property
+    def thread(self):
+        """threading.Thread: The thread of the apartment."""
+        return self._thread
+
+    def is_owner(self):
+        """Checks whether the calling thread is the thread of the apartment.
+
+        Returns
+        -------
+        bool
+            True if called from the apartment thread.
+        """
+        return threading.current_thread() is self._thread
+
+    def submit(self, fn, *args, **kwargs):
+        """Queues a call to run on the apartment thread.
+
+        Parameters
+        ----------
+        fn : callable
+            The function to call.
+        *args, **kwargs
+            The arguments of the call.
+
+        Returns
+        -------
+        concurrent.futures.Future
+            The future result of the call. Cancelling it before the call has
+            started removes the call from the queue.
+        """
+        with self._lock:
+            if self._shutdown:
+                raise RuntimeError("Cannot submit calls after the apartment was shut down")
+            future = concurrent.futures.Future()
+            self._queue.put((future, fn, args, kwargs))
+            return future
+
+    def release(self, holder):
+        """Releases the COM objects in a list on the apartment thread.
+
+        The list must hold the only references to the objects. Called from
+        another thread, it is emptied on the apartment thread; called from
+        the apartment thread, the objects are released when the caller drops
+        the list. If the apartment thread has stopped, the objects are kept
+        alive until the process exits rather than released on the wrong
+        thread.
+
+        Parameters
+        ----------
+        holder : list
+            The list holding the objects.
+        """
+        with self._lock:
+            if self.is_owner():
+                return
+            if not self._shutdown and self._thread.is_alive():
+                self._queue.put((concurrent.futures.Future(), holder.clear, (), {}))
+                return
+        _leaked.append(holder)
+
+    def call(self, fn, *args, **kwargs):
+        """Runs a call on the apartment thread and waits for its result.
+
+        Calls made from the apartment thread itself run directly.
+
+        Parameters
+        ----------
+        fn : callable
+            The function to call.
+        *args, **kwargs
+            The arguments of the call.
+
+        Returns
+        -------
+        object
+            The result of the call.
+        """
+        if self.is_owner():
+            return fn(*args, **kwargs)
+        return self.submit(fn, *args, **kwargs).result()
+
+    def shutdown(self, wait=True):
+        """Stops the apartment thread once the queued calls have run.
+
+        Parameters
+        ----------
+        wait : bool, optional
+            Whether to block until the thread has stopped. Defaults to True.
+        """
+        with self._lock:
+            if not self._shutdown:
+                self._shutdown = True
+                self._queue.put(None)
+        if wait and not self.is_owner():
+            self._thread.join()
+
+    def _run(self):
+        self._backend.initialize_thread()
+        try:
+            while True:
+                item = self._queue.get()
+                if item is None:
+                    break
+                future, fn, args, kwargs = item
+                if not future.set_running_or_notify_cancel():
+                    continue
+                try:
+                    result = fn(*args, **kwargs)
+                except BaseException as e:
+                    future.set_exception(e)
+                else:
+                    future.set_result(result)
+                # Drop the references before waiting for the next call, so
+                # that no COM object outlives its last user.
+                del item, future, fn, args, kwargs
+        finally:
+            self._backend.uninitialize_thread()
@@ -1,6 +1,8 @@
-from win32com.client import Dispatch
+from ._backend import get_backend
 from ._dispatch_wrapper import DispatchWrapper
-from ._borehole import Borehole
+from ._lazy import lazy_import
+
+lazy_import(globals(), "._borehole", "Borehole")
 
 class Application(DispatchWrapper):
     """The core class used to interact with WellCAD via its COM API.
@@ -16,6 +18,23 @@ class Application(DispatchWrapper):
     Before using the COM API, ensure WellCAD has been started at least once by
     an administrator in order to register it in the computer registry.
 
+    The WellCAD instance is reached through the active COM backend. Call
+    ``wellcad.com.set_backend("memory")`` beforehand to work against the
+    in-memory stand-in instead, for example on a machine without WellCAD.
+
+    Parameters
+    ----------
+    new_instance : bool, optional
+        If True, always start a new WellCAD instance instead of connecting
+        to an existing one. Defaults to False.
+    threaded : bool, optional
+        If True, the COM objects are owned by a dedicated apartment thread
+        and every call made through this application and the objects
+        obtained from it (boreholes, logs, ...) is funneled to that thread.
+        These objects can then be used from any number of threads, e.g. to
+        read logs from a thread pool while other threads process the data.
+        The calls themselves are still run one at a time. Defaults to False.
+
     Example
     -------
     >>> import wellcad.com
@@ -26,14 +45,23 @@ class Application(DispatchWrapper):
     <wellcad.com._borehole.Borehole object at 0x000001D6973FBD30>
     """
 
+    __slots__ = ()
+
     _DISPATCH_METHODS = ("ShowWindow", "NewBorehole", "OpenBorehole",
         "GetBorehole", "GetActiveBorehole", "FileImport", "MultiFileImport")
     
-    def __new__(cls):
+    def __new__(cls, new_instance=False, threaded=False):
         return object.__new__(cls)
     
-    def __init__(self):
-        super().__init__(Dispatch("WellCAD.Application"))
+    def __init__(self, new_instance=False, threaded=False):
+        if threaded:
+            from ._apartment import Apartment
+            from ._funnel import FunneledDispatch
+            apartment = Apartment("wellcad-application")
+            dispatch = apartment.call(get_backend().create_dispatch, "WellCAD.Application", new_instance)
+            super().__init__(FunneledDispatch(dispatch, apartment))
+        else:
+            super().__init__(get_backend().create_dispatch("WellCAD.Application", new_instance))
         
     def show_window(self):
         """Attempts to display the WellCAD workspace on screen.
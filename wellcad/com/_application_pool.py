@@ -0,0 +1,273 @@
+import collections
+import concurrent.futures
+import concurrent.futures.process
+import multiprocessing
+import multiprocessing.connection
+import os
+import threading
+from . import _backend
+from ._application import Application
+
+
+class ApplicationPool(concurrent.futures.Executor):
+    """Processes borehole documents in parallel, each worker process driving
+    its own WellCAD instance.
+
+    A single ``Application`` attaches to the one WellCAD instance already
+    running, so all work done through it is serialized. The pool starts
+    ``size`` worker processes, each with a new WellCAD instance, and hands out
+    one document per job. Jobs are submitted as with any
+    ``concurrent.futures`` executor and their results are returned to the
+    parent process, so they must be picklable (e.g. file paths, numbers or
+    NumPy arrays, but not wrapper objects).
+
+    Jobs are handed to the workers only as they become free, so the futures
+    of the queued jobs can still be cancelled. If a worker process dies while
+    running a job, the future of the job raises a ``BrokenProcessPool`` error
+    and the worker is replaced.
+
+    To contain the memory growth of long running WellCAD instances, a worker
+    can be replaced by a fresh process (and WellCAD instance) after a given
+    number of documents.
+
+    The workers use the backend active when the pool is created, so a pool
+    created after ``wellcad.com.set_backend("memory")`` runs without WellCAD.
+
+    Parameters
+    ----------
+    size : int, optional
+        The number of worker processes. Defaults to the number of CPUs.
+    max_documents_per_worker : int, optional
+        The number of documents a worker processes before it is replaced. By
+        default workers live as long as the pool.
+    backend : str, optional
+        The name of the backend the workers use. Defaults to the name of the
+        active backend.
+    mp_context : multiprocessing.context.BaseContext, optional
+        The multiprocessing context used to start the workers.
+
+    Example
+    -------
+    >>> def export_gr(borehole, folder):
+    ...     return borehole.get_log("GR").file_export(folder, borehole.name, "csv")
+    >>> with wellcad.com.ApplicationPool(size=4, max_documents_per_worker=50) as pool:
+    ...     results = list(pool.map(export_gr, paths, [r"C:\\Exports"] * len(paths)))
+    """
+
+    def __init__(self, size=None, max_documents_per_worker=None, backend=None, mp_context=None):
+        if backend is None:
+            backend = _backend.get_backend().name
+        self._context = mp_context or multiprocessing.get_context()
+        self._backend = backend
+        self._max_documents = max_documents_per_worker
+        self._lock = threading.Lock()
+        self._shutdown = False
+        # Jobs waiting for a free worker, as (future, job) pairs.
+        self._queued = collections.deque()
+        self._workers = [self._start_worker() for _ in range(size or os.cpu_count() or 1)]
+        self._monitor = threading.Thread(target=self._watch_workers, daemon=True)
+        self._monitor.start()
+
+    def submit(self, fn, path, *args, **kwargs):
+        """Schedules a job on a borehole document.
+
+        The worker opens the document, calls ``fn(borehole, *args,
+        **kwargs)`` and closes the document again without saving it (save it
+        in ``fn`` if needed).
+
+        Parameters
+        ----------
+        fn : callable
+            A function taking a ``Borehole`` as first argument. It must be
+            picklable, i.e. defined at the top level of a module.
+        path : str or None
+            The path of the borehole document (.wcl file) to open, or None to
+            start from a new, empty document.
+        *args, **kwargs
+            Further arguments passed to ``fn``.
+
+        Returns
+        -------
+        concurrent.futures.Future
+            The future result of ``fn``. If the document cannot be opened, the
+            future raises an ``OSError``.
+        """
+        with self._lock:
+            if self._shutdown:
+                raise RuntimeError("Cannot submit jobs after the pool was shut down")
+            future = concurrent.futures.Future()
+            self._queued.append((future, (fn, path, args, kwargs)))
+            self._dispatch()
+            return future
+
+    def shutdown(self, wait=True, *, cancel_futures=False):
+        """Stops the pool once the submitted jobs are done.
+
+        Each worker process quits its WellCAD instance and exits once it has
+        no job left.
+
+        Parameters
+        ----------
+        wait : bool, optional
+            Whether to block until all jobs are done and the worker processes
+            and their WellCAD instances have exited. Defaults to True.
+        cancel_futures : bool, optional
+            If True, the queued jobs are cancelled and the futures of the jobs
+            in progress raise a ``RuntimeError`` right away. The workers still
+            finish these jobs before they quit.
+        """
+        with self._lock:
+            self._shutdown = True
+            if cancel_futures:
+                for future, _ in self._queued:
+                    future.cancel()
+                self._queued.clear()
+                for worker in self._workers:
+                    if worker.future is not None and not worker.future.done():
+                        worker.future.set_exception(RuntimeError("The pool was shut down before the job was done"))
+            self._dispatch()
+        if wait:
+            self._monitor.join()
+
+    def _start_worker(self):
+        connection, child_connection = self._context.Pipe()
+        process = self._context.Process(target=_work, args=(self._backend, child_connection, self._max_documents),
+                                        daemon=True)
+        process.start()
+        child_connection.close()
+        return _Worker(process, connection)
+
+    def _dispatch(self):
+        """Hands the queued jobs to the idle workers, or asks them to stop
+        once the pool is shut down. Called with the lock held."""
+        for worker in self._workers:
+            while self._queued and worker.future is None and not worker.stopping and (
+                    self._max_documents is None or worker.documents < self._max_documents):
+                future, job = self._queued.popleft()
+                if not future.set_running_or_notify_cancel():
+                    continue
+                try:
+                    worker.connection.send(job)
+                except Exception as error:
+                    # The job could not be pickled.
+                    future.set_exception(error)
+                else:
+                    worker.future = future
+            if self._shutdown and not self._queued and worker.future is None and not worker.stopping:
+                worker.stopping = True
+                try:
+                    worker.connection.send(None)
+                except OSError:
+                    pass
+
+    def _watch_workers(self):
+        """Completes the futures as the workers send their results, and
+        replaces the workers that exit until the pool is shut down."""
+        while True:
+            with self._lock:
+                if not self._workers:
+                    return
+                workers = {}
+                for worker in self._workers:
+                    workers[worker.connection] = workers[worker.process.sentinel] = worker
+            for ready in multiprocessing.connection.wait(list(workers)):
+                worker = workers[ready]
+                if ready is worker.connection:
+                    self._receive(worker)
+                else:
+                    self._exited(worker)
+
+    def _receive(self, worker):
+        try:
+            succeeded, value = worker.connection.recv()
+        except (EOFError, OSError):
+            # The worker died, handled with its sentinel.
+            return
+        with self._lock:
+            future, worker.future = worker.future, None
+            worker.documents += 1
+            # The future was failed already if the pool was shut down with
+            # cancel_futures.
+            if future is not None and not future.done():
+                if succeeded:
+                    future.set_result(value)
+                else:
+                    future.set_exception(value)
+            self._dispatch()
+
+    def _exited(self, worker):
+        # A worker replaced after its last document exits right after sending
+        # the result, which may not have been received yet.
+        if worker.future is not None and worker.connection.poll():
+            self._receive(worker)
+        worker.process.join()
+        worker.connection.close()
+        with self._lock:
+            self._workers.remove(worker)
+            if worker.future is not None and not worker.future.done():
+                worker.future.set_exception(concurrent.futures.process.BrokenProcessPool(
+                    "The worker process died while running the job"))
+            if not self._shutdown:
+                self._workers.append(self._start_worker())
+            self._dispatch()
+
+
+class _Worker:
+    """A worker process, with the connection used to send it jobs and the
+    future of the job it is running."""
+
+    __slots__ = ("process", "connection", "future", "documents", "stopping")
+
+    def __init__(self, process, connection):
+        self.process = process
+        self.connection = connection
+        self.future = None
+        self.documents = 0
+        self.stopping = False
+
+
+def _work(backend, connection, max_documents):
+    """Runs the jobs received on a connection with a new WellCAD instance,
+    until asked to stop or after ``max_documents`` jobs."""
+    _backend.set_backend(backend)
+    application = Application(new_instance=True)
+    try:
+        documents = 0
+        while max_documents is None or documents < max_documents:
+            try:
+                job = connection.recv()
+            except EOFError:
+                break
+            except Exception as error:
+                # The job could not be unpickled. It still counts as a
+                # document, as the parent counts every result.
+                job = error
+            if job is None:
+                break
+            if isinstance(job, Exception):
+                result = (False, job)
+            else:
+                try:
+                    result = (True, _run_job(application, *job))
+                except Exception as error:
+                    result = (False, error)
+            try:
+                connection.send(result)
+            except Exception as error:
+                connection.send((False, RuntimeError(f"Could not return the result of the job: {error!r}")))
+            documents += 1
+    finally:
+        application.quit(False)
+
+
+def _run_job(application, fn, path, args, kwargs):
+    if path is None:
+        borehole = application.new_borehole()
+    else:
+        borehole = application.open_borehole(path)
+        if borehole is None:
+            raise OSError(f"Could not open the borehole document {path}")
+    try:
+        return fn(borehole, *args, **kwargs)
+    finally:
+        application.close_borehole(False)
@@ -0,0 +1,419 @@
+import itertools
+import numpy as np
+
+
+def table_to_array(table):
+    """Converts the data rows of a DataTable into a 2-D float64 array.
+
+    The header row is skipped. Conversion is done in a single pass over the
+    flattened rows in C, without looping over the samples in Python. Cells
+    that are not numbers (e.g. empty cells) become NaN.
+
+    Parameters
+    ----------
+    table : tuple of tuples
+        A DataTable as returned by ``Log.data_table``, header row included.
+
+    Returns
+    -------
+    numpy.ndarray
+        An array of shape ``(number of rows, number of columns)``.
+    """
+    rows = table[1:]
+    if not rows:
+        return np.empty((0, len(table[0]) if table else 0))
+    width = len(rows[0])
+    try:
+        flat = np.fromiter(itertools.chain.from_iterable(rows), np.float64, count=len(rows) * width)
+    except (TypeError, ValueError):
+        # Slow path for tables with empty or text cells.
+        flat = np.array([_to_float(cell) for row in rows for cell in row], np.float64)
+    return flat.reshape(len(rows), width)
+
+
+def _to_float(cell):
+    try:
+        return float(cell)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+def null_mask(values, null_value):
+    """Gets a boolean mask of the samples equal to a log's null value.
+
+    WellCAD stores data as 32 bit floats, so the comparison allows for the
+    rounding of the null value.
+    """
+    tolerance = abs(null_value) * 1e-6
+    return np.isnan(values) | (np.abs(values - null_value) <= tolerance)
+
+
+def apply_null(values, null_value, masked):
+    """Replaces null values by NaN, or masks them if ``masked`` is True."""
+    mask = null_mask(values, null_value)
+    if masked:
+        return np.ma.MaskedArray(values, mask=mask)
+    values[mask] = np.nan
+    return values
+
+
+def log_to_numpy(table, null_value, masked=False):
+    """Splits the DataTable of a Well, Mud or Interval Log into arrays.
+
+    See ``Log.to_numpy`` for a description of the returned arrays.
+    """
+    columns = table_to_array(table).T.copy()
+    if len(columns) < 2:
+        return np.empty(0), apply_null(np.empty(0), null_value, masked)
+    if len(columns) == 3:
+        depths = np.ascontiguousarray(columns[:2].T)
+    else:
+        depths = columns[0]
+    values = apply_null(columns[-1], null_value, masked)
+    return depths, values
+
+
+def check_depths(depths):
+    """Checks that depths are finite and strictly increasing.
+
+    Parameters
+    ----------
+    depths : numpy.ndarray
+        A 1-D array of depths, or an array of shape ``(n, 2)`` holding the top
+        and bottom depths of intervals.
+
+    Raises
+    ------
+    ValueError
+        If the depths are not finite, not sorted, or an interval has its
+        bottom above its top.
+    """
+    if not np.isfinite(depths).all():
+        raise ValueError("The depths must not contain NaN or infinite values")
+    tops = depths[:, 0] if depths.ndim == 2 else depths
+    steps = np.diff(tops)
+    if (steps <= 0).any():
+        index = int(np.argmax(steps <= 0)) + 1
+        raise ValueError(f"The depths must be strictly increasing, but depth {tops[index]:g} "
+                         f"at index {index} follows {tops[index - 1]:g}")
+    if depths.ndim == 2 and (depths[:, 1] < depths[:, 0]).any():
+        index = int(np.argmax(depths[:, 1] < depths[:, 0]))
+        raise ValueError(f"The interval at index {index} has its bottom depth above its top depth")
+
+
+def numpy_to_rows(depths, values, null_value):
+    """Builds the data rows of a DataTable from depth and value arrays.
+
+    NaN values and masked values are replaced by ``null_value``. The arrays
+    are joined in NumPy and converted to Python floats in a single
+    ``tolist`` call.
+
+    Parameters
+    ----------
+    depths : array_like
+        A 1-D array of depths, or an array of shape ``(n, 2)`` holding the top
+        and bottom depths of intervals. The depths must be strictly
+        increasing.
+    values : array_like
+        A 1-D array of values, one per depth, or a 2-D array holding one
+        row of values per depth.
+    null_value : float
+        The value written in place of missing data.
+
+    Returns
+    -------
+    tuple of tuples
+        The data rows, without the header row.
+    """
+    depths = np.asarray(depths, np.float64)
+    if depths.ndim == 1:
+        depths = depths[:, np.newaxis]
+    if depths.ndim != 2 or depths.shape[1] not in (1, 2):
+        raise ValueError(f"Expected 1-D depths or (n, 2) interval depths, got shape {depths.shape}")
+    values = np.ma.filled(np.ma.masked_invalid(np.ma.asarray(values, np.float64)), null_value)
+    if values.ndim not in (1, 2) or len(values) != len(depths):
+        raise ValueError(f"Expected {len(depths)} values, got shape {values.shape}")
+    check_depths(depths if depths.shape[1] == 2 else depths[:, 0])
+    return tuple(map(tuple, np.column_stack((depths, values)).tolist()))
+
+
+def trace_table_to_numpy(table, null_value, masked=False):
+    """Splits the DataTable of a trace log into a depth and a 2-D value array.
+
+    The rows are sorted top to bottom. See ``Log.trace_array`` for a
+    description of the returned arrays.
+    """
+    array = table_to_array(table)
+    if array.shape[1] < 2:
+        return np.empty(0), apply_null(np.empty((0, 0)), null_value, masked)
+    depths = np.ascontiguousarray(array[:, 0])
+    values = np.ascontiguousarray(array[:, 1:])
+    if (np.diff(depths) < 0).any():
+        order = np.argsort(depths, kind="stable")
+        depths, values = depths[order], values[order]
+    return depths, apply_null(values, null_value, masked)
+
+
+def table_to_records(table, fields):
+    """Converts the DataTable of an item log into a structured array.
+
+    The first columns of the table are named ``fields``, whatever their title
+    in the table. The remaining columns are the attributes of the items and
+    are named after their title, in lower case with spaces replaced by
+    underscores. A column becomes a float64 field if all its non-empty
+    cells are numbers, empty cells becoming NaN, and a string field
+    otherwise. The rows are sorted by their first field.
+    """
+    header, rows = (table[0], table[1:]) if table else ((), ())
+    names = list(fields)
+    for title in header[len(fields):]:
+        name = field_key(title) or f"attribute{len(names)}"
+        while name in names:
+            name += "_"
+        names.append(name)
+    columns = list(zip(*rows)) if rows else [()] * len(names)
+    arrays = [_column_array(column) for column in columns]
+    records = np.empty(len(rows), [(name, array.dtype) for name, array in zip(names, arrays)])
+    for name, array in zip(names, arrays):
+        records[name] = array
+    if len(records) and names and (np.diff(records[names[0]]) < 0).any():
+        records = records[np.argsort(records[names[0]], kind="stable")]
+    return records
+
+
+def _column_array(column):
+    try:
+        return np.array(column, np.float64)
+    except (TypeError, ValueError):
+        pass
+    values = [_to_float(cell) for cell in column]
+    if all(cell == "" or cell is None or value == value for cell, value in zip(column, values)):
+        return np.array(values, np.float64)
+    return np.array(["" if cell is None else str(cell) for cell in column])
+
+
+# The valid range of the angle fields of structure, breakout and lineation
+# picks, in degrees.
+_PICK_RANGES = {"azimuth": (0.0, 360.0), "trend": (0.0, 360.0), "dip": (0.0, 90.0), "plunge": (0.0, 90.0),
+                "tilt": (0.0, 90.0), "eccentricity": (-1.0, 1.0)}
+# Fields of picks that cannot be negative.
+_NON_NEGATIVE_PICK_FIELDS = ("aperture", "length", "opening")
+
+
+def field_key(name):
+    """Normalizes a column title or field name for matching, see
+    ``table_to_records``."""
+    return str(name).strip().lower().replace(" ", "_")
+
+
+def pick_columns(picks, fields):
+    """Splits and checks picks given as a structured or 2-D array.
+
+    Parameters
+    ----------
+    picks : array_like
+        Either a structured array with (at least) the fields ``fields``,
+        or a 2-D array with one column per field, in that order.
+    fields : tuple of str
+        The fixed fields of the picks, the first one being the depth.
+
+    Returns
+    -------
+    columns : dict
+        Maps each field to a float64 array.
+    extras : dict
+        Maps the other fields of a structured array to their arrays.
+
+    Raises
+    ------
+    ValueError
+        If a field is missing or a value is not finite or out of range.
+    """
+    picks = np.asarray(picks)
+    if picks.dtype.names:
+        missing = [name for name in fields if name not in picks.dtype.names]
+        if missing:
+            raise ValueError(f"The picks have no {', '.join(missing)} field")
+        columns = {name: np.asarray(picks[name], np.float64).ravel() for name in fields}
+        extras = {name: np.asarray(picks[name]).ravel() for name in picks.dtype.names if name not in fields}
+    else:
+        array = np.asarray(picks, np.float64)
+        if array.size == 0:
+            array = array.reshape(0, len(fields))
+        if array.ndim != 2 or array.shape[1] != len(fields):
+            raise ValueError(f"Expected an array of shape (n, {len(fields)}) with columns {', '.join(fields)}")
+        columns = {name: array[:, i] for i, name in enumerate(fields)}
+        extras = {}
+    for name, values in columns.items():
+        if not np.isfinite(values).all():
+            raise ValueError(f"The {name} of the picks must be finite")
+        low, high = _PICK_RANGES.get(name, (0.0, np.inf) if name in _NON_NEGATIVE_PICK_FIELDS else (-np.inf, np.inf))
+        bad = (values < low) | (values > high)
+        if bad.any():
+            raise ValueError(f"{name} {values[bad][0]:g} of pick {np.flatnonzero(bad)[0]} is outside "
+                             f"[{low:g}, {high:g}]")
+    return columns, extras
+
+
+def duplicate_picks(existing, depths, tolerance):
+    """Finds the picks lying within a depth tolerance of another pick.
+
+    A pick is a duplicate if it lies within ``tolerance`` of an existing pick
+    or of a pick with a smaller depth (or the same depth and a smaller
+    index) in ``depths``. Runs in O(n log n).
+
+    Parameters
+    ----------
+    existing : array_like
+        The depths of the picks already in the log.
+    depths : array_like
+        The depths of the new picks.
+    tolerance : float
+        The depth tolerance, in current depth units.
+
+    Returns
+    -------
+    numpy.ndarray
+        The sorted indices into ``depths`` of the duplicates.
+    """
+    depths = np.asarray(depths, np.float64)
+    duplicate = np.zeros(len(depths), bool)
+    existing = np.sort(np.asarray(existing, np.float64))
+    if len(existing) and len(depths):
+        position = np.searchsorted(existing, depths)
+        below = existing[np.maximum(position - 1, 0)]
+        above = existing[np.minimum(position, len(existing) - 1)]
+        nearest = np.minimum(np.abs(depths - below), np.abs(depths - above))
+        duplicate |= nearest <= tolerance
+    order = np.argsort(depths, kind="stable")
+    duplicate[order[1:]] |= np.diff(depths[order]) <= tolerance
+    return np.flatnonzero(duplicate)
+
+
+def iter_row_windows(rows, depth_step, overlap=0.0, null_value=None, masked=False):
+    """Groups a stream of DataTable rows into depth windows.
+
+    Only the rows of the current window are held in memory, so the peak
+    memory use depends on the window size and not on the number of rows.
+
+    Parameters
+    ----------
+    rows : iterable of sequences
+        The rows, sorted from top to bottom, with the depth in the first
+        cell. Rows whose depth is not a number (e.g. header rows) are
+        skipped.
+    depth_step : float
+        The depth range of new data in each window. The first window starts
+        at the depth of the first row.
+    overlap : float, optional
+        The depth range of the previous window repeated at the top of each
+        window.
+    null_value : float, optional
+        If given, values equal to it are replaced by NaN or masked.
+    masked : bool, optional
+        Whether to mask null values instead of setting them to NaN.
+
+    Yields
+    ------
+    depths : numpy.ndarray
+        The depths of the rows in the window.
+    values : numpy.ndarray or numpy.ma.MaskedArray
+        The values of the rows, 1-D for tables with a single value column and
+        of shape ``(len(depths), number of value columns)`` otherwise.
+    """
+    if not depth_step > 0:
+        raise ValueError("depth_step must be greater than zero")
+    if overlap < 0:
+        raise ValueError("overlap must not be negative")
+    window, window_end = [], None
+    for row in rows:
+        depth = _to_float(row[0])
+        if np.isnan(depth):
+            continue
+        if window_end is None:
+            window_end = depth + depth_step
+        elif depth >= window_end:
+            if window:
+                yield _window_arrays(window, null_value, masked)
+            start = window_end + np.floor((depth - window_end) / depth_step) * depth_step
+            window = [r for r in window if r[0] >= start - overlap]
+            window_end = start + depth_step
+        window.append([depth] + [_to_float(cell) for cell in row[1:]])
+    if window:
+        yield _window_arrays(window, null_value, masked)
+
+
+def _window_arrays(window, null_value, masked):
+    array = np.array(window, np.float64)
+    depths = np.ascontiguousarray(array[:, 0])
+    values = np.ascontiguousarray(array[:, 1] if array.shape[1] == 2 else array[:, 1:])
+    if null_value is not None:
+        values = apply_null(values, null_value, masked)
+    return depths, values
+
+
+def depth_grid(depth_arrays, step=None):
+    """Builds a shared depth index for several logs.
+
+    Parameters
+    ----------
+    depth_arrays : list of numpy.ndarray
+        The sorted depths of each log.
+    step : float, optional
+        If given, the grid is regular with this step, from the top-most to
+        the bottom-most depth. Otherwise it is the union of all depths.
+
+    Returns
+    -------
+    numpy.ndarray
+        The sorted depths of the grid.
+    """
+    depth_arrays = [depths for depths in depth_arrays if len(depths)]
+    if not depth_arrays:
+        return np.empty(0)
+    if step is None:
+        return np.unique(np.concatenate(depth_arrays))
+    if not step > 0:
+        raise ValueError("step must be greater than zero")
+    top = min(depths[0] for depths in depth_arrays)
+    bottom = max(depths[-1] for depths in depth_arrays)
+    return top + np.arange(int(np.floor((bottom - top) / step + 1e-9)) + 1) * step
+
+
+def align(depths, values, grid, method="nearest"):
+    """Resamples the values of a log onto a depth grid.
+
+    Grid depths above the top or below the bottom of the log are set to NaN.
+
+    Parameters
+    ----------
+    depths : numpy.ndarray
+        The sorted depths of the log.
+    values : numpy.ndarray
+        The values of the log, with NaN for missing data.
+    grid : numpy.ndarray
+        The sorted depths to resample onto.
+    method : {"nearest", "linear"}, optional
+        Take the value of the nearest sample, or interpolate linearly between
+        the two neighbouring samples.
+
+    Returns
+    -------
+    numpy.ndarray
+        The values at the grid depths.
+    """
+    result = np.full(len(grid), np.nan)
+    if not len(depths):
+        return result
+    inside = (grid >= depths[0]) & (grid <= depths[-1])
+    points = grid[inside]
+    if method == "linear":
+        result[inside] = np.interp(points, depths, values)
+    elif method == "nearest":
+        below = np.clip(np.searchsorted(depths, points, side="right") - 1, 0, len(depths) - 1)
+        above = np.minimum(below + 1, len(depths) - 1)
+        nearest = np.where(depths[above] - points < points - depths[below], above, below)
+        result[inside] = values[nearest]
+    else:
+        raise ValueError(f"Unknown method {method!r}, expected 'nearest' or 'linear'")
+    return result
@@ -0,0 +1,205 @@
+import importlib
+import os
+
+_BACKENDS = {
+    "pywin32": ("._pywin32_backend", "Pywin32Backend"),
+    "memory": ("._memory_backend", "MemoryBackend"),
+}
+
+_current = None
+
+
+class Backend:
+    """The interface ``DispatchWrapper`` uses to talk to a COM server.
+
+    A backend knows how to create the top level WellCAD server object, how to
+    recognise the dispatch objects the server hands back and how to prepare a
+    dispatch object for use by a wrapper class. Everything else, i.e. property
+    gets, puts and method invocations, is done with plain attribute access on
+    the dispatch objects themselves, so a backend only has to produce objects
+    that behave like a ``pywin32`` dynamic dispatch.
+
+    Two implementations are provided:
+
+    * ``"pywin32"`` drives a real WellCAD instance through ``win32com``.
+    * ``"memory"`` is a pure Python stand-in for WellCAD that keeps all
+      documents in memory (see :class:`MemoryBackend`).
+    """
+
+    #: str: The name the backend is registered under.
+    name = None
+
+    def create_dispatch(self, prog_id, new_instance=False):
+        """Creates (or attaches to) the server object for a ProgID.
+
+        Parameters
+        ----------
+        prog_id : str
+            The ProgID of the server object, e.g. ``"WellCAD.Application"``.
+        new_instance : bool, optional
+            If True, always start a new server process instead of attaching
+            to a running one.
+
+        Returns
+        -------
+        object
+            The dispatch object of the server.
+        """
+        raise NotImplementedError
+
+    def initialize_thread(self):
+        """Prepares the calling thread for COM calls.
+
+        Called by threads started by ``wellcad.com`` before they create or use
+        any dispatch object. The default implementation does nothing.
+        """
+
+    def uninitialize_thread(self):
+        """Releases what :meth:`initialize_thread` set up for the calling
+        thread. The default implementation does nothing."""
+
+    def is_dispatch(self, obj):
+        """Checks whether an object is a dispatch object of this backend.
+
+        Returns
+        -------
+        bool
+            True if ``obj`` can be wrapped by a ``DispatchWrapper``.
+        """
+        raise NotImplementedError
+
+    def interface_key(self, dispatch):
+        """Returns a hashable key identifying the interface of a dispatch.
+
+        Objects with the same key share the same member ids, which allows
+        resolved names to be cached.
+        """
+        return None
+
+    def identity_key(self, dispatch):
+        """Returns a hashable key identifying the server object behind a
+        dispatch.
+
+        Dispatch objects for the same server object must return equal keys,
+        so that they share one wrapper object. The default implementation
+        returns None, in which case every dispatch gets its own wrapper.
+
+        Parameters
+        ----------
+        dispatch : object
+            The dispatch object.
+
+        Returns
+        -------
+        object or None
+            The identity of the server object, or None if it is not known.
+        """
+        return None
+
+    def is_method(self, dispatch, name):
+        """Checks whether a member of a dispatch object is a method.
+
+        The default implementation returns False, in which case a member is
+        treated as a method once looking it up returns a callable. That first
+        lookup goes through the property get hooks (see
+        :class:`wellcad.com._hooks.DispatchHook`), so backends should answer
+        from the type information of the server where they can.
+
+        Parameters
+        ----------
+        dispatch : object
+            The dispatch object.
+        name : str
+            The name of the member.
+
+        Returns
+        -------
+        bool
+            True if ``name`` is known to be a method rather than a property.
+        """
+        return False
+
+    def resolve_names(self, dispatch, names):
+        """Resolves member names on a dispatch object.
+
+        Parameters
+        ----------
+        dispatch : object
+            The dispatch object to resolve the names on.
+        names : iterable of str
+            The member names to resolve.
+
+        Returns
+        -------
+        dict
+            Maps each name that exists on the dispatch object to an opaque
+            entry that can be passed to :meth:`register_names`. Names that do
+            not exist in this version of the server are left out.
+        """
+        raise NotImplementedError
+
+    def register_names(self, dispatch, methods, attributes):
+        """Registers previously resolved names with a dispatch object.
+
+        Parameters
+        ----------
+        dispatch : object
+            The dispatch object to register the names with.
+        methods : dict
+            Resolved entries for names that must be treated as methods.
+        attributes : dict
+            Resolved entries for names that must be treated as properties.
+        """
+        raise NotImplementedError
+
+
+def get_backend():
+    """Gets the COM backend used by ``wellcad.com``.
+
+    Unless one has been chosen with :func:`set_backend`, the backend is
+    picked the first time it is needed: the ``WELLCAD_COM_BACKEND``
+    environment variable is used if it is set, otherwise ``"pywin32"``.
+
+    Returns
+    -------
+    Backend
+        The active backend.
+    """
+    global _current
+    if _current is None:
+        _current = _create_backend(os.environ.get("WELLCAD_COM_BACKEND", "pywin32"))
+    return _current
+
+
+def set_backend(backend):
+    """Chooses the COM backend used by ``wellcad.com``.
+
+    Wrapper objects created with the previous backend should not be used
+    after switching.
+
+    Parameters
+    ----------
+    backend : Backend or str or None
+        A backend instance, the name of a registered backend (``"pywin32"``
+        or ``"memory"``), or None to go back to picking the default backend.
+
+    Returns
+    -------
+    Backend or None
+        The new active backend.
+    """
+    global _current
+    if isinstance(backend, str):
+        backend = _create_backend(backend)
+    _current = backend
+    return _current
+
+
+def _create_backend(name):
+    try:
+        module_name, class_name = _BACKENDS[name]
+    except KeyError:
+        raise ValueError(f"Unknown COM backend {name!r}, expected one of {', '.join(_BACKENDS)}") from None
+    module = importlib.import_module(module_name, __package__)
+    return getattr(module, class_name)()
+
@@ -1,14 +1,19 @@
 from ._dispatch_wrapper import DispatchWrapper
-from ._log import Log
-from ._depth import Depth
-from ._header import Header
-from ._title import Title
-from ._page import Page
-from ._workspace import Workspace
-from ._odbc import Odbc
+from ._lazy import lazy_import
+from . import _depth_index
+
+lazy_import(globals(), "._log", "Log")
+lazy_import(globals(), "._depth", "Depth")
+lazy_import(globals(), "._header", "Header")
+lazy_import(globals(), "._title", "Title")
+lazy_import(globals(), "._page", "Page")
+lazy_import(globals(), "._workspace", "Workspace")
+lazy_import(globals(), "._odbc", "Odbc")
 
 
 class Borehole(DispatchWrapper):
+    __slots__ = ()
+
     _DISPATCH_METHODS = ("Log", "ApplyStructureTrueToApparentCorrection", "ApplyStructureApparentToTrueCorrection",
                          "RemoveStructuralDip", "ExtractStructureIntervalStatistic", "ColorClassification",
                          "RepresentativePicks", "ImageComplexityMap", "NormalizeImage", "OrientImageToNorth",
@@ -21,6 +26,8 @@ class Borehole(DispatchWrapper):
                          "CalculateApparentMetalLoss", "GetLog", "CreateNewWorkspace",  "Workspace", "FileExport",
                          "ConvertLogTo", "FilterLog", "ResampleLog", "InterpolateLog", "ElogCorrection",
                          "NMRFluidVolumes", "ROPAverage", "SharpenRGBLog", "RetinexFilterRGBLog", )
+    _QUERY_METHODS = ("Log", "Title", "Workspace", "CheckFormula", "FileExport", "RefreshWindow", "ShowWindow",
+                      "MinimizeWindow", "MaximizeWindow")
 
     @property
     def name(self):
@@ -92,6 +99,69 @@ class Borehole(DispatchWrapper):
         """
         self._dispatch.SetDraftMode(display_mode)
 
+    def bulk_edit(self, draft=True, restore_mode=0):
+        """Suspends the redrawing of the document inside a ``with`` block.
+
+        Auto update is turned off and the document is switched to draft mode
+        for the duration of the block. When the block is left, even through
+        an exception, the previous auto update status and the view mode are
+        restored and the view is refreshed exactly once.
+
+        Parameters
+        ----------
+        draft : bool, optional
+            Whether to switch to draft mode inside the block. Defaults to
+            True.
+        restore_mode : int, optional
+            The view mode set when leaving the block (see
+            :meth:`set_draft_mode`), since WellCAD does not report the
+            current one. Defaults to 0 (Page Layout).
+
+        Returns
+        -------
+        BulkEdit
+            The context manager. Once the block has been left, its
+            ``elapsed`` attribute holds the time spent in the block and its
+            ``com_calls`` and ``calls`` attributes the COM calls made.
+
+        Example
+        -------
+        >>> with borehole.bulk_edit() as edit:
+        ...     for i in range(borehole.nb_of_logs):
+        ...         borehole.get_log(i).pen_width = 2
+        >>> edit
+        BulkEdit(41 COM calls, 0.012 s)
+        """
+        from ._bulk_edit import BulkEdit
+        return BulkEdit(self, draft, restore_mode)
+
+    def cached(self):
+        """Caches property reads of the wrapper objects inside a ``with`` block.
+
+        Within the block, each property of a wrapper object (e.g. the
+        ``name``, ``type`` or ``top_depth`` of a log) is read from WellCAD once
+        and then answered from the cache. The cache is emptied by property
+        puts and by processing methods, so it is safe to modify the document
+        inside the block. Note that the cache applies to all wrapper objects,
+        not just the ones of this borehole, and that changes made in WellCAD
+        itself while the block runs are not seen.
+
+        Returns
+        -------
+        PropertyCache
+            The cache, to be used as a context manager. Its ``cache_info`` and
+            ``hit_rates`` methods report per class statistics.
+
+        Example
+        -------
+        >>> with borehole.cached() as cache:
+        ...     names = [borehole.get_log(i).name for i in range(borehole.nb_of_logs)]
+        >>> cache.hit_rates()
+        {'Borehole': 0.95, 'Log': 0.0}
+        """
+        from ._property_cache import PropertyCache
+        return PropertyCache()
+
     def minimize_window(self):
         """Shrinks the document window to an icon.
 
@@ -469,6 +539,93 @@ class Borehole(DispatchWrapper):
         """
         return Log(self._dispatch.GetLog(index_or_name))
 
+    def to_frame(self, logs=None, step=None, method="nearest", threaded=False):
+        """Gathers the data of several logs into a table on a shared depth index.
+
+        Each log is fetched once with a single ``data_table`` call, and the
+        logs are aligned onto a common depth index with vectorized
+        interpolation. Requires NumPy. Returns a pandas DataFrame if pandas
+        is installed, otherwise a dict of NumPy arrays.
+
+        Parameters
+        ----------
+        logs : list of int, str or Log, optional
+            The logs to include, as indices, names or Log objects. By default
+            all Well, Formula, Mud and Depth Logs of the borehole.
+        step : float, optional
+            The step of a regular depth index from the top-most to the
+            bottom-most sample, in current depth units. By default the index
+            is the union of the sample depths of all logs.
+        method : {"nearest", "linear"}, optional
+            Take the value of the nearest sample of each log, or interpolate
+            linearly between samples. Depths outside a log are always NaN.
+        threaded : bool, optional
+            If True, the logs are converted and aligned on a worker thread
+            while the next log is being fetched from WellCAD. All COM calls
+            stay on the calling thread.
+
+        Returns
+        -------
+        pandas.DataFrame or dict
+            One column of float64 values per log, named after the log, with
+            null values set to NaN. The DataFrame is indexed by depth. The
+            dict holds the depths under the key ``"Depth"``.
+
+        Example
+        -------
+        >>> frame = borehole.to_frame(["GR", "DEN"], step=0.1, method="linear")
+        >>> frame["GR"].mean()
+        63.2
+        """
+        from ._arrays import log_to_numpy, depth_grid, align
+
+        def convert(table, null_value):
+            depths, values = log_to_numpy(table, null_value)
+            if depths.ndim != 1:
+                raise ValueError("Only Well, Formula, Mud and Depth Logs can be aligned")
+            return depths, values
+
+        if method not in ("nearest", "linear"):
+            raise ValueError(f"Unknown method {method!r}, expected 'nearest' or 'linear'")
+        if logs is None:
+            logs = [log for log in map(self.get_log, range(self.nb_of_logs)) if log.type in (1, 2, 3, 17)]
+        else:
+            logs = [log if isinstance(log, DispatchWrapper) else self._get_existing_log(log) for log in logs]
+        names = self._unique_log_names(log.name for log in logs)
+
+        if threaded:
+            import concurrent.futures
+            with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+                futures = [executor.submit(convert, log.data_table, log.null_value) for log in logs]
+                arrays = [future.result() for future in futures]
+        else:
+            arrays = [convert(log.data_table, log.null_value) for log in logs]
+
+        grid = depth_grid([depths for depths, values in arrays], step)
+        columns = {name: align(depths, values, grid, method) for name, (depths, values) in zip(names, arrays)}
+        try:
+            import pandas
+        except ImportError:
+            return {"Depth": grid, **columns}
+        return pandas.DataFrame(columns, index=pandas.Index(grid, name="Depth"))
+
+    def _get_existing_log(self, index_or_name):
+        log = self.get_log(index_or_name)
+        if log is None:
+            raise ValueError(f"The borehole has no log {index_or_name!r}")
+        return log
+
+    @staticmethod
+    def _unique_log_names(names):
+        unique, seen = [], {"Depth"}
+        for name in names:
+            candidate, count = name, 1
+            while candidate in seen:
+                candidate, count = f"{name}_{count}", count + 1
+            seen.add(candidate)
+            unique.append(candidate)
+        return unique
+
     def title(self, name):
         """Gets the title object for the specified name.
 
@@ -691,6 +848,7 @@ class Borehole(DispatchWrapper):
             The title or the zero based index of the log to remove.
         """
         self._dispatch.ClearLogContents(log)
+        _depth_index.invalidate_all()
 
     def apply_template(self, path, prompt_if_not_found=None, create_new_logs=None, create_new_layers=None,
                        apply_annotation_settings=None, replace_header=None, keep_charts=None, new_charts=None,
@@ -752,6 +910,7 @@ class Borehole(DispatchWrapper):
             If set to TRUE (default) the original log will be kept in the document.
         """
         self._dispatch.SliceLog(log, slice_depth, create_top, create_bottom, keep_original)
+        _depth_index.invalidate_all()
 
     def merge_logs(self, log_a, log_b, ave_overlap=None, create_new=None):
         """Merges the data of the two specified logs.
@@ -770,6 +929,7 @@ class Borehole(DispatchWrapper):
             If set to False log_b will be pushed into log_a and the log_b will be removed
         """
         self._dispatch.MergeLogs(log_a, log_b, ave_overlap, create_new)
+        _depth_index.invalidate_all()
 
     def merge_same_log_items(self, log):
         """Merges consecutive data intervals of same litho codes, text or data within the specified log.
@@ -781,6 +941,7 @@ class Borehole(DispatchWrapper):
             The title or the zero based index of the log.
         """
         self._dispatch.MergeSameLogItems(log)
+        _depth_index.invalidate_all()
 
     def extend_log(self, log, top_depth, bottom_depth):
         """Extends the allocated depth range of Well, Formula and Analysis Logs.
@@ -795,6 +956,7 @@ class Borehole(DispatchWrapper):
             The new bottom depth of the log in units of the current depth axis.
         """
         self._dispatch.ExtendLog(log, top_depth, bottom_depth)
+        _depth_index.invalidate_all()
 
     def depth_shift_log(self, log, shift, top_depth=None, bottom_depth=None):
         """Allows the depth shifting of the log's data by the specified amount.
@@ -816,6 +978,7 @@ class Borehole(DispatchWrapper):
             If not provided, this is the current bottom depth of the log
         """
         self._dispatch.DepthShiftLog(log, shift, top_depth, bottom_depth)
+        _depth_index.invalidate_all()
 
     def depth_match_log(self, log=None, depth_log=None):
         """Depth matches the specified log using the links created from the specified depth_log (i.e. a shift table).
@@ -830,6 +993,7 @@ class Borehole(DispatchWrapper):
             If not provided, the Depth Matcher dialog box will be displayed.
         """
         self._dispatch.DepthMatchLog(log, depth_log)
+        _depth_index.invalidate_all()
 
     def fill_log(self, log, top_depth, bottom_depth, step, thickness, user_defined_intervals=None, interval_log=None):
         """Fill a Cross-section Log or a Polar & Rose Log with intervals automatically.
@@ -852,6 +1016,7 @@ class Borehole(DispatchWrapper):
             The title or the zero based index of the log containing the reference intervals.
         """
         self._dispatch.FillLog(log, top_depth, bottom_depth, step, thickness, user_defined_intervals, interval_log)
+        _depth_index.invalidate_all()
 
     def filter_log(self, log, prompt_user=None, config=None):
         """Calculates a new filtered data set of a Well Log.
@@ -888,7 +1053,9 @@ class Borehole(DispatchWrapper):
         Log
             An object of the filtered log.
         """
-        return Log(self._dispatch.FilterLog(log, prompt_user, config))
+        output = Log(self._dispatch.FilterLog(log, prompt_user, config))
+        _depth_index.invalidate_all()
+        return output
 
     def block_log(self, log=None, prompt_user=None, config=None):
         """Calculates statistical values for each depth interval determined from a
@@ -941,6 +1108,7 @@ class Borehole(DispatchWrapper):
                 EmptyIntervalMode = Interpolate / Maximum / Minimum / Null
         """
         self._dispatch.BlockLog(log, prompt_user, config)
+        _depth_index.invalidate_all()
 
     def extract_well_log_statistics(self, logs=None, prompt_user=None, config=None):
         """Extracts minimum, maximum, average, median and other statistical values fulfilling
@@ -987,6 +1155,7 @@ class Borehole(DispatchWrapper):
                 OneOutputlogPerImageLog = yes / no
         """
         self._dispatch.ExtractWellLogStatistics(logs, prompt_user, config)
+        _depth_index.invalidate_all()
 
     def normalize(self, log=None, prompt_user=None, config=None):
         """Normalizes the data in a Percentage or Analysis Log.
@@ -1013,6 +1182,7 @@ class Borehole(DispatchWrapper):
                 At100=yes
         """
         self._dispatch.Normalize(log, prompt_user, config)
+        _depth_index.invalidate_all()
 
     def tvd(self, log=None, prompt_user=None, config=None):
         """Calculates a TVD either from another TVD log (Depth Log) or from a tilt log (Well Log).
@@ -1042,7 +1212,9 @@ class Borehole(DispatchWrapper):
         Log
             The newly created Log containing the TVD data.
         """
-        return Log(self._dispatch.TVD(log, prompt_user, config))
+        output = Log(self._dispatch.TVD(log, prompt_user, config))
+        _depth_index.invalidate_all()
+        return output
 
     def rop_average(self, log=None, prompt_user=None, config=None):
         """Computes the average rate of penetration over specified depth intervals
@@ -1080,7 +1252,9 @@ class Borehole(DispatchWrapper):
         Log
             The newly created Log.
         """
-        return Log(self._dispatch.ROPAverage(log, prompt_user, config))
+        output = Log(self._dispatch.ROPAverage(log, prompt_user, config))
+        _depth_index.invalidate_all()
+        return output
 
     def unit_conversion(self, log=None, prompt_user=None, config=None):
         """Converts the units used in a log.
@@ -1109,6 +1283,7 @@ class Borehole(DispatchWrapper):
                 CreateNewLogs=yes/no
         """
         self._dispatch.UnitConversion(log, prompt_user, config)
+        _depth_index.invalidate_all()
 
     def zonation(self, logs=None, prompt_user=None, config=None):
         """Splits log data into zones.
@@ -1138,6 +1313,7 @@ class Borehole(DispatchWrapper):
                 UseLithoLogAsOutput = yes/no
         """
         self._dispatch.Zonation(logs, prompt_user, config)
+        _depth_index.invalidate_all()
 
     def resample_log(self, log, prompt_user=None, config=None):
         """Resamples a data set according to a new constant sampling rate or sample point
@@ -1173,7 +1349,9 @@ class Borehole(DispatchWrapper):
                 RadialSamplingFactor = 1
                 RadialDownSampling = yes / no
         """
-        return Log(self._dispatch.ResampleLog(log, prompt_user, config))
+        resampled = Log(self._dispatch.ResampleLog(log, prompt_user, config))
+        _depth_index.invalidate_all()
+        return resampled
 
     def interpolate_log(self, log, prompt_user=None, config=None):
         """Allows the interpolation of Mud and Well Log data to close no data gaps in a data set.
@@ -1203,7 +1381,9 @@ class Borehole(DispatchWrapper):
         Log
             An object of the interpolated log.
         """
-        return Log(self._dispatch.InterpolateLog(log, prompt_user, config))
+        output = Log(self._dispatch.InterpolateLog(log, prompt_user, config))
+        _depth_index.invalidate_all()
+        return output
 
     def auto_joint_detection(self, log, prompt_user=None, config=None):
         """Detects the joints from the main log (data source) used
@@ -1232,6 +1412,7 @@ class Borehole(DispatchWrapper):
                 TopAndBottom = yes
         """
         self._dispatch.AutoJointDetection(log, prompt_user, config)
+        _depth_index.invalidate_all()
 
     def calculate_borehole_deviation(self, prompt_user=None, config=None):
         """Calculates borehole Azimuth, RBR and Tilt from magnetometer and inclinometer / accelerometer data.
@@ -1268,6 +1449,7 @@ class Borehole(DispatchWrapper):
                 MarkerPosition = 182.5
         """
         self._dispatch.CalculateBoreholeDeviation(prompt_user, config)
+        _depth_index.invalidate_all()
 
     def calculate_borehole_volume(self, prompt_user=None, config=None):
         """Calculates the volume of an entire hole or annulus (e.g. between casing and borehole wall)
@@ -1363,6 +1545,7 @@ class Borehole(DispatchWrapper):
                 BottomDepth = 123.5
         """
         self._dispatch.CalculateBoreholeVolume(prompt_user, config)
+        _depth_index.invalidate_all()
 
     def calculate_borehole_coordinates(self, prompt_user=None, config=None):
         """Calculates the deviation path coordinates Northing, Easting and TVD.
@@ -1397,6 +1580,7 @@ class Borehole(DispatchWrapper):
                 TiltError = 0.1
         """
         self._dispatch.CalculateBoreholeCoordinates(prompt_user, config)
+        _depth_index.invalidate_all()
 
     def calculate_borehole_closure(self, prompt_user=None, config=None):
         """Calculates the deviation path closure distance, closure angle and DLS.
@@ -1425,6 +1609,7 @@ class Borehole(DispatchWrapper):
                 EastingLog = EAST
         """
         self._dispatch.CalculateBoreholeClosure(prompt_user, config)
+        _depth_index.invalidate_all()
 
     def elog_correction(self, prompt_user=None, config=None):
         """Applies the environmental corrections for normal resisitivity data.
@@ -1467,7 +1652,9 @@ class Borehole(DispatchWrapper):
         Log
             An object of the last corrected log.
         """
-        return Log(self._dispatch.ElogCorrection(prompt_user, config))
+        output = Log(self._dispatch.ElogCorrection(prompt_user, config))
+        _depth_index.invalidate_all()
+        return output
 
     def correct_bad_traces(self, log=None):
         """Replaces NULL data traces in Image, RGB and FWS logs.
@@ -1480,6 +1667,7 @@ class Borehole(DispatchWrapper):
             displaying a list of available logs will be displayed.
         """
         self._dispatch.CorrectBadTraces(log)
+        _depth_index.invalidate_all()
 
     def stack_traces(self, is_spectrum=None, log=None, prompt_user=None, config=None):
         """Stacks multiple FWS traces to create and average trace.
@@ -1510,7 +1698,9 @@ class Borehole(DispatchWrapper):
             The resulting log.
         """
 
-        return Log(self._dispatch.StackTraces(is_spectrum, log, prompt_user, config))
+        output = Log(self._dispatch.StackTraces(is_spectrum, log, prompt_user, config))
+        _depth_index.invalidate_all()
+        return output
 
     def slice_traces(self, log=None, prompt_user=None, config=None):
         """Allows the user to keep only a portion of a FWS log's traces. Updates the log in place.
@@ -1539,6 +1729,7 @@ class Borehole(DispatchWrapper):
         """
 
         self._dispatch.SliceTraces(log, prompt_user, config)
+        _depth_index.invalidate_all()
 
     def apply_conditional_testing(self, log_if=None, log_then=None, prompt_user=None, config=None):
         """Applies conditional testing (If-Then-Else) to image log
@@ -1580,7 +1771,9 @@ class Borehole(DispatchWrapper):
         Log
             A newly created log.
         """
-        return Log(self._dispatch.ApplyConditionalTesting(log_if, log_then, prompt_user, config))
+        output = Log(self._dispatch.ApplyConditionalTesting(log_if, log_then, prompt_user, config))
+        _depth_index.invalidate_all()
+        return output
 
     def filter_image_log(self, log=None, prompt_user=None, config=None):
         """Average, median and clipping filter for image logs.
@@ -1615,7 +1808,9 @@ class Borehole(DispatchWrapper):
         Log
             The computed log.
         """
-        return Log(self._dispatch.FilterImageLog(log, prompt_user, config))
+        output = Log(self._dispatch.FilterImageLog(log, prompt_user, config))
+        _depth_index.invalidate_all()
+        return output
 
     def mirror_image(self, log=None):
         """Rearranges the data within an image log so that the data
@@ -1629,6 +1824,7 @@ class Borehole(DispatchWrapper):
             displaying a list of available logs will be displayed.
         """
         self._dispatch.MirrorImage(log)
+        _depth_index.invalidate_all()
 
     def rotate_image(self, log=None, prompt_user=None, config=None):
         """Rotate the image data by adding an angle (clockwise
@@ -1657,6 +1853,7 @@ class Borehole(DispatchWrapper):
                 RotateClockwise = yes / no
         """
         self._dispatch.RotateImage(log, prompt_user, config)
+        _depth_index.invalidate_all()
 
     def orient_image_to_highside(self, log=None, prompt_user=None, config=None):
         """Rotates an image log to high side according to the
@@ -1691,6 +1888,7 @@ class Borehole(DispatchWrapper):
                 MarkerPosition = 180.2
         """
         self._dispatch.OrientImageToHighside(log, prompt_user, config)
+        _depth_index.invalidate_all()
 
     def orient_image_to_north(self, log=None, prompt_user=None, config=None):
         """Rotates an image log to magnetic north according to the
@@ -1731,6 +1929,7 @@ class Borehole(DispatchWrapper):
                 MarkerPosition = 180.2
         """
         self._dispatch.OrientImageToNorth(log, prompt_user, config)
+        _depth_index.invalidate_all()
 
     def extract_image_log_statistics(self, log=None, prompt_user=None, config=None):
         """Extracts minimum, maximum, average, median and other
@@ -1784,6 +1983,7 @@ class Borehole(DispatchWrapper):
                 LogZonesDepthRange=Litho,06,05 (log name, interval code 1, interval code 2,...)
         """
         self._dispatch.ExtractImageLogStatistics(log, prompt_user, config)
+        _depth_index.invalidate_all()
 
     def normalize_image(self, log=None, prompt_user=None, config=None):
         """Applies Static or Dynamic normalization to image logs
@@ -1817,7 +2017,9 @@ class Borehole(DispatchWrapper):
         Log
             The normalized log.
         """
-        return Log(self._dispatch.NormalizeImage(log, prompt_user, config))
+        output = Log(self._dispatch.NormalizeImage(log, prompt_user, config))
+        _depth_index.invalidate_all()
+        return output
 
     def image_complexity_map(self, log=None, prompt_user=None, config=None):
         """Computes the complexity map from an RGB or image log.
@@ -1855,7 +2057,9 @@ class Borehole(DispatchWrapper):
         Log
             The computed log.
         """
-        return Log(self._dispatch.ImageComplexityMap(log, prompt_user, config))
+        output = Log(self._dispatch.ImageComplexityMap(log, prompt_user, config))
+        _depth_index.invalidate_all()
+        return output
 
     def apply_structure_apparent_to_true_correction(self, log=None, prompt_user=None, config=None):
         """Corrects the apparent azimuth and dip angles in a
@@ -1889,7 +2093,9 @@ class Borehole(DispatchWrapper):
         Log
             The corrected log.
         """
-        return Log(self._dispatch.ApplyStructureApparentToTrueCorrection(log, prompt_user, config))
+        output = Log(self._dispatch.ApplyStructureApparentToTrueCorrection(log, prompt_user, config))
+        _depth_index.invalidate_all()
+        return output
 
     def apply_structure_true_to_apparent_correction(self, log=None, prompt_user=None, config=None):
         """Recalculates the apparent azimuth and dip angles in a
@@ -1923,7 +2129,9 @@ class Borehole(DispatchWrapper):
         Log
             The computed log.
         """
-        return Log(self._dispatch.ApplyStructureTrueToApparentCorrection(log, prompt_user, config))
+        output = Log(self._dispatch.ApplyStructureTrueToApparentCorrection(log, prompt_user, config))
+        _depth_index.invalidate_all()
+        return output
 
     def recalculate_structure_azimuth(self, log=None, prompt_user=None, config=None):
         """Adds or subtracts a value from all Azimuth data within a
@@ -1956,6 +2164,7 @@ class Borehole(DispatchWrapper):
 
         """
         self._dispatch.RecalculateStructureAzimuth(log, prompt_user, config)
+        _depth_index.invalidate_all()
 
     def recalculate_structure_dip(self, log=None, prompt_user=None, config=None):
         """Correct the dip angle data within a structure log for new
@@ -1988,6 +2197,7 @@ class Borehole(DispatchWrapper):
 
         """
         self._dispatch.RecalculateStructureDip(log, prompt_user, config)
+        _depth_index.invalidate_all()
 
     def remove_structural_dip(self, log=None, prompt_user=None, config=None):
         """Removes a given regional dip and azimuth from the data in
@@ -2023,7 +2233,9 @@ class Borehole(DispatchWrapper):
         Log
             The computed log.
         """
-        return Log(self._dispatch.RemoveStructuralDip(log, prompt_user, config))
+        output = Log(self._dispatch.RemoveStructuralDip(log, prompt_user, config))
+        _depth_index.invalidate_all()
+        return output
 
     def extract_color_components(self, log=None, method=None, color_model=None, prompt_user=None):
         """Allows the extraction of color data from an RGB Log.
@@ -2057,6 +2269,7 @@ class Borehole(DispatchWrapper):
             default values will be used.
         """
         self._dispatch.ExtractColorComponents(log, method, color_model, prompt_user)
+        _depth_index.invalidate_all()
 
     def color_classification(self, log=None, prompt_user=None, config=None):
         """Builds color classes from an RGB Log based on user
@@ -2093,7 +2306,9 @@ class Borehole(DispatchWrapper):
             Returns an RGB Log or an Analysis Log depending on the configuration file.
             Returns the RGB Log if both options are selected.
         """
-        return Log(self._dispatch.ColorClassification(log, prompt_user, config))
+        output = Log(self._dispatch.ColorClassification(log, prompt_user, config))
+        _depth_index.invalidate_all()
+        return output
 
     def adjust_image_brightness_and_contrast(self, log=None, prompt_user=None):
         """Adjusts the brightness and contrast in RGB logs
@@ -2109,6 +2324,7 @@ class Borehole(DispatchWrapper):
             contrast values will be determined automatically.
         """
         self._dispatch.AdjustImageBrightnessAndContrast(log, prompt_user)
+        _depth_index.invalidate_all()
 
     def retinex_filter_rgb_log(self, log=None, prompt_user=None, config=None):
         """Applies a retinex filter to the RGB log.
@@ -2136,7 +2352,9 @@ class Borehole(DispatchWrapper):
             The computed log.
         """
 
-        return Log(self._dispatch.RetinexFilterRGBLog(log, prompt_user, config))
+        output = Log(self._dispatch.RetinexFilterRGBLog(log, prompt_user, config))
+        _depth_index.invalidate_all()
+        return output
 
     def sharpen_rgb_log(self, log=None, prompt_user=None, config=None):
         """Sharpens the RGB log.
@@ -2164,7 +2382,9 @@ class Borehole(DispatchWrapper):
             The computed log.
         """
 
-        return Log(self._dispatch.SharpenRGBLog(log, prompt_user, config))
+        output = Log(self._dispatch.SharpenRGBLog(log, prompt_user, config))
+        _depth_index.invalidate_all()
+        return output
 
     def extract_structure_interval_statistic(self, log=None, prompt_user=None, config=None):
         """Allows determination of statistical values (e.g. frequency
@@ -2213,7 +2433,9 @@ class Borehole(DispatchWrapper):
         Log
             One of the computed log.
         """
-        return Log(self._dispatch.ExtractStructureIntervalStatistic(log, prompt_user, config))
+        output = Log(self._dispatch.ExtractStructureIntervalStatistic(log, prompt_user, config))
+        _depth_index.invalidate_all()
+        return output
 
     def rqd(self, log=None, prompt_user=None, config=None):
         """Computes the Rock Quality Designation from the structure
@@ -2256,7 +2478,9 @@ class Borehole(DispatchWrapper):
         Log
             The computed log.
         """
-        return Log(self._dispatch.RQD(log, prompt_user, config))
+        output = Log(self._dispatch.RQD(log, prompt_user, config))
+        _depth_index.invalidate_all()
+        return output
 
     def representative_picks(self, log=None, prompt_user=None, config=None):
         """Used to derive the most representative picks from a
@@ -2293,7 +2517,9 @@ class Borehole(DispatchWrapper):
         Log
             The computed log.
         """
-        return Log(self._dispatch.RepresentativePicks(log, prompt_user, config))
+        output = Log(self._dispatch.RepresentativePicks(log, prompt_user, config))
+        _depth_index.invalidate_all()
+        return output
 
     def correct_dead_sensor(self, log=None, prompt_user=None, config=None):
         """Corrects the Null and invalid data columns in Image logs.
@@ -2335,7 +2561,9 @@ class Borehole(DispatchWrapper):
         Log
             A log with the corrected data.
         """
-        return Log(self._dispatch.CorrectDeadSensor(log, prompt_user, config))
+        output = Log(self._dispatch.CorrectDeadSensor(log, prompt_user, config))
+        _depth_index.invalidate_all()
+        return output
 
     def shift_correction(self, log=None, prompt_user=None, config=None):
         """Corrects the drift of data (e.g. MFC) in Image logs.
@@ -2368,7 +2596,9 @@ class Borehole(DispatchWrapper):
         Log
             A log that has been corrected.
         """
-        return Log(self._dispatch.ShiftCorrection(log, prompt_user, config))
+        output = Log(self._dispatch.ShiftCorrection(log, prompt_user, config))
+        _depth_index.invalidate_all()
+        return output
 
     def calculate_fluid_velocity(self, log=None, prompt_user=None, config=None):
         """Estimates the fluid velocity from travel time measurements and given calibration points.
@@ -2413,7 +2643,9 @@ class Borehole(DispatchWrapper):
         Log
             A log giving the fluid velocity.
         """
-        return Log(self._dispatch.CalculateFluidVelocity(log, prompt_user, config))
+        output = Log(self._dispatch.CalculateFluidVelocity(log, prompt_user, config))
+        _depth_index.invalidate_all()
+        return output
 
     def centralize(self, log=None, prompt_user=None, config=None):
         """Corrects travel time or multi-finger-caliper data for de-centralization effects
@@ -2448,7 +2680,9 @@ class Borehole(DispatchWrapper):
         Log
             A log with the data corrected for decentralization.
         """
-        return Log(self._dispatch.Centralize(log, prompt_user, config))
+        output = Log(self._dispatch.Centralize(log, prompt_user, config))
+        _depth_index.invalidate_all()
+        return output
 
     def calculate_acoustic_caliper(self, log=None, prompt_user=None, config=None):
         """Calculates borehole radius and caliper values from acoustic travel time measurements.
@@ -2483,6 +2717,7 @@ class Borehole(DispatchWrapper):
                 ImageOutput  = yes / no
         """
         self._dispatch.CalculateAcousticCaliper(log, prompt_user, config)
+        _depth_index.invalidate_all()
 
     def calculate_casing_thickness(self, log=None, prompt_user=None, config=None):
         """Calculates thickness values for a casing pipe from acoustic thickness travel time measurements.
@@ -2515,6 +2750,7 @@ class Borehole(DispatchWrapper):
                 ImageOutput = yes / no
         """
         self._dispatch.CalculateCasingThickness(log, prompt_user, config)
+        _depth_index.invalidate_all()
 
     def cased_hole_ultrasonics(self, wavelet_log=None, zone_log=None, prompt_user=None, config=None):
         """Processes ultrasonic waveforms from a wavelet log using the processing parameters from a zone log.
@@ -2547,6 +2783,7 @@ class Borehole(DispatchWrapper):
                 Score = yes / no
         """
         self._dispatch.CasedHoleUltrasonics(wavelet_log, zone_log, prompt_user, config)
+        _depth_index.invalidate_all()
 
     def calculate_apparent_metal_loss(self, log=None, prompt_user=None, config=None):
         """Calculates an apparent metal loss value for each trace of radius values stored in an image log.
@@ -2579,7 +2816,9 @@ class Borehole(DispatchWrapper):
         Log
             A log giving the metal loss.
         """
-        return Log(self._dispatch.CalculateApparentMetalLoss(log, prompt_user, config))
+        output = Log(self._dispatch.CalculateApparentMetalLoss(log, prompt_user, config))
+        _depth_index.invalidate_all()
+        return output
 
     def calculate_apparent_metal_loss_ex(self, log=None, prompt_user=None, config=None):
         """Calculates an apparent metal loss value for each trace of radius/thickness values stored in an
@@ -2625,6 +2864,7 @@ class Borehole(DispatchWrapper):
                 LogZonesDepthRange = Litho,06,05#1
         """
         self._dispatch.CalculateApparentMetalLossEx(log, prompt_user, config)
+        _depth_index.invalidate_all()
 
     def radius_to_from_diameter(self, log=None, prompt_user=None, config=None):
         """Converts values data in an Image log from radius to diameter values or vice versa.
@@ -2653,7 +2893,9 @@ class Borehole(DispatchWrapper):
         Log
             A log giving diameter/radius.
         """
-        return Log(self._dispatch.RadiusToFromDiameter(log, prompt_user, config))
+        output = Log(self._dispatch.RadiusToFromDiameter(log, prompt_user, config))
+        _depth_index.invalidate_all()
+        return output
 
     def outer_inner_radius_diameter(self, log=None, prompt_user=None, config=None):
         """The process takes an Image, Well or Mud log as input and computes from radius/diameter
@@ -2687,7 +2929,9 @@ class Borehole(DispatchWrapper):
         Log
             A log giving the outer radius/diameter.
         """
-        return Log(self._dispatch.OuterInnerRadiusDiameter(log, prompt_user, config))
+        output = Log(self._dispatch.OuterInnerRadiusDiameter(log, prompt_user, config))
+        _depth_index.invalidate_all()
+        return output
 
     def cased_hole_normalization(self, log=None, prompt_user=None, config=None):
         """Subtracts the trace average, median, min, max or a custom value from all data points
@@ -2721,7 +2965,9 @@ class Borehole(DispatchWrapper):
         Log
             The resulting log.
         """
-        return Log(self._dispatch.CasedHoleNormalization(log, prompt_user, config))
+        output = Log(self._dispatch.CasedHoleNormalization(log, prompt_user, config))
+        _depth_index.invalidate_all()
+        return output
 
     def reverse_amplitude(self, log=None):
         """Inverts the amplitudes in a FWS log.
@@ -2734,6 +2980,7 @@ class Borehole(DispatchWrapper):
         """
 
         self._dispatch.ReverseAmplitude(log)
+        _depth_index.invalidate_all()
 
     def average_filter_fws_log(self, log=None, filter_width=None, filter_type=None):
         """Applies a moving average filter to the traces of an FWS log.
@@ -2757,7 +3004,9 @@ class Borehole(DispatchWrapper):
             The resulting log.
         """
 
-        return Log(self._dispatch.AverageFilterFWSLog(log, filter_width, filter_type))
+        output = Log(self._dispatch.AverageFilterFWSLog(log, filter_width, filter_type))
+        _depth_index.invalidate_all()
+        return output
 
     def freq_filter_fws_log(self, log, low_cut, low_pass, high_pass, high_cut):
         """Applies a frequency filter to the traces of an FWS log.
@@ -2781,7 +3030,9 @@ class Borehole(DispatchWrapper):
             Object of the filtered FWS log.
         """
 
-        return Log(self._dispatch.FreqFilterFwsLog(log, low_cut, low_pass, high_pass, high_cut))
+        output = Log(self._dispatch.FreqFilterFwsLog(log, low_cut, low_pass, high_pass, high_cut))
+        _depth_index.invalidate_all()
+        return output
 
     def apply_stand_off_correction(self, log=None, prompt_user=None, config=None):
         """Corrects intercept times for the stand-off of tool and formation.
@@ -2825,7 +3076,9 @@ class Borehole(DispatchWrapper):
             The resulting log.
         """
 
-        return Log(self._dispatch.ApplyStandOffCorrection(log, prompt_user, config))
+        output = Log(self._dispatch.ApplyStandOffCorrection(log, prompt_user, config))
+        _depth_index.invalidate_all()
+        return output
 
     def compensated_velocity(self, log=None, prompt_user=None, config=None):
         """Slowness or velocity computed from two receiver arrival times.
@@ -2864,7 +3117,9 @@ class Borehole(DispatchWrapper):
             The resulting log.
         """
 
-        return Log(self._dispatch.CompensatedVelocity(log, prompt_user, config))
+        output = Log(self._dispatch.CompensatedVelocity(log, prompt_user, config))
+        _depth_index.invalidate_all()
+        return output
 
     def apply_semblance_processing(self, prompt_user=None, config=None):
         """Performs a velocity analysis for the multiple receivers.
@@ -2912,7 +3167,9 @@ class Borehole(DispatchWrapper):
             The log containing the semblance results.
         """
 
-        return Log(self._dispatch.ApplySemblanceProcessing(prompt_user, config))
+        output = Log(self._dispatch.ApplySemblanceProcessing(prompt_user, config))
+        _depth_index.invalidate_all()
+        return output
 
     def process_reflected_tube_wave(self, log=None, prompt_user=None, config=None):
         """Extracts the cumulative energy from reflected tube wave arrivals.
@@ -2947,7 +3204,9 @@ class Borehole(DispatchWrapper):
             The resulting log containing the cumulative energy.
         """
 
-        return Log(self._dispatch.ProcessReflectedTubeWave(log, prompt_user, config))
+        output = Log(self._dispatch.ProcessReflectedTubeWave(log, prompt_user, config))
+        _depth_index.invalidate_all()
+        return output
 
     def pick_first_arrival(self, log=None, prompt_user=None, config=None):
         """Picks the first arrival time using the standard threshold or advanced method.
@@ -2992,7 +3251,9 @@ class Borehole(DispatchWrapper):
             The resulting log containing the first arrival times.
         """
 
-        return Log(self._dispatch.PickFirstArrival(log, prompt_user, config))
+        output = Log(self._dispatch.PickFirstArrival(log, prompt_user, config))
+        _depth_index.invalidate_all()
+        return output
 
     def cement_bond(self, log=None, prompt_user=None, config=None):
         """Determines the cement bond based on the Standard Gate Method.
@@ -3032,6 +3293,7 @@ class Borehole(DispatchWrapper):
         """
 
         self._dispatch.CementBond(log, prompt_user, config)
+        _depth_index.invalidate_all()
 
     def pick_e1_arrival(self, fws_log=None, dt_log=None, prompt_user=None, config=None):
         """Determines the arrival time of the E1 amplitude.
@@ -3065,7 +3327,9 @@ class Borehole(DispatchWrapper):
             The resulting log containing the E1 arrival times.
         """
 
-        return Log(self._dispatch.PickE1Arrival(fws_log, dt_log, prompt_user, config))
+        output = Log(self._dispatch.PickE1Arrival(fws_log, dt_log, prompt_user, config))
+        _depth_index.invalidate_all()
+        return output
 
     def extract_e1_amplitude(self, fws_log=None, arrival_log=None, prompt_user=None):
         """Uses the E1 arrival time to extract the E1 amplitude.
@@ -3086,7 +3350,9 @@ class Borehole(DispatchWrapper):
             The resulting log containing the E1 amplitude.
         """
 
-        return Log(self._dispatch.ExtractE1Amplitude(fws_log, arrival_log, prompt_user))
+        output = Log(self._dispatch.ExtractE1Amplitude(fws_log, arrival_log, prompt_user))
+        _depth_index.invalidate_all()
+        return output
 
     def adjust_pick_to_extremum(self, fws_log=None, arrival_log=None, prompt_user=None, config=None):
         """Adjusts the pick given in arrival_log to the next maximum or minimum amplitude in fws_log.
@@ -3120,7 +3386,9 @@ class Borehole(DispatchWrapper):
             Object of the log containing the pick times shifted to the nearest amplitude extremum.
         """
 
-        return Log(self._dispatch.AdjustPickToExtremum(fws_log, arrival_log, prompt_user, config))
+        output = Log(self._dispatch.AdjustPickToExtremum(fws_log, arrival_log, prompt_user, config))
+        _depth_index.invalidate_all()
+        return output
 
     def extract_window_peak_amplitude(self, log=None, prompt_user=None, config=None):
         """Extracts the maximum amplitude found in a time window of a FWS log trace.
@@ -3158,7 +3426,9 @@ class Borehole(DispatchWrapper):
             The resulting log containing the amplitude.
         """
 
-        return Log(self._dispatch.ExtractWindowPeakAmplitude(log, prompt_user, config))
+        output = Log(self._dispatch.ExtractWindowPeakAmplitude(log, prompt_user, config))
+        _depth_index.invalidate_all()
+        return output
 
     def calculate_mechanical_properties(self, p_slowness=None, s_slowness=None, density=None):
         """Computes a set of rock mechanical parameters from the input data.
@@ -3176,6 +3446,7 @@ class Borehole(DispatchWrapper):
         """
 
         self._dispatch.CalculateMechanicalProperties(p_slowness, s_slowness, density)
+        _depth_index.invalidate_all()
 
     def integrated_travel_time(self, log=None, prompt_user=None, config=None):
         """Computes the integrated travel time from slowness or velocity data.
@@ -3206,7 +3477,9 @@ class Borehole(DispatchWrapper):
             The resulting log containing the integrated times.
         """
 
-        return Log(self._dispatch.IntegratedTravelTime(log, prompt_user, config))
+        output = Log(self._dispatch.IntegratedTravelTime(log, prompt_user, config))
+        _depth_index.invalidate_all()
+        return output
 
     def bond_index(self, log=None, prompt_user=None, config=None):
         """Computes the bond index of the cement behind the casing.
@@ -3237,7 +3510,9 @@ class Borehole(DispatchWrapper):
             The resulting log containing the bond index.
         """
 
-        return Log(self._dispatch.BondIndex(log, prompt_user, config))
+        output = Log(self._dispatch.BondIndex(log, prompt_user, config))
+        _depth_index.invalidate_all()
+        return output
 
     def compressive_strength(self, log=None, prompt_user=None, config=None):
         """Computes the compressive strength of the cement behind a casing.
@@ -3269,7 +3544,9 @@ class Borehole(DispatchWrapper):
             The resulting log containing the compressive strength.
         """
 
-        return Log(self._dispatch.CompressiveStrength(log, prompt_user, config))
+        output = Log(self._dispatch.CompressiveStrength(log, prompt_user, config))
+        _depth_index.invalidate_all()
+        return output
 
     def apply_natural_gamma_borehole_correction(self, log=None, prompt_user=None, config=None):
         """Applies borehole corrections to FWS and Well logs
@@ -3311,7 +3588,9 @@ class Borehole(DispatchWrapper):
             A log containing the corrected count rates.
         """
 
-        return Log(self._dispatch.ApplyNaturalGammaBoreholeCorrection(log, prompt_user, config))
+        output = Log(self._dispatch.ApplyNaturalGammaBoreholeCorrection(log, prompt_user, config))
+        _depth_index.invalidate_all()
+        return output
 
     def apply_total_gamma_calibration(self, log=None, prompt_user=None, config=None):
         """Applies a calibration factor or equation to the values in the specified Well Log.
@@ -3341,7 +3620,9 @@ class Borehole(DispatchWrapper):
             A log containing the modified gamma values.
         """
 
-        return Log(self._dispatch.ApplyTotalGammaCalibration(log, prompt_user, config))
+        output = Log(self._dispatch.ApplyTotalGammaCalibration(log, prompt_user, config))
+        _depth_index.invalidate_all()
+        return output
 
     def calculate_spectrum_total_count(self, log=None, prompt_user=None, config=None):
         """Extracts the total count, min, max, average or median from each spectrum trace of the specified log
@@ -3376,6 +3657,7 @@ class Borehole(DispatchWrapper):
         """
 
         self._dispatch.CalculateSpectrumTotalCount(log, prompt_user, config)
+        _depth_index.invalidate_all()
 
     def spectrometric_ratios(self, log_a=None, log_b=None, log_c=None, prompt_user=None, config=None):
         """Computes spectrometric ratios like U/Th or U/k
@@ -3409,6 +3691,7 @@ class Borehole(DispatchWrapper):
         """
 
         self._dispatch.SpectrometricRatios(log_a, log_b, log_c, prompt_user, config)
+        _depth_index.invalidate_all()
 
     def process_medusa_spectrum_data(self, log_spectrum=None, log_time=None, prompt_user=None, config=None):
         """Performs a full spectrum analysis using a calibration after Medusa
@@ -3448,6 +3731,7 @@ class Borehole(DispatchWrapper):
                 ToolPosition = 0 (Alongside) / 1 (Centered)
                 """
         self._dispatch.ProcessMedusaSpectrumData(log_spectrum, log_time, prompt_user, config)
+        _depth_index.invalidate_all()
 
     def process_spectrum_data(self, log=None, prompt_user=None, config=None):
         """Performs a windows stripping based on a calibration model
@@ -3474,6 +3758,7 @@ class Borehole(DispatchWrapper):
         """
 
         self._dispatch.ProcessSpectrumData(log, prompt_user, config)
+        _depth_index.invalidate_all()
 
     def compute_gr(self, log_k=None, log_u=None, log_th=None, prompt_user=None, config=None):
         """Computes total gamma ray from K, U and Th isotope concentrations using the MEDUSA
@@ -3507,7 +3792,9 @@ class Borehole(DispatchWrapper):
             A log containing the gamma ray values.
         """
 
-        return Log(self._dispatch.ComputeGR(log_k, log_u, log_th, prompt_user, config))
+        output = Log(self._dispatch.ComputeGR(log_k, log_u, log_th, prompt_user, config))
+        _depth_index.invalidate_all()
+        return output
 
     def process_nmrsa_data(self, log=None, prompt_user=None, config=None):
         """Performs a post-processing of NMRSA's BMR tool raw data.
@@ -3540,6 +3827,7 @@ class Borehole(DispatchWrapper):
         """
 
         self._dispatch.ProcessNMRSAData(log, prompt_user, config)
+        _depth_index.invalidate_all()
 
     def nmr_total_porosity(self, log=None, prompt_user=None, config=None):
         """Computes the total porosity from a T2 distribution.
@@ -3576,7 +3864,9 @@ class Borehole(DispatchWrapper):
             The resulting log object
         """
 
-        return Log(self._dispatch.NMRTotalPorosity(log, prompt_user, config))
+        output = Log(self._dispatch.NMRTotalPorosity(log, prompt_user, config))
+        _depth_index.invalidate_all()
+        return output
 
     def nmr_permeability(self, log=None, prompt_user=None, config=None):
         """Computes the permeability from a T2 distribution.
@@ -3621,6 +3911,7 @@ class Borehole(DispatchWrapper):
         """
 
         self._dispatch.NMRPermeability(log, prompt_user, config)
+        _depth_index.invalidate_all()
 
     def nmr_fluid_volumes(self, log=None, prompt_user=None, config=None):
         """Computes the fluid volumes from a T2 distribution.
@@ -3658,7 +3949,9 @@ class Borehole(DispatchWrapper):
             The resulting log object
         """
 
-        return Log(self._dispatch.NMRFluidVolumes(log, prompt_user, config))
+        output = Log(self._dispatch.NMRFluidVolumes(log, prompt_user, config))
+        _depth_index.invalidate_all()
+        return output
 
     def water_salinity(self, log=None, prompt_user=None, config=None):
         """Salinity estimation from fluid conductivity.
@@ -3689,7 +3982,9 @@ class Borehole(DispatchWrapper):
             A log of the resulting salinity.
         """
 
-        return Log(self._dispatch.WaterSalinity(log, prompt_user, config))
+        output = Log(self._dispatch.WaterSalinity(log, prompt_user, config))
+        _depth_index.invalidate_all()
+        return output
 
     def water_resistivity(self, log=None, prompt_user=None, config=None):
         """Temperature correction for fluid conductivity or resistivity.
@@ -3723,7 +4018,9 @@ class Borehole(DispatchWrapper):
             A log of the corrected conductivity or resistivity.
         """
 
-        return Log(self._dispatch.WaterResistivity(log, prompt_user, config))
+        output = Log(self._dispatch.WaterResistivity(log, prompt_user, config))
+        _depth_index.invalidate_all()
+        return output
 
     def shale_volume(self, log=None, prompt_user=None, config=None):
         """Estimates the shale volume from Gamma Ray or SP data.
@@ -3765,7 +4062,9 @@ class Borehole(DispatchWrapper):
             A log of the resulting shale volume.
         """
 
-        return Log(self._dispatch.ShaleVolume(log, prompt_user, config))
+        output = Log(self._dispatch.ShaleVolume(log, prompt_user, config))
+        _depth_index.invalidate_all()
+        return output
 
     def porosity_sonic(self, log=None, prompt_user=None, config=None):
         """Computes porosity from transit time data.
@@ -3803,7 +4102,9 @@ class Borehole(DispatchWrapper):
             A log of the resulting porosity.
         """
 
-        return Log(self._dispatch.PorositySonic(log, prompt_user, config))
+        output = Log(self._dispatch.PorositySonic(log, prompt_user, config))
+        _depth_index.invalidate_all()
+        return output
 
     def porosity_archie(self, log=None, prompt_user=None, config=None):
         """Computes porosity from formation resistivity data.
@@ -3843,7 +4144,9 @@ class Borehole(DispatchWrapper):
             A log of the resulting porosity.
         """
 
-        return Log(self._dispatch.PorosityArchie(log, prompt_user, config))
+        output = Log(self._dispatch.PorosityArchie(log, prompt_user, config))
+        _depth_index.invalidate_all()
+        return output
 
     def porosity_density(self, log=None, prompt_user=None, config=None):
         """Computes porosity from density data.
@@ -3882,7 +4185,9 @@ class Borehole(DispatchWrapper):
             A log of the resulting porosity.
         """
 
-        return Log(self._dispatch.PorosityDensity(log, prompt_user, config))
+        output = Log(self._dispatch.PorosityDensity(log, prompt_user, config))
+        _depth_index.invalidate_all()
+        return output
 
     def porosity_neutron(self, log=None, prompt_user=None, config=None):
         """Applies a shale correction to neutron porosity data.
@@ -3915,7 +4220,9 @@ class Borehole(DispatchWrapper):
             A log of the resulting corrected porosity.
         """
 
-        return Log(self._dispatch.PorosityNeutron(log, prompt_user, config))
+        output = Log(self._dispatch.PorosityNeutron(log, prompt_user, config))
+        _depth_index.invalidate_all()
+        return output
 
     def permeability(self, log=None, prompt_user=None, config=None):
         """Estimates permeability from porosity data.
@@ -3945,7 +4252,9 @@ class Borehole(DispatchWrapper):
             A log of the resulting permeability.
         """
 
-        return Log(self._dispatch.Permeability(log, prompt_user, config))
+        output = Log(self._dispatch.Permeability(log, prompt_user, config))
+        _depth_index.invalidate_all()
+        return output
 
     def hydraulic_conductivity(self, log=None, prompt_user=None, config=None):
         """Computes the hydraulic conductivity from permeability data.
@@ -3987,7 +4296,9 @@ class Borehole(DispatchWrapper):
             A Log object of the resulting hydraulic conductivity.
         """
 
-        return Log(self._dispatch.HydraulicConductivity(log, prompt_user, config))
+        output = Log(self._dispatch.HydraulicConductivity(log, prompt_user, config))
+        _depth_index.invalidate_all()
+        return output
 
     def extract_grain_size_statistics(self, log=None, prompt_user=None, config=None):
         """Computes statistics from a grain size distribution curve.
@@ -4022,6 +4333,7 @@ class Borehole(DispatchWrapper):
         """
 
         self._dispatch.ExtractGrainSizeStatistics(log, prompt_user, config)
+        _depth_index.invalidate_all()
 
     def grain_size_sorting(self, log_min, log_max, prompt_user=None, config=None):
         """Classifies grain size values based on min and max logs.
@@ -4058,7 +4370,9 @@ class Borehole(DispatchWrapper):
             A log containing the sorted values
         """
 
-        return Log(self._dispatch.GrainSizeSorting(log_min, log_max, prompt_user, config))
+        output = Log(self._dispatch.GrainSizeSorting(log_min, log_max, prompt_user, config))
+        _depth_index.invalidate_all()
+        return output
 
     def enable_protection(self, enable, password):
         """Changes the protection status of a document using a password
@@ -0,0 +1,92 @@
+import collections
+import time
+from . import _hooks
+
+
+class BulkEdit(_hooks.DispatchHook):
+    """Suspends the redrawing of a borehole document during bulk edits.
+
+    Used as a context manager, usually created with ``Borehole.bulk_edit()``.
+    On entry, auto update is turned off and, if requested, the document is
+    switched to draft mode. On exit, whether the block succeeded or raised,
+    the view mode and auto update status are restored and the view is
+    refreshed exactly once.
+
+    The COM calls made by the wrapper objects inside the block are counted,
+    and the time spent in the block is measured, which helps to profile
+    scripts.
+
+    Parameters
+    ----------
+    borehole : Borehole
+        The borehole document being edited.
+    draft : bool, optional
+        Whether to switch to draft mode inside the block. Defaults to True.
+    restore_mode : int, optional
+        The view mode to go back to when leaving draft mode, as for
+        ``Borehole.set_draft_mode``. WellCAD does not report the current view
+        mode, so it cannot be restored automatically. Defaults to 0 (Page
+        Layout).
+
+    Attributes
+    ----------
+    elapsed : float
+        The time spent inside the block in seconds, once it has been left.
+    calls : collections.Counter
+        Maps ``"Class.Member"`` to the number of property gets, puts and
+        method calls made on it inside the block.
+    """
+
+    def __init__(self, borehole, draft=True, restore_mode=0):
+        self._borehole = borehole
+        self._draft = draft
+        self._restore_mode = restore_mode
+        self._auto_update = None
+        self._start = None
+        self.elapsed = None
+        self.calls = collections.Counter()
+
+    @property
+    def com_calls(self):
+        """int: The total number of COM calls made inside the block."""
+        return sum(self.calls.values())
+
+    def __enter__(self):
+        self._auto_update = self._borehole.auto_update
+        self._borehole.auto_update = False
+        try:
+            if self._draft:
+                self._borehole.set_draft_mode(2)
+        except BaseException:
+            self._borehole.auto_update = self._auto_update
+            raise
+        self.calls.clear()
+        _hooks.install(self)
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.elapsed = time.perf_counter() - self._start
+        _hooks.uninstall(self)
+        try:
+            if self._draft:
+                self._borehole.set_draft_mode(self._restore_mode)
+        finally:
+            self._borehole.auto_update = self._auto_update
+        self._borehole.refresh_window()
+
+    def __repr__(self):
+        elapsed = "running" if self.elapsed is None else f"{self.elapsed:.3f} s"
+        return f"BulkEdit({self.com_calls} COM calls, {elapsed})"
+
+    def get(self, wrapper, name, fetch):
+        self.calls[f"{type(wrapper).__name__}.{name}"] += 1
+        return fetch()
+
+    def put(self, wrapper, name, value, store):
+        self.calls[f"{type(wrapper).__name__}.{name}"] += 1
+        store()
+
+    def invoke(self, wrapper, name, args, call):
+        self.calls[f"{type(wrapper).__name__}.{name}"] += 1
+        return call()
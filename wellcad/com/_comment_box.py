@@ -2,6 +2,8 @@ from ._dispatch_wrapper import DispatchWrapper
 
 
 class CommentBox(DispatchWrapper):
+    __slots__ = ()
+
     @property
     def top_depth(self):
         """float: The top depth of the comment box in current depth
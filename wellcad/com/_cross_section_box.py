@@ -17,6 +17,8 @@ class CrossSectionBox(DispatchWrapper):
     12.5
     """
 
+    __slots__ = ()
+
     @property
     def top_depth(self):
         """float : The top depth of the box in current
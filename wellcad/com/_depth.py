@@ -17,6 +17,8 @@ class Depth(DispatchWrapper):
     >>> depth = borehole.depth
     """
 
+    __slots__ = ()
+
     @property
     def decimals(self):
         """int: the number of decimals displayed in the depth string of the master depth axis."""
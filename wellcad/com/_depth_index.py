@@ -0,0 +1,139 @@
+import bisect
+
+# Bumped by Borehole.clear_log_contents and the Borehole processing methods,
+# which may change the data of any log. Since they take the log by name or
+# index, every depth index built before is considered out of date.
+_generation = 0
+
+
+def invalidate_all():
+    """Marks all depth indexes built so far as out of date."""
+    global _generation
+    _generation += 1
+
+
+class DepthIndex:
+    """A client-side copy of the sample depths of a log.
+
+    The depths are read once with a single ``data_table`` call and kept
+    sorted, so that depth to index, index to depth and depth range queries
+    are answered by binary search without any COM call. Indexes follow the
+    same convention as ``Log.get_data`` and ``Log.data_depth``, i.e. index 0
+    is the bottom-most sample for Well, Formula, FWS, Image, RGB and
+    Analysis Logs and the top-most sample for the other logs.
+
+    A depth index is obtained with ``Log.depth_index()``, which builds it on
+    first use and caches it on the ``Log`` object. Writing data does not
+    rebuild the index. The data editing methods of ``Log`` drop the
+    cached index. ``Borehole.clear_log_contents`` and the Borehole
+    processing methods call ``invalidate_all()``, which marks every index
+    built before as out of date (see ``is_valid``). The next call to
+    ``Log.depth_index()`` then builds a new one. Changes made in WellCAD
+    itself or through the dispatch object directly are not tracked and
+    require a call to ``Log.invalidate_depth_index()``.
+
+    Parameters
+    ----------
+    depths : iterable of float
+        The depths of the samples.
+    bottom_first : bool
+        Whether index 0 refers to the bottom-most sample.
+    """
+
+    def __init__(self, depths, bottom_first):
+        self._depths = sorted(depths)
+        self._bottom_first = bottom_first
+        self._generation = _generation
+
+    def __len__(self):
+        return len(self._depths)
+
+    def __repr__(self):
+        if not self._depths:
+            return "DepthIndex([])"
+        return f"DepthIndex({len(self._depths)} samples from {self._depths[0]:g} to {self._depths[-1]:g})"
+
+    @property
+    def is_valid(self):
+        """bool: False if the data of some log may have been moved by a
+        Borehole processing method since the index was built."""
+        return self._generation == _generation
+
+    @property
+    def depths(self):
+        """list of float: The sorted depths, from top to bottom."""
+        return list(self._depths)
+
+    def depth(self, index):
+        """Gets the depth of the sample at the specified index.
+
+        Parameters
+        ----------
+        index : int
+            The zero based index of the sample.
+
+        Returns
+        -------
+        float
+            The depth of the sample.
+
+        Raises
+        ------
+        IndexError
+            If the index is out of range.
+        """
+        if not 0 <= index < len(self._depths):
+            raise IndexError(f"Sample index {index} out of range")
+        return self._depths[self._row(index)]
+
+    def index(self, depth, tolerance=None):
+        """Gets the index of the sample nearest to a depth.
+
+        Parameters
+        ----------
+        depth : float
+            The depth in current depth units.
+        tolerance : float, optional
+            If given, the maximum distance between ``depth`` and the sample.
+
+        Returns
+        -------
+        int
+            The index of the nearest sample, or None if the log is empty or
+            the nearest sample is further away than ``tolerance``.
+        """
+        depths = self._depths
+        if not depths:
+            return None
+        row = bisect.bisect_left(depths, depth)
+        if row == len(depths) or (row > 0 and depth - depths[row - 1] <= depths[row] - depth):
+            row -= 1
+        if tolerance is not None and abs(depths[row] - depth) > tolerance:
+            return None
+        return self._row(row)
+
+    def slice(self, top_depth, bottom_depth):
+        """Gets the indexes of the samples within a depth range.
+
+        Parameters
+        ----------
+        top_depth : float
+            The top of the range, included.
+        bottom_depth : float
+            The bottom of the range, included.
+
+        Returns
+        -------
+        slice
+            The contiguous indexes of the samples in the range, in increasing
+            order. The slice is empty if there are no samples in the range.
+        """
+        start = bisect.bisect_left(self._depths, top_depth)
+        stop = max(bisect.bisect_right(self._depths, bottom_depth), start)
+        if self._bottom_first:
+            n = len(self._depths)
+            return slice(n - stop, n - start)
+        return slice(start, stop)
+
+    def _row(self, index):
+        return len(self._depths) - 1 - index if self._bottom_first else index
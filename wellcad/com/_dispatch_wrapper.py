@@ -1,17 +1,24 @@
-import pywintypes
-import win32com.client.build
-from win32com.client.dynamic import CDispatch
+import collections
+import weakref
+from . import _backend
+from ._funnel import FunneledDispatch
+
+CacheInfo = collections.namedtuple("CacheInfo", ["hits", "misses", "currsize"])
 
 
 class DispatchWrapper:
-    """A helper class that wraps a pywin32 dynamic dispatch COM object.
+    """A helper class that wraps a dynamic dispatch COM object.
+
+    The dispatch objects are provided by the active COM backend (see
+    :func:`wellcad.com.set_backend`). With the default ``pywin32`` backend
+    they are ``win32com.client.dynamic.CDispatch`` instances.
 
     Inheriting from this does a couple of things that provides useful
     behaviour:
     
     * It overrides ``__new__`` to type check the dynamic dispatch COM object
-      that is passed in as a parameter. If it is a genuine
-      ``win32com.client.dynamic.CDispatch`` instance, The class will be created
+      that is passed in as a parameter. If it is a genuine dispatch object of
+      the active backend, The class will be created
       and the initializer will be called as usual. If the parameter provided
       is not a dynamic dispatch COM object, the object that will be constructed
       will be ``None``.
@@ -30,11 +37,33 @@ class DispatchWrapper:
       
       Defining the class attribute ``_DISPATCH_ATTRIBUTES`` forces ``pywin32``
       to register any attributes in the enumeration as actual attributes.
+    * The DISPIDs resolved for ``_DISPATCH_METHODS`` and
+      ``_DISPATCH_ATTRIBUTES`` are cached per wrapper class, backend and COM
+      interface, so only the first object of a given class pays for the
+      ``GetIDsOfNames`` round-trips. Later objects reuse the cached
+      ``MapEntry`` objects. See :meth:`dispatch_cache_info`.
+    * The class attribute ``_QUERY_METHODS`` lists the dispatch methods that
+      only read from the document (in addition to the ``Get*`` and ``NbOf*``
+      methods), so that calling them does not empty the property cache of
+      ``Borehole.cached()``.
+
+    * Wrapping the same server object twice returns the same wrapper object,
+      as long as the first one is still referenced. For example, two calls
+      to ``borehole.get_log("GR")`` return the same ``Log``, which is only
+      set up once. The server objects are identified by their COM identity
+      (see ``Backend.identity_key``). Wrapper classes define ``__slots__``,
+      so they do not have an instance ``__dict__``.
+
+    * Wrapper objects obtained from an ``Application(threaded=True)`` hold a
+      ``FunneledDispatch`` instead of the dispatch object itself, which runs
+      every COM call on the thread that owns the dispatch object. Such
+      wrappers can be shared between threads. They are not shared through
+      the identity cache.
 
     Parameters
     ----------
-    dispatch : win32com.client.dynamic.CDispatch or None
-        A valid win32com.client.dynamic.CDispatch instance to wrap, or None.
+    dispatch : win32com.client.dynamic.CDispatch or FunneledDispatch or None
+        A valid dispatch object of the active backend to wrap, or None.
     
     Attributes
     ----------
@@ -42,30 +71,100 @@ class DispatchWrapper:
         The dispatch COM object this class is wrapping.
     """
 
+    __slots__ = ("_dispatch", "__weakref__")
+
     _DISPATCH_METHODS = ()
     _DISPATCH_ATTRIBUTES = ()
+    _QUERY_METHODS = ()
+
+    # Maps (wrapper class, backend, identity key) to the live wrapper of a
+    # server object.
+    _identity_cache = weakref.WeakValueDictionary()
+
+    # Maps (wrapper class, backend name, interface key) to the
+    # (methods, attributes) entries resolved for it.
+    _dispatch_name_cache = {}
+    # Maps wrapper class to a [hits, misses] counter.
+    _dispatch_name_stats = collections.defaultdict(lambda: [0, 0])
 
     def __new__(cls, dispatch):
-        return super().__new__(cls) if isinstance(dispatch, CDispatch) else None
+        if isinstance(dispatch, FunneledDispatch):
+            return super().__new__(cls)
+        backend = _backend.get_backend()
+        if dispatch is None or not backend.is_dispatch(dispatch):
+            return None
+        identity = backend.identity_key(dispatch)
+        if identity is None:
+            return super().__new__(cls)
+        key = (cls, backend, identity)
+        wrapper = DispatchWrapper._identity_cache.get(key)
+        if wrapper is None:
+            wrapper = DispatchWrapper._identity_cache[key] = super().__new__(cls)
+        return wrapper
 
     def __init__(self, dispatch):
+        try:
+            _dispatch_slot.__get__(self)
+        except AttributeError:
+            pass
+        else:
+            return  # Taken from the identity cache, already set up.
         self._dispatch = dispatch
-        for method_name in self._DISPATCH_METHODS:
-            try:
-                self._dispatch._FlagAsMethod(method_name)
-            except pywintypes.com_error as e:
-                if e.args[0] == -2147352570:
-                    pass  # method_name doesn't exist in this version of wellcad or was not found, ignoring.")
-                else:
-                    raise
-
-        for attribute_name in self._DISPATCH_ATTRIBUTES:
-            try:
-                entry = win32com.client.build.MapEntry(self._dispatch._oleobj_.GetIDsOfNames(0, attribute_name), (attribute_name,))
-                self._dispatch._olerepr_.propMap[attribute_name] = entry
-            except pywintypes.com_error as e:
-                if e.args[0] == -2147352570:
-                    pass  # attribute_name doesn't exist in this version of wellcad or was not found, ignoring.")
-                else:
-                    raise
+        if self._DISPATCH_METHODS or self._DISPATCH_ATTRIBUTES:
+            if isinstance(dispatch, FunneledDispatch):
+                dispatch.call(self._register_dispatch_names, dispatch._target)
+            else:
+                self._register_dispatch_names(dispatch)
+
+    def _register_dispatch_names(self, dispatch):
+        cls = type(self)
+        backend = _backend.get_backend()
+        key = (cls, backend.name, backend.interface_key(dispatch))
+        stats = DispatchWrapper._dispatch_name_stats[cls]
+        names = DispatchWrapper._dispatch_name_cache.get(key)
+        if names is None:
+            stats[1] += 1
+            names = (backend.resolve_names(dispatch, self._DISPATCH_METHODS),
+                     backend.resolve_names(dispatch, self._DISPATCH_ATTRIBUTES))
+            DispatchWrapper._dispatch_name_cache[key] = names
+        else:
+            stats[0] += 1
+        backend.register_names(dispatch, *names)
+
+    @classmethod
+    def dispatch_cache_info(cls):
+        """Reports how effective the DISPID cache has been.
+
+        Called on ``DispatchWrapper`` itself, the statistics are summed over
+        all wrapper classes. Called on a subclass (e.g. ``Log``), only that
+        class is reported.
+
+        Returns
+        -------
+        CacheInfo
+            A named tuple of ``hits``, ``misses`` and ``currsize`` (the number
+            of cached interfaces).
+        """
+        if cls is DispatchWrapper:
+            hits = sum(s[0] for s in cls._dispatch_name_stats.values())
+            misses = sum(s[1] for s in cls._dispatch_name_stats.values())
+            size = len(cls._dispatch_name_cache)
+        else:
+            hits, misses = DispatchWrapper._dispatch_name_stats.get(cls, (0, 0))
+            size = sum(1 for key in DispatchWrapper._dispatch_name_cache if key[0] is cls)
+        return CacheInfo(hits, misses, size)
+
+    @classmethod
+    def dispatch_cache_clear(cls):
+        """Empties the DISPID cache and resets its statistics.
+
+        This is only needed if the process connects to a different WellCAD
+        server that exposes the same interface ids with different DISPIDs.
+        """
+        DispatchWrapper._dispatch_name_cache.clear()
+        DispatchWrapper._dispatch_name_stats.clear()
+
 
+# The slot holding the dispatch object, which dispatch hooks temporarily
+# replace on the class.
+_dispatch_slot = DispatchWrapper._dispatch
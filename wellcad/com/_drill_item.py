@@ -20,6 +20,9 @@ class DrillItem(DispatchWrapper):
     0.00-15.00
     diameter:300'
     """
+
+    __slots__ = ()
+
     @property
     def bottom_depth(self):
         """float: The bottom depth of the drill in current depth units."""
@@ -33,6 +33,9 @@ class EquipmentItem(DispatchWrapper):
     >>> equipment_item.type
     2  # Hollow item
     """
+
+    __slots__ = ()
+
     @property
     def top_depth(self):
         """float: The top depth of the equipment item in current
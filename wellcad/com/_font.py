@@ -25,6 +25,8 @@ class Font(DispatchWrapper):
     False
     """
 
+    __slots__ = ()
+
     @property
     def name(self):
         """str: The name of the font type used."""
@@ -15,6 +15,8 @@ class FossilItem(DispatchWrapper):
     >>> item.abundance = 2
     """
 
+    __slots__ = ()
+
     @property
     def top_depth(self):
         """float: The top depth of the item in current depth
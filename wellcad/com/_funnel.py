@@ -0,0 +1,82 @@
+import functools
+from . import _backend
+
+
+class FunneledDispatch:
+    """A thread-safe stand-in for a dispatch object owned by an apartment.
+
+    Every property get, property put and method call made on it, from any
+    thread, is run on the thread of the apartment that owns the dispatch
+    object (see ``Application(threaded=True)``). Dispatch objects returned by
+    these calls are funneled through the same apartment, so the wrapper
+    objects built on them are thread-safe too.
+
+    Parameters
+    ----------
+    target : object
+        The dispatch object of the backend.
+    apartment : Apartment
+        The apartment whose thread owns ``target``.
+    """
+
+    __slots__ = ("_target", "_apartment")
+
+    def __init__(self, target, apartment):
+        object.__setattr__(self, "_target", target)
+        object.__setattr__(self, "_apartment", apartment)
+
+    def __getattr__(self, name):
+        if name in FunneledDispatch.__slots__:
+            raise AttributeError(name)
+        target = self._target
+        if name.startswith("_"):
+            return getattr(target, name)
+        backend = _backend.get_backend()
+        if not backend.is_method(target, name):
+            value = self._apartment.call(getattr, target, name)
+            if not callable(value) or backend.is_dispatch(value):
+                return self._funnel(value)
+        return functools.partial(self._invoke, name)
+
+    def __setattr__(self, name, value):
+        if name.startswith("_"):
+            setattr(self._target, name, value)
+        else:
+            self._apartment.call(setattr, self._target, name, unwrap(value))
+
+    def __del__(self):
+        # Hand the dispatch object over to the thread that owns it, in a list
+        # that holds its only reference, so that it is released there.
+        apartment = getattr(self, "_apartment", None)
+        target = getattr(self, "_target", None)
+        if apartment is not None and target is not None:
+            object.__setattr__(self, "_target", None)
+            holder = [target]
+            del target
+            apartment.release(holder)
+
+    def call(self, fn, *args, **kwargs):
+        """Runs a function on the owner thread of the dispatch object.
+
+        Returns
+        -------
+        object
+            The result of ``fn(*args, **kwargs)``.
+        """
+        return self._apartment.call(fn, *args, **kwargs)
+
+    def _invoke(self, name, *args):
+        target = self._target
+        args = tuple(unwrap(arg) for arg in args)
+        return self._funnel(self._apartment.call(lambda: getattr(target, name)(*args)))
+
+    def _funnel(self, value):
+        if _backend.get_backend().is_dispatch(value):
+            return FunneledDispatch(value, self._apartment)
+        return value
+
+
+def unwrap(value):
+    """Gets the dispatch object behind a ``FunneledDispatch``, or ``value``
+    itself if it is not one."""
+    return value._target if isinstance(value, FunneledDispatch) else value
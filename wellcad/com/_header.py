@@ -20,6 +20,10 @@ class Header(DispatchWrapper):
     Tools
     """
 
+    __slots__ = ()
+
+    _QUERY_METHODS = ("ItemName",)
+
     @property
     def nb_of_items(self):
         """int: Number of dynamic text fields in the entire header."""
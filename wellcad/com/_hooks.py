@@ -0,0 +1,180 @@
+import functools
+import threading
+from . import _backend
+from ._dispatch_wrapper import DispatchWrapper, _dispatch_slot
+from ._funnel import unwrap as _unwrap_funnel
+
+# The hooks currently installed, outermost first. Replaced, never mutated, so
+# that a call in progress keeps the chain it started with.
+_hooks = ()
+_lock = threading.Lock()
+
+
+class DispatchHook:
+    """Base class for objects that observe or intercept the COM calls made by
+    the wrapper classes.
+
+    While at least one hook is installed with :func:`install`, the
+    ``_dispatch`` attribute of every ``DispatchWrapper`` returns a proxy that
+    routes property gets, property puts and method calls through the
+    ``get``, ``put`` and ``invoke`` methods of the installed hooks. Each
+    method receives a callable that performs the actual operation (or calls
+    the next hook) and must return its result, unless the hook answers the
+    call itself. When no hook is installed, the wrappers talk to the dispatch
+    objects directly and there is no overhead at all.
+    """
+
+    def get(self, wrapper, name, fetch):
+        """Called for a property get.
+
+        Parameters
+        ----------
+        wrapper : DispatchWrapper
+            The wrapper object whose dispatch is accessed.
+        name : str
+            The name of the property.
+        fetch : callable
+            Gets the property when called without arguments.
+
+        Returns
+        -------
+        object
+            The property value.
+        """
+        return fetch()
+
+    def put(self, wrapper, name, value, store):
+        """Called for a property put.
+
+        Parameters
+        ----------
+        wrapper : DispatchWrapper
+            The wrapper object whose dispatch is accessed.
+        name : str
+            The name of the property.
+        value : object
+            The new value of the property.
+        store : callable
+            Puts the value when called without arguments.
+        """
+        store()
+
+    def invoke(self, wrapper, name, args, call):
+        """Called for a method call.
+
+        Parameters
+        ----------
+        wrapper : DispatchWrapper
+            The wrapper object whose dispatch is accessed.
+        name : str
+            The name of the method.
+        args : tuple
+            The positional arguments of the call.
+        call : callable
+            Calls the method when called without arguments.
+
+        Returns
+        -------
+        object
+            The result of the method.
+        """
+        return call()
+
+
+def install(hook):
+    """Installs a dispatch hook.
+
+    Parameters
+    ----------
+    hook : DispatchHook
+        The hook to install. It sees the calls after the hooks installed
+        before it.
+    """
+    global _hooks
+    with _lock:
+        if not _hooks:
+            DispatchWrapper._dispatch = property(_hooked_dispatch, _set_dispatch)
+        _hooks = _hooks + (hook,)
+
+
+def uninstall(hook):
+    """Removes a dispatch hook installed with :func:`install`.
+
+    Does nothing if the hook is not installed.
+    """
+    global _hooks
+    with _lock:
+        if hook not in _hooks:
+            return
+        index = _hooks.index(hook)
+        _hooks = _hooks[:index] + _hooks[index + 1:]
+        if not _hooks:
+            DispatchWrapper._dispatch = _dispatch_slot
+
+
+def installed():
+    """Returns the installed hooks, outermost first."""
+    return _hooks
+
+
+def _hooked_dispatch(wrapper):
+    return HookedDispatch(wrapper, _dispatch_slot.__get__(wrapper))
+
+
+def _set_dispatch(wrapper, dispatch):
+    _dispatch_slot.__set__(wrapper, dispatch)
+
+
+def _unwrap(value):
+    return value._raw if isinstance(value, HookedDispatch) else value
+
+
+class HookedDispatch:
+    """The proxy a wrapper's ``_dispatch`` returns while hooks are installed.
+
+    Parameters
+    ----------
+    wrapper : DispatchWrapper
+        The wrapper object the dispatch belongs to.
+    raw : object
+        The dispatch object of the backend.
+    """
+
+    __slots__ = ("_wrapper", "_raw")
+
+    def __init__(self, wrapper, raw):
+        object.__setattr__(self, "_wrapper", wrapper)
+        object.__setattr__(self, "_raw", raw)
+
+    def __getattr__(self, name):
+        raw = self._raw
+        if name.startswith("_"):
+            return getattr(raw, name)
+        backend = _backend.get_backend()
+        if not backend.is_method(_unwrap_funnel(raw), name):
+            fetch = functools.partial(getattr, raw, name)
+            for hook in reversed(_hooks):
+                fetch = functools.partial(hook.get, self._wrapper, name, fetch)
+            value = fetch()
+            # Backends without type information only find out that a name
+            # is a method when it is looked up for the first time. After
+            # that, is_method() knows it and the get hooks are skipped.
+            if not callable(value) or backend.is_dispatch(value):
+                return value
+        return functools.partial(self._invoke, name)
+
+    def __setattr__(self, name, value):
+        if name.startswith("_"):
+            setattr(self._raw, name, value)
+            return
+        store = functools.partial(setattr, self._raw, name, _unwrap(value))
+        for hook in reversed(_hooks):
+            store = functools.partial(hook.put, self._wrapper, name, value, store)
+        store()
+
+    def _invoke(self, name, *args):
+        args = tuple(_unwrap(arg) for arg in args)
+        call = functools.partial(getattr(self._raw, name), *args)
+        for hook in reversed(_hooks):
+            call = functools.partial(hook.invoke, self._wrapper, name, args, call)
+        return call()
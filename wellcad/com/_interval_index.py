@@ -0,0 +1,222 @@
+import bisect
+from . import _depth_index
+
+
+class IntervalIndex:
+    """A client-side copy of the depth intervals of the items of a log.
+
+    The top and bottom depths of the items are read once with a single
+    ``data_table`` call. Point, overlap and containment queries are then
+    answered without any COM call, in O(log n + k) time for k matching
+    items: the items are sorted by top depth, so a binary search bounds the
+    candidates, and the matching ones are reported through sparse tables of
+    their bottom depths, without scanning the others.
+
+    Queries return the zero based indexes of the items, as used by
+    ``Log.get_litho_bed``, ``Log.comment_box`` and the other item getters,
+    in order of top depth. Intervals include both their top and bottom
+    depths.
+
+    An interval index is obtained with ``Log.interval_index()``, which
+    builds it on first use and caches it on the ``Log`` object. Editing
+    the items does not rebuild the index. The item editing methods of
+    ``Log`` drop the cached index, and the Borehole processing methods mark
+    it as out of date. The next call then builds a new one. Changes made in
+    WellCAD itself or through the dispatch object directly are not tracked
+    and require a call to ``Log.invalidate_interval_index()``.
+
+    Parameters
+    ----------
+    tops : sequence of float
+        The top depths of the items, by item index.
+    bottoms : sequence of float
+        The bottom depths of the items, by item index.
+
+    Example
+    -------
+    >>> index = litho_log.interval_index()
+    >>> index.at_depth(125.3)
+    [41]
+    >>> [litho_log.get_litho_bed(i).litho_code for i in index.overlapping(100.0, 110.0)]
+    ['SST', 'SHL', 'SST']
+    """
+
+    def __init__(self, tops, bottoms):
+        if len(tops) != len(bottoms):
+            raise ValueError("tops and bottoms must have the same length")
+        self._intervals = list(zip(tops, bottoms))
+        order = sorted(range(len(tops)), key=tops.__getitem__)
+        self._order = order
+        self._tops = [tops[i] for i in order]
+        self._bottoms = [bottoms[i] for i in order]
+        self._max_table = None
+        self._min_table = None
+        self._generation = _depth_index._generation
+
+    def __len__(self):
+        return len(self._tops)
+
+    def __repr__(self):
+        if not self._tops:
+            return "IntervalIndex([])"
+        return (f"IntervalIndex({len(self._tops)} items from {self._tops[0]:g} "
+                f"to {max(self._bottoms):g})")
+
+    @property
+    def is_valid(self):
+        """bool: False if the data of some log may have been moved by a
+        Borehole processing method since the index was built."""
+        return self._generation == _depth_index._generation
+
+    def interval(self, index):
+        """Gets the depth interval of an item.
+
+        Parameters
+        ----------
+        index : int
+            The zero based index of the item.
+
+        Returns
+        -------
+        tuple of float
+            The top and bottom depths of the item.
+
+        Raises
+        ------
+        IndexError
+            If the index is out of range.
+        """
+        if not 0 <= index < len(self._intervals):
+            raise IndexError(f"Item index {index} out of range")
+        return self._intervals[index]
+
+    def at_depth(self, depth):
+        """Gets the items whose interval holds a depth.
+
+        Parameters
+        ----------
+        depth : float
+            The depth in current depth units.
+
+        Returns
+        -------
+        list of int
+            The indexes of the items, in order of top depth.
+        """
+        return self.overlapping(depth, depth)
+
+    def overlapping(self, top_depth, bottom_depth):
+        """Gets the items whose interval overlaps a depth range.
+
+        Parameters
+        ----------
+        top_depth : float
+            The top of the range.
+        bottom_depth : float
+            The bottom of the range.
+
+        Returns
+        -------
+        list of int
+            The indexes of the items, in order of top depth.
+        """
+        stop = bisect.bisect_right(self._tops, bottom_depth)
+        return self._report(0, stop, top_depth, True)
+
+    def within(self, top_depth, bottom_depth):
+        """Gets the items whose interval lies within a depth range.
+
+        Parameters
+        ----------
+        top_depth : float
+            The top of the range.
+        bottom_depth : float
+            The bottom of the range.
+
+        Returns
+        -------
+        list of int
+            The indexes of the items, in order of top depth.
+        """
+        start = bisect.bisect_left(self._tops, top_depth)
+        stop = bisect.bisect_right(self._tops, bottom_depth)
+        return self._report(start, stop, bottom_depth, False)
+
+    def enclosing(self, top_depth, bottom_depth):
+        """Gets the items whose interval holds a whole depth range.
+
+        Parameters
+        ----------
+        top_depth : float
+            The top of the range.
+        bottom_depth : float
+            The bottom of the range.
+
+        Returns
+        -------
+        list of int
+            The indexes of the items, in order of top depth.
+        """
+        stop = bisect.bisect_right(self._tops, top_depth)
+        return self._report(0, stop, bottom_depth, True)
+
+    def _report(self, start, stop, limit, deepest):
+        """Reports the rows in [start, stop) whose bottom is at least (if
+        ``deepest``) or at most ``limit``, in order.
+
+        Each step finds the extreme bottom of a range with two lookups in a
+        sparse table. If it passes the limit the row is reported and both
+        sides are searched, otherwise the range holds no match, so the
+        number of steps is proportional to the number of matches.
+        """
+        if start >= stop:
+            return []
+        bottoms, order = self._bottoms, self._order
+        table = self._table(deepest)
+        result = []
+        # Depth first, left side first, with ranges and reported rows on the
+        # same stack to keep the rows in order.
+        stack = [(start, stop)]
+        while stack:
+            item = stack.pop()
+            if isinstance(item, int):
+                result.append(order[item])
+                continue
+            low, high = item
+            level = (high - low).bit_length() - 1
+            a, b = table[level][low], table[level][high - (1 << level)]
+            if deepest:
+                row = a if bottoms[a] >= bottoms[b] else b
+                if bottoms[row] < limit:
+                    continue
+            else:
+                row = a if bottoms[a] <= bottoms[b] else b
+                if bottoms[row] > limit:
+                    continue
+            if row + 1 < high:
+                stack.append((row + 1, high))
+            stack.append(row)
+            if low < row:
+                stack.append((low, row))
+        return result
+
+    def _table(self, deepest):
+        """Gets the sparse table of the rows with the deepest or shallowest
+        bottom over the ranges of 2**level rows, built on first use."""
+        table = self._max_table if deepest else self._min_table
+        if table is None:
+            bottoms = self._bottoms
+            level = list(range(len(bottoms)))
+            table, span = [level], 1
+            while 2 * span <= len(bottoms):
+                if deepest:
+                    level = [a if bottoms[a] >= bottoms[b] else b for a, b in zip(level, level[span:])]
+                else:
+                    level = [a if bottoms[a] <= bottoms[b] else b for a, b in zip(level, level[span:])]
+                table.append(level)
+                span *= 2
+            if deepest:
+                self._max_table = table
+            else:
+                self._min_table = table
+        return table
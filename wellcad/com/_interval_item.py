@@ -17,6 +17,8 @@ class IntervalItem(DispatchWrapper):
     9.0
     """
 
+    __slots__ = ()
+
     @property
     def top_depth(self):
         """float: The top depth of the interval item in current
@@ -0,0 +1,114 @@
+import collections.abc
+from ._funnel import FunneledDispatch
+
+
+class ItemSequence(collections.abc.Sequence):
+    """A read-only sequence view of the items of a log.
+
+    Returned by ``Log.structures``, ``Log.litho_beds``, ``Log.markers`` and
+    the other item collection properties of :class:`Log`. The number of items
+    is read from WellCAD the first time it is needed and the wrapper objects
+    are only created when the items are accessed, a block of consecutive
+    items at a time. A full scan therefore costs one COM call per item plus
+    one for the length, and never probes past the last item.
+
+    The view supports ``len()``, indexing with negative indices, slicing
+    (which returns a list), iteration and ``reversed()``. It reflects the log
+    at the time its length was first read: get a new view from the log after
+    inserting or removing items.
+
+    Parameters
+    ----------
+    log : Log
+        The log holding the items.
+    method : str
+        The name of the COM method getting an item by index, e.g.
+        ``"Structure"``.
+    item_class : type
+        The wrapper class of the items.
+    count : str, optional
+        The ``Log`` property holding the number of items. Defaults to
+        ``"nb_of_data"``.
+    block_size : int, optional
+        The number of items fetched at once. Defaults to 64.
+
+    Example
+    -------
+    >>> structures = log.structures
+    >>> len(structures)
+    1250
+    >>> [s.depth for s in structures[:3]]
+    [101.2, 101.9, 103.4]
+    >>> deepest = structures[-1]
+    """
+
+    def __init__(self, log, method, item_class, count="nb_of_data", block_size=64):
+        if block_size < 1:
+            raise ValueError("block_size must be at least 1")
+        self._log = log
+        self._method = method
+        self._item_class = item_class
+        self._count = count
+        self._block_size = block_size
+        self._length = None
+        # The last block fetched, for random access to nearby items.
+        self._block_start = 0
+        self._block = []
+
+    def __repr__(self):
+        return f"<ItemSequence of {len(self)} {self._item_class.__name__} objects>"
+
+    def __len__(self):
+        if self._length is None:
+            self._length = getattr(self._log, self._count)
+        return self._length
+
+    def __getitem__(self, index):
+        length = len(self)
+        if isinstance(index, slice):
+            indices = range(*index.indices(length))
+            if not indices:
+                return []
+            start, stop = min(indices[0], indices[-1]), max(indices[0], indices[-1]) + 1
+            if indices.step in (1, -1):
+                block = self._fetch(start, stop)
+                return [block[i - start] for i in indices]
+            return [self._item(i) for i in indices]
+        index = index.__index__()
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError("item index out of range")
+        return self._item(index)
+
+    def __iter__(self):
+        length, size = len(self), self._block_size
+        for start in range(0, length, size):
+            yield from self._load(start, min(start + size, length))
+
+    def __reversed__(self):
+        size = self._block_size
+        for stop in range(len(self), 0, -size):
+            yield from reversed(self._load(max(stop - size, 0), stop))
+
+    def _item(self, index):
+        offset = index - self._block_start
+        if 0 <= offset < len(self._block):
+            return self._block[offset]
+        start = index - index % self._block_size
+        return self._load(start, min(start + self._block_size, len(self)))[index - start]
+
+    def _load(self, start, stop):
+        self._block_start, self._block = start, self._fetch(start, stop)
+        return self._block
+
+    def _fetch(self, start, stop):
+        dispatch = self._log._dispatch
+        cls = self._item_class
+        if isinstance(dispatch, FunneledDispatch):
+            # One trip to the apartment thread for the whole block.
+            target, method = dispatch._target, self._method
+            items = dispatch.call(lambda: [getattr(target, method)(i) for i in range(start, stop)])
+            return [cls(dispatch._funnel(item)) for item in items]
+        method = getattr(dispatch, self._method)
+        return [cls(method(i)) for i in range(start, stop)]
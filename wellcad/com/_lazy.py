@@ -0,0 +1,51 @@
+class _LazyName:
+    """Stands in for a name imported from a module that is only loaded on first use.
+
+    The first call imports the module and replaces the stand-in in the
+    namespace it was placed in, so later lookups get the real object.
+    """
+
+    def __init__(self, namespace, module_name, name):
+        self._namespace = namespace
+        self._module_name = module_name
+        self._name = name
+
+    def _resolve(self):
+        obj = import_name(self._module_name, self._name)
+        self._namespace[self._name] = obj
+        return obj
+
+    def __call__(self, *args, **kwargs):
+        return self._resolve()(*args, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self._resolve(), name)
+
+
+def import_name(module_name, name):
+    """Imports ``name`` from a module given relative to ``wellcad.com``.
+
+    Unlike ``importlib.import_module``, this goes through the import
+    statement machinery, so the import shows up in ``python -X importtime``.
+    """
+    module = __import__(module_name.lstrip("."), {"__package__": __package__}, None, (name,), 1)
+    return getattr(module, name)
+
+
+def lazy_import(namespace, module_name, *names):
+    """Binds names in a namespace that import ``module_name`` on first use.
+
+    This is the lazy equivalent of ``from module_name import *names`` and is
+    used to avoid loading the larger wrapper modules until they are needed.
+
+    Parameters
+    ----------
+    namespace : dict
+        The namespace to bind the names in, usually ``globals()``.
+    module_name : str
+        The module to import the names from, relative to ``wellcad.com``.
+    names : str
+        The names to bind.
+    """
+    for name in names:
+        namespace[name] = _LazyName(namespace, module_name, name)
@@ -15,6 +15,8 @@ class LithoBed(DispatchWrapper):
         >>> bed.top_contact = 'sharp'
         """
 
+    __slots__ = ()
+
     @property
     def top_depth(self):
         """float: The top depth of a lithology bed in current depth
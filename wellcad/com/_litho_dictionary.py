@@ -17,6 +17,8 @@ class LithoDictionary(DispatchWrapper):
     12
     """
 
+    __slots__ = ()
+
     _DISPATCH_METHODS = ("LithoPattern",)
 
     @property
@@ -15,6 +15,8 @@ class LithoPattern(DispatchWrapper):
     'Sst'
     """
 
+    __slots__ = ()
+
     @property
     def code(self):
         """str: The lithological code of the pattern.
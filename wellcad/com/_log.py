@@ -1,4 +1,7 @@
+import itertools
+from operator import itemgetter
 from ._dispatch_wrapper import DispatchWrapper
+from ._item_sequence import ItemSequence
 from ._font import Font
 from ._drill_item import DrillItem
 from ._structure import Structure
@@ -13,6 +16,22 @@ from ._stacking_pattern_item import StackingPatternItem
 from ._cross_section_box import CrossSectionBox
 from ._litho_dictionary import LithoDictionary
 
+# The fixed DataTable columns of the Structure, Breakout and Lineation Logs.
+_PICK_FIELDS = {
+    6: ("depth", "azimuth", "dip", "aperture"),
+    25: ("depth", "azimuth", "tilt", "length", "opening"),
+    27: ("depth", "trend", "plunge", "eccentricity"),
+}
+_PICK_TITLES = {
+    6: ("Depth", "Azimuth", "Dip", "Aperture"),
+    25: ("Depth", "Azimuth", "Tilt", "Length", "Opening"),
+    27: ("Depth", "Trend", "Plunge", "Eccentricity"),
+}
+_PICK_LOG_NAMES = {6: "Structure", 25: "Breakout", 27: "Lineation"}
+# The types of the logs whose DataTable holds depth intervals: Litho, Comment,
+# Engineering, Interval, CoreDesc, Stack, Polar & Rose, Cross and Bio Logs.
+_INTERVAL_LOG_TYPES = frozenset({7, 8, 9, 13, 16, 19, 20, 21, 26})
+
 
 class Log(DispatchWrapper):
     """The Log class represents a depth or time referenced set of data displayed as a column in a borehole document.
@@ -23,9 +42,17 @@ class Log(DispatchWrapper):
     >>> borehole = app.new_borehole()
     >>> log = borehole.insert_new_log(1) # Create a new well log
     """
+
+    __slots__ = ("_depth_index", "_interval_index", "_display")
     
     _DISPATCH_METHODS = ("Structure",)
     _DISPATCH_ATTRIBUTES = ("Style",)
+    _QUERY_METHODS = ("DataDepth", "Structure", "StructureAtDepth", "Breakout", "BreakoutAtDepth", "Lineation",
+                      "LineationAtDepth", "IntervalItem", "IntervalItemAtDepth", "CommentBox", "CommentBoxAtDepth",
+                      "CrossBox", "CrossBoxAtDepth", "DrillItem", "DrillItemAtDepth", "EqpItem", "FossilItem",
+                      "FossilItemAtDepth", "Marker", "MarkerByName", "SchmitBox", "SchmitBoxAtDepth", "StackItem",
+                      "StackItemAtDepth", "StrataColumn", "HistoryItemDate", "HistoryItemDescription",
+                      "FileExport")
 
     def file_export(self, directory, file_title=None, extension=None, prompt_user=None, config_filename=None):
         """Exports the data of the log in the specified format (TXT, CSV, ASC,
@@ -102,6 +129,90 @@ class Log(DispatchWrapper):
     @data_table.setter
     def data_table(self, data):
         self._dispatch.DataTable = data
+        self._depth_index = None
+        self._interval_index = None
+
+    def to_numpy(self, masked=False):
+        """Reads the data of a Well, Mud, Formula, Depth or Interval Log into
+        NumPy arrays.
+
+        The data is fetched with a single ``data_table`` call and converted
+        without looping over the samples in Python, which is much faster than
+        calling ``get_data`` and ``data_depth`` for every sample. Requires
+        NumPy.
+
+        Parameters
+        ----------
+        masked : bool, optional
+            If True, the values are returned as a ``numpy.ma.MaskedArray``
+            with the samples equal to ``null_value`` masked. Otherwise (the
+            default) these samples are set to NaN.
+
+        Returns
+        -------
+        depths : numpy.ndarray
+            The float64 depths of the samples in current depth units, from
+            top to bottom. For Interval Logs this is an array of shape
+            ``(n, 2)`` holding the top and bottom depth of each item.
+        values : numpy.ndarray or numpy.ma.MaskedArray
+            The float64 data values.
+
+        Example
+        -------
+        >>> depths, values = borehole.get_log("GR").to_numpy()
+        >>> numpy.nanmean(values)
+        63.2
+        """
+        from ._arrays import log_to_numpy
+        return log_to_numpy(self.data_table, self.null_value, masked)
+
+    def from_numpy(self, depths, values, null_value=None):
+        """Writes NumPy arrays into a Well, Mud or Interval Log.
+
+        The DataTable payload is built from the arrays in one go and written
+        with a single ``data_table`` put, instead of one ``set_data`` or
+        ``insert_data_at_depth`` call per sample. The put replaces the data
+        of the log. The arrays are checked before anything is written, so a
+        rejected call leaves the log unchanged. Requires NumPy.
+
+        Parameters
+        ----------
+        depths : array_like
+            The depths of the samples in current depth units, strictly
+            increasing. For Interval Logs, an array of shape ``(n, 2)``
+            holding the top and bottom depth of each item.
+        values : array_like
+            The data values, one per depth. NaN values and masked values of a
+            ``numpy.ma.MaskedArray`` are written as ``null_value``.
+        null_value : float, optional
+            If given, the null value of the log is set to this value before
+            the data is written. Otherwise the current null value of the log
+            is used.
+
+        Raises
+        ------
+        ValueError
+            If the depths are not strictly increasing or the arrays do not
+            have matching lengths.
+
+        Example
+        -------
+        >>> depths = numpy.arange(0.0, 100.0, 0.1)
+        >>> borehole.get_log("GR").from_numpy(depths, numpy.sin(depths))
+        """
+        import numpy
+        from ._arrays import numpy_to_rows
+        if numpy.ndim(values) != 1:
+            raise ValueError("Expected 1-D values, use set_trace_array to write trace logs")
+        rows = numpy_to_rows(depths, values, self.null_value if null_value is None else null_value)
+        if null_value is not None:
+            self.null_value = null_value
+        name = self.name
+        if rows and len(rows[0]) == 3:
+            header = ("Top Depth", "Bottom Depth", name)
+        else:
+            header = ("Depth", name)
+        self.data_table = (header,) + rows
 
     @property
     def data_min(self):
@@ -544,6 +655,103 @@ class Log(DispatchWrapper):
         """
         return self._dispatch.DataDepth(index)
 
+    def depth_index(self):
+        """Gets a client-side index of the sample depths of the log.
+
+        The index is built from a single ``data_table`` call and cached on
+        this object, so that repeated depth to index, index to depth and
+        depth range lookups are answered by binary search instead of a
+        ``data_depth`` or ``get_data_at_depth`` call each. It is dropped,
+        and rebuilt on the next call, after the data has been changed
+        through the ``insert_*``, ``remove_*`` and ``data_table`` members of
+        this object, or after a call to ``Borehole.clear_log_contents`` or
+        any of the Borehole processing methods.
+
+        Returns
+        -------
+        DepthIndex
+            The depth index of the log.
+
+        Example
+        -------
+        >>> index = gr_log.depth_index()
+        >>> index.index(125.3)
+        1893
+        >>> index.slice(100.0, 110.0)
+        slice(1742, 1843, None)
+        """
+        from ._depth_index import DepthIndex
+        index = getattr(self, "_depth_index", None)
+        if index is None or not index.is_valid:
+            depths = [row[0] for row in self.data_table[1:]]
+            index = self._depth_index = DepthIndex(depths, self._bottom_first())
+        return index
+
+    def invalidate_depth_index(self):
+        """Discards the cached depth index of the log.
+
+        Needed only when the data of the log was changed in WellCAD itself
+        or through its dispatch object directly.
+        """
+        self._depth_index = None
+
+    def interval_index(self):
+        """Gets a client-side index of the depth intervals of the items of the
+        log.
+
+        Supported for Interval, Litho, Comment, CoreDesc, Bio, Stack,
+        Polar & Rose, Cross and Engineering Logs. For the latter, the index
+        holds the drill items, each running from the bottom of the previous
+        one, or the top of the log, to its own bottom depth. The index is built
+        from a single ``data_table`` call and cached on this object, so
+        that point, overlap and containment queries are answered in
+        O(log n + k) instead of an ``*_at_depth`` call each. It is dropped,
+        and rebuilt on the next call, after the items have been changed
+        through the ``insert_*``, ``remove_*`` and ``data_table`` members of
+        this object, or after a call to ``Borehole.clear_log_contents`` or
+        any of the Borehole processing methods.
+
+        Returns
+        -------
+        IntervalIndex
+            The interval index of the log.
+
+        Raises
+        ------
+        ValueError
+            If the log does not hold interval items.
+
+        Example
+        -------
+        >>> index = litho_log.interval_index()
+        >>> index.at_depth(125.3)
+        [41]
+        >>> index.within(100.0, 200.0)
+        [37, 38, 39, 40, 41, 42]
+        """
+        from ._interval_index import IntervalIndex
+        index = getattr(self, "_interval_index", None)
+        if index is None or not index.is_valid:
+            log_type = self.type
+            if log_type not in _INTERVAL_LOG_TYPES:
+                raise ValueError(f"{self.name!r} does not hold interval items")
+            rows = self.data_table[1:]
+            if log_type == 9:
+                bottoms = [row[0] for row in rows]
+                tops = [min(self.top_depth, bottoms[0]) if bottoms else 0.0] + bottoms[:-1]
+            else:
+                tops, bottoms = [row[0] for row in rows], [row[1] for row in rows]
+            index = self._interval_index = IntervalIndex(tops, bottoms)
+        return index
+
+    def invalidate_interval_index(self):
+        """Discards the cached interval index of the log.
+
+        Needed only when the items of the log were changed in WellCAD itself
+        or through its dispatch object directly.
+        """
+        self._interval_index = None
+
     def insert_data(self, index, value):
         """Inserts a new data value at the specified index.
 
@@ -564,6 +772,8 @@ class Log(DispatchWrapper):
             If the data couldn't be inserted (out-of-bounds index or other)
         """
         self._dispatch.InsertData(index, value)
+        self._depth_index = None
+        self._interval_index = None
 
     def insert_data_at_depth(self, depth, value):
         """Inserts a new data value at the specified depth.
@@ -580,6 +790,8 @@ class Log(DispatchWrapper):
             The new data value
         """
         self._dispatch.InsertDataAtDepth(depth, value)
+        self._depth_index = None
+        self._interval_index = None
 
     @property
     def formula(self):
@@ -631,6 +843,7 @@ class Log(DispatchWrapper):
         IntervalItem
             The newly inserted interval item.
         """
+        self._interval_index = None
         return IntervalItem(self._dispatch.InsertNewIntervalItem(top_depth, bottom_depth, value))
 
     def interval_item(self, index):
@@ -651,6 +864,12 @@ class Log(DispatchWrapper):
         """
         return IntervalItem(self._dispatch.IntervalItem(index))
 
+    @property
+    def interval_items(self):
+        """ItemSequence: The intervals of an Interval Log, as a lazy sequence of
+        :class:`IntervalItem` objects."""
+        return ItemSequence(self, "IntervalItem", IntervalItem)
+
     def interval_item_at_depth(self, depth):
         """Gets an interval item object from an Interval Log at the specified depth.
 
@@ -719,6 +938,8 @@ class Log(DispatchWrapper):
             Zero based index for the data point to be removed
         """
         self._dispatch.RemoveData(index)
+        self._depth_index = None
+        self._interval_index = None
 
     def remove_data_at_depth(self, depth):
         """Removes a data point from a Mud or Well Log.
@@ -733,6 +954,8 @@ class Log(DispatchWrapper):
             will be removed.
         """
         self._dispatch.RemoveDataAtDepth(depth)
+        self._depth_index = None
+        self._interval_index = None
 
     def remove_interval_item(self, index):
         """Removes a data interval from an Interval log.
@@ -743,6 +966,7 @@ class Log(DispatchWrapper):
             Zero based index to specify which data interval will be removed.
         """
         self._dispatch.RemoveIntervalItem(index)
+        self._interval_index = None
 
     def remove_interval_item_at_depth(self, depth):
         """Removes a data interval from an Interval log.
@@ -754,6 +978,7 @@ class Log(DispatchWrapper):
             will be removed.
         """
         self._dispatch.RemoveIntervalItemAtDepth(depth)
+        self._interval_index = None
 
     @property
     def shading(self):
@@ -858,6 +1083,12 @@ class Log(DispatchWrapper):
         """
         return FossilItem(self._dispatch.FossilItem(index))
 
+    @property
+    def fossil_items(self):
+        """ItemSequence: The items of a CoreDesc or Bio Log, as a lazy sequence of
+        :class:`FossilItem` objects."""
+        return ItemSequence(self, "FossilItem", FossilItem)
+
     def fossil_item_at_depth(self, depth):
         """Gets a fossil item object from the CoreDesc Log at the specified depth.
 
@@ -899,6 +1130,7 @@ class Log(DispatchWrapper):
         FossilItem
             The newly created FossilItem.
         """
+        self._interval_index = None
         return FossilItem(self._dispatch.InsertNewFossilItem(top_depth, bottom_depth, litho_code, abundance, dominance, position))
 
     def insert_new_litho_bed(self, top_depth, bottom_depth, litho_code, value, position):
@@ -923,6 +1155,7 @@ class Log(DispatchWrapper):
         LithoBed
             The newly created LithoBed.
         """
+        self._interval_index = None
         return LithoBed(self._dispatch.InsertNewLithoBed(top_depth, bottom_depth, litho_code, value, position))
 
     def get_litho_bed(self, index):
@@ -942,6 +1175,12 @@ class Log(DispatchWrapper):
         """
         return LithoBed(self._dispatch.GetLithoBed(index))
 
+    @property
+    def litho_beds(self):
+        """ItemSequence: The beds of a Litho Log, as a lazy sequence of
+        :class:`LithoBed` objects."""
+        return ItemSequence(self, "GetLithoBed", LithoBed)
+
     def set_litho_bed(self, index, litho_bed):
         """Sets a LithoBed object at the specified index from another
         LithoBed object.
@@ -954,6 +1193,7 @@ class Log(DispatchWrapper):
             The LithoBed object to copy.
         """
         self._dispatch.SetLithoBed(index, litho_bed._dispatch)
+        self._interval_index = None
 
     def get_litho_bed_at_depth(self, depth):
         """Gets a LithoBed object at the specified depth from a Lithology Log.
@@ -982,6 +1222,7 @@ class Log(DispatchWrapper):
             The LithoBed object to copy.
         """
         self._dispatch.SetLithoBedAtDepth(depth, litho_bed._dispatch)
+        self._interval_index = None
 
     @property
     def litho_dictionary(self):
@@ -1001,6 +1242,7 @@ class Log(DispatchWrapper):
             Zero based index of the fossil item to be removed.
         """
         self._dispatch.RemoveFossilItem(index)
+        self._interval_index = None
 
     def remove_fossil_item_at_depth(self, depth):
         """Removes an item at the specified index from a CoreDesc Log.
@@ -1011,6 +1253,7 @@ class Log(DispatchWrapper):
             the depth value of the symbol in current depth units at which it will be removed.
         """
         self._dispatch.RemoveFossilItemAtDepth(depth)
+        self._interval_index = None
 
     def remove_litho_bed(self, index):
         """Removes a lithology bed from the Lithology log at the specified index.
@@ -1021,6 +1264,7 @@ class Log(DispatchWrapper):
             Zero based index of the lithology bed item to be removed.
         """
         self._dispatch.RemoveLithoBed(index)
+        self._interval_index = None
 
     def remove_litho_bed_at_depth(self, depth):
         """Removes a lithology bed from the Lithology log at the specified depth.
@@ -1031,6 +1275,7 @@ class Log(DispatchWrapper):
             the depth value in current depth units at which the lithological bed will be removed.
         """
         self._dispatch.RemoveLithoBedAtDepth(depth)
+        self._interval_index = None
 
     def insert_trace(self, index):
         """Inserts a new data trace into an Image, FWS or Analysis Log at the specified index.
@@ -1047,6 +1292,8 @@ class Log(DispatchWrapper):
             For Image and Analysis logs, existing traces will be shifted upwards depth wise.
         """
         self._dispatch.InsertTrace(index)
+        self._depth_index = None
+        self._interval_index = None
 
     def insert_trace_at_depth(self, depth):
         """Inserts a new data trace into an Image, FWS or Analysis or Percent Log at the specified depth.
@@ -1071,6 +1318,8 @@ class Log(DispatchWrapper):
 
         """
         self._dispatch.InsertTraceAtDepth(depth)
+        self._depth_index = None
+        self._interval_index = None
 
     def remove_trace(self, index):
         """Remove an entire data trace from an Image, FWS, Analysis
@@ -1090,6 +1339,8 @@ class Log(DispatchWrapper):
             Zero based index of the trace (0 = bottom depth).
         """
         self._dispatch.RemoveTrace(index)
+        self._depth_index = None
+        self._interval_index = None
 
     def remove_trace_at_depth(self, depth):
         """Remove an entire data trace from an Image, FWS, Analysis or
@@ -1110,6 +1361,8 @@ class Log(DispatchWrapper):
             will be removed or set to No-Data value.
         """
         self._dispatch.RemoveTraceAtDepth(depth)
+        self._depth_index = None
+        self._interval_index = None
 
     def get_trace_data(self, depth_index, trace_index):
         """Gets the data value at the specified row index and position within the trace
@@ -1227,6 +1480,171 @@ class Log(DispatchWrapper):
     def trace_sample_rate(self, rate):
         self._dispatch.TraceSampleRate = rate
 
+    def trace_array(self, masked=False, index_order=False):
+        """Reads all traces of an Image, RGB, FWS, Analysis or Percent Log
+        into a 2-D NumPy array.
+
+        The data is fetched with a single ``data_table`` call instead of one
+        ``get_trace_data`` call per value. Requires NumPy.
+
+        Parameters
+        ----------
+        masked : bool, optional
+            If True, the values are returned as a ``numpy.ma.MaskedArray``
+            with the values equal to ``null_value`` masked. Otherwise (the
+            default) these values are set to NaN.
+        index_order : bool, optional
+            If False (the default), the rows are sorted from top to bottom.
+            If True, row ``i`` holds the trace at depth index ``i`` as used by
+            ``get_trace_data``, i.e. the rows start at the bottom for FWS,
+            Image, RGB and Analysis Logs and at the top for Percent Logs.
+
+        Returns
+        -------
+        depths : numpy.ndarray
+            The depths of the traces in current depth units.
+        positions : numpy.ndarray
+            The positions along the trace, computed from ``trace_offset``
+            and ``trace_sample_rate``.
+        values : numpy.ndarray or numpy.ma.MaskedArray
+            The float64 data values, of shape ``(len(depths), trace_length)``.
+
+        Example
+        -------
+        >>> depths, positions, image = borehole.get_log("ATV").trace_array()
+        >>> image.shape
+        (1000, 360)
+        """
+        import numpy
+        from ._arrays import trace_table_to_numpy
+        depths, values = trace_table_to_numpy(self.data_table, self.null_value, masked)
+        positions = self.trace_offset + numpy.arange(values.shape[1]) * self.trace_sample_rate
+        if index_order and self._bottom_first():
+            depths, values = depths[::-1].copy(), values[::-1].copy()
+        return depths, positions, values
+
+    def set_trace_array(self, depths, values, null_value=None, trace_offset=None, trace_sample_rate=None,
+                        index_order=False):
+        """Writes a 2-D NumPy array into an Image, RGB, FWS, Analysis or
+        Percent Log.
+
+        The DataTable payload is built from the arrays in one go and written
+        with a single ``data_table`` put, instead of one ``set_trace_data``
+        call per value. The put replaces the traces of the log, whose trace
+        length becomes the number of columns of ``values``. The arrays are
+        checked before anything is written, so a rejected call leaves the
+        log unchanged. Requires NumPy.
+
+        Parameters
+        ----------
+        depths : array_like
+            The depths of the traces in current depth units. They must be
+            strictly increasing, or strictly decreasing if ``index_order`` is
+            True and the log is bottom-first.
+        values : array_like
+            The data values, of shape ``(len(depths), trace_length)``. NaN
+            values and masked values are written as ``null_value``.
+        null_value : float, optional
+            If given, the null value of the log is set to this value first.
+            Otherwise the current null value of the log is used.
+        trace_offset : float, optional
+            If given, the trace offset of the log is set to this value first.
+        trace_sample_rate : float, optional
+            If given, the trace sample rate of the log is set to this value
+            first.
+        index_order : bool, optional
+            If True, the rows of ``values`` are in depth index order as
+            returned by ``trace_array(index_order=True)``.
+
+        Raises
+        ------
+        ValueError
+            If the depths are not sorted or the shapes of the arrays do not
+            match.
+        """
+        import numpy
+        from ._arrays import numpy_to_rows
+        depths, values = numpy.asarray(depths, numpy.float64), numpy.ma.asarray(values)
+        if values.ndim != 2 or len(values) != len(depths):
+            raise ValueError(f"Expected values of shape ({len(depths)}, trace_length), got {values.shape}")
+        if index_order and self._bottom_first():
+            depths, values = depths[::-1], values[::-1]
+        rows = numpy_to_rows(depths, values, self.null_value if null_value is None else null_value)
+        if null_value is not None:
+            self.null_value = null_value
+        if trace_offset is not None:
+            self.trace_offset = trace_offset
+        if trace_sample_rate is not None:
+            self.trace_sample_rate = trace_sample_rate
+        offset, rate = self.trace_offset, self.trace_sample_rate
+        header = ("Depth",) + tuple(f"{offset + i * rate:g}" for i in range(values.shape[1]))
+        self.data_table = (header,) + rows
+
+    def iter_windows(self, depth_step, overlap=0.0, masked=False, directory=None):
+        """Reads the data of a log window by window, from top to bottom.
+
+        The whole log is never loaded at once: WellCAD exports the log to a
+        temporary CSV file, which is then read back one window at a time.
+        This keeps the peak memory use proportional to the window size, so
+        filters and picks can be run over multi-kilometre Image and FWS Logs
+        in a streaming pipeline. Works for Well, Mud, Formula, Depth, FWS,
+        Image, RGB, Analysis and Percent Logs. Requires NumPy.
+
+        Parameters
+        ----------
+        depth_step : float
+            The depth range of new data in each window in current depth
+            units. The first window starts at the depth of the first sample
+            in the export, which is below the top depth of the log if the
+            log starts with a gap. Later windows start a multiple of
+            ``depth_step`` below it.
+        overlap : float, optional
+            The depth range at the bottom of the previous window that is
+            repeated at the top of each window, e.g. to give a filter enough
+            context. Defaults to 0.
+        masked : bool, optional
+            If True, the values are returned as a ``numpy.ma.MaskedArray``
+            with the values equal to ``null_value`` masked. Otherwise (the
+            default) these values are set to NaN.
+        directory : str, optional
+            The directory of the temporary export file. Defaults to the
+            system temporary directory.
+
+        Yields
+        ------
+        depths : numpy.ndarray
+            The depths of the samples in the window.
+        values : numpy.ndarray or numpy.ma.MaskedArray
+            The data values. 1-D for Well Logs and of shape
+            ``(len(depths), trace_length)`` for trace logs. Windows without
+            any samples are skipped.
+
+        Raises
+        ------
+        RuntimeError
+            If the log could not be exported.
+
+        Example
+        -------
+        >>> for depths, image in borehole.get_log("ATV").iter_windows(10.0, overlap=0.5):
+        ...     process(depths, image)
+        """
+        import csv
+        import os
+        import tempfile
+        from ._arrays import iter_row_windows
+        null_value = self.null_value
+        with tempfile.TemporaryDirectory(dir=directory) as temp_dir:
+            if not self.file_export(temp_dir, "data", "csv", False):
+                raise RuntimeError(f"Could not export log {self.name!r} to {temp_dir}")
+            with open(os.path.join(temp_dir, "data.csv"), newline="", encoding="utf-8-sig") as f:
+                yield from iter_row_windows(csv.reader(f), depth_step, overlap, null_value, masked)
+
+    def _bottom_first(self):
+        # Depth index 0 is the bottom depth for the logs with a constant
+        # sample step, FWS Logs included.
+        return self.type in (1, 2, 4, 5, 10, 11, 12, 14)
+
     def get_column_name(self, column):
         """Gets set the name of a Strata Log column.
 
@@ -1269,6 +1687,12 @@ class Log(DispatchWrapper):
         """
         return CommentBox(self._dispatch.CommentBox(index))
 
+    @property
+    def comment_boxes(self):
+        """ItemSequence: The comment boxes of a Comment Log, as a lazy sequence of
+        :class:`CommentBox` objects."""
+        return ItemSequence(self, "CommentBox", CommentBox)
+
     def comment_box_at_depth(self, depth):
         """Gets the Comment Box object from the Comment Log at the specified depth.
 
@@ -1301,6 +1725,7 @@ class Log(DispatchWrapper):
         CommentBox
             The newly created CommentBox.
         """
+        self._interval_index = None
         return CommentBox(self._dispatch.InsertNewCommentBox(top_depth, bottom_depth, text))
 
     def marker(self, index):
@@ -1318,6 +1743,12 @@ class Log(DispatchWrapper):
         """
         return MarkerItem(self._dispatch.Marker(index))
 
+    @property
+    def markers(self):
+        """ItemSequence: The markers of a Marker Log, as a lazy sequence of
+        :class:`MarkerItem` objects."""
+        return ItemSequence(self, "Marker", MarkerItem)
+
     def marker_by_name(self, name):
         """Gets the marker with the specified name.
 
@@ -1363,6 +1794,7 @@ class Log(DispatchWrapper):
             Zero based index at which the comment box will be removed.
         """
         self._dispatch.RemoveCommentBox(index)
+        self._interval_index = None
 
     def remove_comment_box_at_depth(self, depth):
         """Removes a comment box from the Comment log at the specified depth.
@@ -1373,6 +1805,7 @@ class Log(DispatchWrapper):
             The depth value in current depth units at which the comment box will be removed.
         """
         self._dispatch.RemoveCommentBoxAtDepth(depth)
+        self._interval_index = None
 
     def remove_marker(self, index):
         """Removes the marker from a Marker Log at the specified index.
@@ -1505,6 +1938,153 @@ class Log(DispatchWrapper):
         """
         return Structure(self._dispatch.Structure(index))
 
+    @property
+    def structures(self):
+        """ItemSequence: The structures of a Structure Log, as a lazy sequence of
+        :class:`Structure` objects."""
+        return ItemSequence(self, "Structure", Structure)
+
+    def structures_to_array(self):
+        """Reads the picks of a Structure, Breakout or Lineation Log into a
+        NumPy structured array.
+
+        The picks are fetched with a single ``data_table`` call, instead of
+        one ``structure`` call and several property gets per pick. Requires
+        NumPy.
+
+        The fields of the array depend on the log type:
+
+        * Structure Log: ``depth``, ``azimuth``, ``dip``, ``aperture``
+        * Breakout Log: ``depth``, ``azimuth``, ``tilt``, ``length``,
+          ``opening``
+        * Lineation Log: ``depth``, ``trend``, ``plunge``, ``eccentricity``
+
+        followed by one field per attribute of the log (e.g. ``type`` or
+        ``confidence``), named after the attribute in lower case. Attributes
+        holding numbers are float64 fields, with NaN for empty values, others
+        are string fields. Angles are in degrees and depths in current depth
+        units.
+
+        Returns
+        -------
+        numpy.ndarray
+            A structured array with one record per pick, sorted by depth.
+
+        Raises
+        ------
+        ValueError
+            If the log is not a Structure, Breakout or Lineation Log.
+
+        Example
+        -------
+        >>> picks = borehole.get_log("FMI Picks").structures_to_array()
+        >>> picks.dtype.names
+        ('depth', 'azimuth', 'dip', 'aperture', 'type')
+        >>> steep = picks[picks["dip"] > 60]
+        """
+        from ._arrays import table_to_records
+        try:
+            fields = _PICK_FIELDS[self.type]
+        except KeyError:
+            raise ValueError(f"{self.name!r} is not a Structure, Breakout or Lineation Log") from None
+        return table_to_records(self.data_table, fields)
+
+    def insert_structures(self, picks, tolerance=0.0, on_duplicate="report", borehole=None):
+        """Inserts many structures into a Structure Log at once.
+
+        The picks are checked and sorted in Python, merged with the
+        structures already in the log and written with a single
+        ``data_table`` put, instead of one ``insert_new_structure_ex`` call
+        per pick. Nothing is written if a pick is invalid. Picks lying within
+        ``tolerance`` of another pick are reported in the same pass. Requires
+        NumPy.
+
+        Parameters
+        ----------
+        picks : array_like
+            A structured array with the fields ``depth``, ``azimuth``,
+            ``dip`` and ``aperture``, as returned by
+            :meth:`structures_to_array`, or an array of shape ``(n, 4)``
+            holding these columns. Other fields of a structured array are
+            written to the attribute of the same name (in lower case, with
+            spaces replaced by underscores), which is created if the log
+            doesn't have it yet.
+        tolerance : float, optional
+            The depth tolerance in current depth units within which two
+            picks are duplicates. Defaults to 0, i.e. only picks at the same
+            depth are duplicates.
+        on_duplicate : {"report", "skip", "raise"}, optional
+            Whether duplicates are inserted and reported (the default), left
+            out, or make the method raise a ``ValueError`` before anything is
+            written.
+        borehole : Borehole, optional
+            The borehole document of the log. If given, the write is done
+            inside :meth:`Borehole.bulk_edit`, so the document is redrawn
+            once.
+
+        Returns
+        -------
+        numpy.ndarray
+            The indices into ``picks`` of the duplicates, i.e. the picks
+            lying within ``tolerance`` of a structure already in the log or
+            of a shallower pick (or an earlier pick at the same depth).
+
+        Raises
+        ------
+        ValueError
+            If the log is not a Structure Log, a pick has a missing, non
+            finite or out of range value (azimuth outside [0, 360], dip
+            outside [0, 90] or negative aperture), or a duplicate is found
+            and ``on_duplicate`` is "raise".
+
+        Example
+        -------
+        >>> picks = numpy.array([(101.2, 45.0, 30.0, 0.001), (101.9, 50.0, 32.0, 0.0)])
+        >>> log.insert_structures(picks, tolerance=0.01, borehole=borehole)
+        array([], dtype=int64)
+        """
+        return self._insert_picks(6, picks, tolerance, on_duplicate, borehole)
+
+    def _insert_picks(self, log_type, picks, tolerance, on_duplicate, borehole):
+        import contextlib
+        import numpy
+        from ._arrays import pick_columns, duplicate_picks, field_key
+        if on_duplicate not in ("report", "skip", "raise"):
+            raise ValueError(f"on_duplicate must be 'report', 'skip' or 'raise', not {on_duplicate!r}")
+        if self.type != log_type:
+            raise ValueError(f"{self.name!r} is not a {_PICK_LOG_NAMES[log_type]} Log")
+        fields = _PICK_FIELDS[log_type]
+        columns, extras = pick_columns(picks, fields)
+        table = self.data_table
+        header, rows = (tuple(table[0]), table[1:]) if table else (_PICK_TITLES[log_type], ())
+        depths = columns["depth"]
+        duplicates = duplicate_picks([row[0] for row in rows], depths, tolerance)
+        if len(duplicates) and on_duplicate == "raise":
+            raise ValueError(f"{len(duplicates)} picks are duplicates, the first one at depth "
+                             f"{depths[duplicates[0]]:g}")
+        keep = slice(None)
+        if len(duplicates) and on_duplicate == "skip":
+            keep = numpy.ones(len(depths), bool)
+            keep[duplicates] = False
+
+        with borehole.bulk_edit() if borehole is not None else contextlib.nullcontext():
+            titles = {field_key(title): i for i, title in enumerate(header[len(fields):], len(fields))}
+            for name in extras:
+                if field_key(name) not in titles:
+                    self.insert_new_attribute(name)
+                    titles[field_key(name)] = len(header)
+                    header += (name,)
+            values = [columns[name][keep].tolist() for name in fields]
+            values += [[""] * len(values[0])] * (len(header) - len(fields))
+            for name, array in extras.items():
+                values[titles[field_key(name)]] = array[keep].tolist()
+            new_rows = zip(*values)
+            if rows and len(rows[0]) < len(header):
+                padding = ("",) * (len(header) - len(rows[0]))
+                rows = [tuple(row) + padding for row in rows]
+            self.data_table = (header,) + tuple(sorted(itertools.chain(rows, new_rows), key=itemgetter(0)))
+        return duplicates
+
     def structure_at_depth(self, depth):
         """Gets the closest Structure object from the Structure Log
         to the specified depth in current depth units.
@@ -1588,6 +2168,12 @@ class Log(DispatchWrapper):
         """
         return Structure(self._dispatch.Breakout(index))
 
+    @property
+    def breakouts(self):
+        """ItemSequence: The breakouts of a Breakout Log, as a lazy sequence of
+        :class:`Structure` objects."""
+        return ItemSequence(self, "Breakout", Structure)
+
     def breakout_at_depth(self, depth):
         """Gets a breakout structure from the Breakout Log at the specified
         depth in current depth units.
@@ -1633,6 +2219,43 @@ class Log(DispatchWrapper):
         """
         return Structure(self._dispatch.InsertNewBreakoutEx(depth, azimuth, tilt, length, opening))
 
+    def insert_breakouts(self, picks, tolerance=0.0, on_duplicate="report", borehole=None):
+        """Inserts many breakouts into a Breakout Log at once.
+
+        Works like :meth:`insert_structures`, with a single ``data_table``
+        put instead of one ``insert_new_breakout_ex`` call per pick. Unlike
+        ``insert_new_breakout_ex``, no mirrored breakouts are added. Requires
+        NumPy.
+
+        Parameters
+        ----------
+        picks : array_like
+            A structured array with the fields ``depth``, ``azimuth``,
+            ``tilt``, ``length`` and ``opening``, or an array of shape
+            ``(n, 5)`` holding these columns. Other fields of a structured
+            array are written to the attribute of the same name.
+        tolerance : float, optional
+            The depth tolerance in current depth units within which two
+            picks are duplicates. Defaults to 0.
+        on_duplicate : {"report", "skip", "raise"}, optional
+            Whether duplicates are inserted and reported (the default), left
+            out, or make the method raise a ``ValueError``.
+        borehole : Borehole, optional
+            If given, the write is done inside :meth:`Borehole.bulk_edit`.
+
+        Returns
+        -------
+        numpy.ndarray
+            The indices into ``picks`` of the duplicates.
+
+        Raises
+        ------
+        ValueError
+            If the log is not a Breakout Log, a pick is invalid or a
+            duplicate is found and ``on_duplicate`` is "raise".
+        """
+        return self._insert_picks(25, picks, tolerance, on_duplicate, borehole)
+
     def remove_breakout(self, index):
         """Removes a breakout structure from the Breakout Log at the specified
         index.
@@ -1674,6 +2297,12 @@ class Log(DispatchWrapper):
         """
         return Structure(self._dispatch.Lineation(index))
 
+    @property
+    def lineations(self):
+        """ItemSequence: The lineations of a Lineation Log, as a lazy sequence of
+        :class:`Structure` objects."""
+        return ItemSequence(self, "Lineation", Structure)
+
     def lineation_at_depth(self, depth):
         """Gets a lineation structure from the Lineation Log at the specified
         depth in current depth units.
@@ -1717,6 +2346,43 @@ class Log(DispatchWrapper):
         """
         return Structure(self._dispatch.InsertNewLineationEx(depth, trend, plunge, eccentricity))
 
+    def insert_lineations(self, picks, tolerance=0.0, on_duplicate="report", borehole=None):
+        """Inserts many lineations into a Lineation Log at once.
+
+        Works like :meth:`insert_structures`, with a single ``data_table``
+        put instead of one ``insert_new_lineation_ex`` call per pick.
+        Requires NumPy.
+
+        Parameters
+        ----------
+        picks : array_like
+            A structured array with the fields ``depth``, ``trend``,
+            ``plunge`` and ``eccentricity``, or an array of shape ``(n, 4)``
+            holding these columns. Other fields of a structured array are
+            written to the attribute of the same name.
+        tolerance : float, optional
+            The depth tolerance in current depth units within which two
+            picks are duplicates. Defaults to 0.
+        on_duplicate : {"report", "skip", "raise"}, optional
+            Whether duplicates are inserted and reported (the default), left
+            out, or make the method raise a ``ValueError``.
+        borehole : Borehole, optional
+            If given, the write is done inside :meth:`Borehole.bulk_edit`.
+
+        Returns
+        -------
+        numpy.ndarray
+            The indices into ``picks`` of the duplicates.
+
+        Raises
+        ------
+        ValueError
+            If the log is not a Lineation Log, a pick is invalid (e.g. an
+            eccentricity outside [-1, 1]) or a duplicate is found and
+            ``on_duplicate`` is "raise".
+        """
+        return self._insert_picks(27, picks, tolerance, on_duplicate, borehole)
+
     def remove_lineation(self, index):
         """Removes a lineation from the Lineation Log at the
         specified index.
@@ -1796,6 +2462,7 @@ class Log(DispatchWrapper):
         PolarAndRoseBox
             The newly created Polar & Rose box.
         """
+        self._interval_index = None
         return PolarAndRoseBox(self._dispatch.InsertNewSchmitBox(top_depth, bottom_depth, text))
 
     def schmit_box(self, index):
@@ -1814,6 +2481,12 @@ class Log(DispatchWrapper):
         """
         return PolarAndRoseBox(self._dispatch.SchmitBox(index))
 
+    @property
+    def schmit_boxes(self):
+        """ItemSequence: The boxes of a Polar & Rose Log, as a lazy sequence of
+        :class:`PolarAndRoseBox` objects."""
+        return ItemSequence(self, "SchmitBox", PolarAndRoseBox)
+
     def schmit_box_at_depth(self, depth):
         """Gets a box object from the Polar & Rose Log
         at the specified depth in current depth units.
@@ -1840,6 +2513,7 @@ class Log(DispatchWrapper):
             Zero based index of the Polar & Rose box to be removed.
         """
         self._dispatch.RemoveSchmitBox(index)
+        self._interval_index = None
 
     def remove_schmit_box_at_depth(self, depth):
         """Removes a box from the Polar & Rose log at the specified
@@ -1852,6 +2526,7 @@ class Log(DispatchWrapper):
             current depth units.
         """
         self._dispatch.RemoveSchmitBoxAtDepth(depth)
+        self._interval_index = None
 
     def cross_box(self, index):
         """Gets a Cross Box object from the Cross Section Log at the specified index.
@@ -1868,6 +2543,12 @@ class Log(DispatchWrapper):
         """
         return CrossSectionBox(self._dispatch.CrossBox(index))
 
+    @property
+    def cross_boxes(self):
+        """ItemSequence: The boxes of a Cross Section Log, as a lazy sequence of
+        :class:`CrossSectionBox` objects."""
+        return ItemSequence(self, "CrossBox", CrossSectionBox)
+
     def cross_box_at_depth(self, depth):
         """Gets a Cross Box object from the Cross Section Log at the specified depth in current depth units.
 
@@ -1898,6 +2579,7 @@ class Log(DispatchWrapper):
         CrossSectionBox
             The newly created CrossSectionBox.
         """
+        self._interval_index = None
         return CrossSectionBox(self._dispatch.InsertNewCrossBox(top_depth, bottom_depth))
 
     def remove_cross_box(self, index):
@@ -1909,6 +2591,7 @@ class Log(DispatchWrapper):
             Zero based index of the box to be removed.
         """
         self._dispatch.RemoveCrossBox(index)
+        self._interval_index = None
 
     def remove_cross_box_at_depth(self, depth):
         """Removes a box from the Cross Section Log at the specified depth.
@@ -1919,6 +2602,7 @@ class Log(DispatchWrapper):
             The depth in current units at which the box will be removed.
         """
         self._dispatch.RemoveCrossBoxAtDepth(depth)
+        self._interval_index = None
 
     def insert_new_stack_item(self, top_depth, bottom_depth, top_width, bottom_width):
         """Inserts a new data interval into a Stacking Pattern Log.
@@ -1939,6 +2623,7 @@ class Log(DispatchWrapper):
         StackingPatternItem
             The newly created StackingPatternItem.
         """
+        self._interval_index = None
         return StackingPatternItem(self._dispatch.InsertNewStackItem(top_depth, bottom_depth, top_width, bottom_width))
 
     def stack_item(self, index):
@@ -1958,6 +2643,12 @@ class Log(DispatchWrapper):
         """
         return StackingPatternItem(self._dispatch.StackItem(index))
 
+    @property
+    def stack_items(self):
+        """ItemSequence: The items of a Stacking Pattern Log, as a lazy sequence of
+        :class:`StackingPatternItem` objects."""
+        return ItemSequence(self, "StackItem", StackingPatternItem)
+
     def stack_item_at_depth(self, depth):
         """Gets a Stack Item object from the Stacking Pattern Log at the specified depth in current depth units.
 
@@ -1982,6 +2673,7 @@ class Log(DispatchWrapper):
             Zero based index  of the stacking pattern box to be removed.
         """
         self._dispatch.RemoveStackItem(index)
+        self._interval_index = None
 
     def remove_stack_item_at_depth(self, depth):
         """Removes an item from the Stacking Pattern Log at the specified depth.
@@ -1992,6 +2684,7 @@ class Log(DispatchWrapper):
             The depth of the stack item to be removed in current depth units.
         """
         self._dispatch.RemoveStackItemAtDepth(depth)
+        self._interval_index = None
 
     @property
     def used_as_depth_scale(self):
@@ -2040,6 +2733,12 @@ class Log(DispatchWrapper):
         """
         return DrillItem(self._dispatch.DrillItem(index))
 
+    @property
+    def drill_items(self):
+        """ItemSequence: The drill items of an Engineering Log, as a lazy sequence of
+        :class:`DrillItem` objects."""
+        return ItemSequence(self, "DrillItem", DrillItem, "nb_of_drill_item")
+
     def drill_item_at_depth(self, depth):
         """Gets a Drill Item object from the Engineering Log at the
         specified depth.
@@ -2073,6 +2772,12 @@ class Log(DispatchWrapper):
         """
         return EquipmentItem(self._dispatch.EqpItem(index))
 
+    @property
+    def eqp_items(self):
+        """ItemSequence: The equipment items of an Engineering Log, as a lazy sequence of
+        :class:`EquipmentItem` objects."""
+        return ItemSequence(self, "EqpItem", EquipmentItem, "nb_of_eqp_item")
+
     @property
     def comment_style(self):
         """int: The position of the comment associated with an engineering log.
@@ -2129,6 +2834,7 @@ class Log(DispatchWrapper):
         DrillItem
             The inserted DrillItem
         """
+        self._interval_index = None
         return DrillItem(self._dispatch.InsertNewDrillItem(bottom_depth, diameter))
 
     def insert_new_eqp_item(self, top_depth, bottom_depth, name):
@@ -2198,6 +2904,7 @@ class Log(DispatchWrapper):
             Zero based index at which the item will be removed.
         """
         self._dispatch.RemoveDrillItem(index)
+        self._interval_index = None
 
     def remove_eqp_item(self, index):
         """Removes an equipment item at the specified depth index
@@ -2357,3 +3064,86 @@ class Log(DispatchWrapper):
             the password needed to make changes to the protection level.
         """
         self._dispatch.AllowViewLogHistory(export, password)
+
+    def snapshot(self, fields=None):
+        """Captures the display properties of the log.
+
+        The values read are also remembered on this object, so that a later
+        :meth:`apply` only writes the properties that differ from them.
+
+        Parameters
+        ----------
+        fields : iterable of str, optional
+            The names of the properties to capture, e.g. ``["pen_color",
+            "pen_width"]``. By default all display properties (pen, scale,
+            grid, border, background, shading, style and position).
+
+        Returns
+        -------
+        LogSnapshot
+            A frozen record of the property values, to be passed to
+            :meth:`apply`.
+
+        Example
+        -------
+        >>> style = borehole.get_log("GR").snapshot()
+        >>> for i in range(1, borehole.nb_of_logs):
+        ...     borehole.get_log(i).apply(style)
+        """
+        from ._log_snapshot import LogSnapshot
+        snapshot = LogSnapshot.from_log(self, fields)
+        self._remember_display(snapshot)
+        return snapshot
+
+    def apply(self, snapshot, current=None):
+        """Sets the display properties of the log from a snapshot.
+
+        The log remembers the display properties last read with
+        :meth:`snapshot` or written with :meth:`apply` through this object.
+        Only the captured properties whose value differs from the remembered
+        one are written, and none is read, so applying a snapshot never costs
+        more COM calls than writing all its properties, and applying it again
+        costs none. Properties whose value is not known yet are written.
+        Properties not captured in the snapshot are left untouched.
+
+        Changes made in WellCAD itself or through another ``Log`` object of
+        the same log are not seen; pass a fresh ``current`` snapshot in that
+        case.
+
+        Parameters
+        ----------
+        snapshot : LogSnapshot
+            The snapshot to apply, as returned by :meth:`snapshot`.
+        current : LogSnapshot, optional
+            A snapshot of the current state of this log, compared with
+            instead of the remembered values.
+
+        Returns
+        -------
+        dict
+            The properties that were written, with their new values.
+        """
+        if current is None:
+            current = getattr(self, "_display", None)
+            if current is None:
+                current = snapshot._make((None,) * len(snapshot))
+        else:
+            self._remember_display(current)
+        changes = snapshot.diff(current)
+        for name, value in changes.items():
+            setattr(self, name, value)
+        self._remember_display(snapshot)
+        return changes
+
+    def _remember_display(self, snapshot):
+        """Merges the captured properties of a snapshot into the remembered
+        display state of the log."""
+        known = getattr(self, "_display", None)
+        self._display = snapshot if known is None else known._replace(**snapshot.captured())
+
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        # A display property set directly makes its remembered value stale.
+        known = getattr(self, "_display", None) if name[0] != "_" else None
+        if known is not None and name in known._fields:
+            self._display = known._replace(**{name: None})
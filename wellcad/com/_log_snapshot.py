@@ -0,0 +1,87 @@
+import collections
+
+# The Log properties that make up the look of a log, in the order they are
+# applied. The scale mode comes before the scale limits so that limits valid
+# for a logarithmic scale are not rejected by a linear one and vice versa.
+DISPLAY_PROPERTIES = (
+    "left_position", "right_position", "hide_log_title", "hide_log_data", "title_comment",
+    "log_background_color", "use_log_colored_background", "background_color", "background_hatch_style",
+    "background_style", "border_style", "border_width", "border_color", "display_border",
+    "mask_contacts", "mask_horizontal_grid", "scale_mode", "scale_low", "scale_high", "scale_reversed",
+    "maj_grid_enable", "min_grid_enable", "maj_grid_spacing", "min_grid_spacing", "fixed_bar_width",
+    "pen_color", "pen_style", "pen_width", "shading", "style", "comment_style",
+)
+
+
+class LogSnapshot(collections.namedtuple("LogSnapshot", DISPLAY_PROPERTIES)):
+    """A frozen record of the display properties of a log.
+
+    Created with ``Log.snapshot()`` and written back, to the same or another
+    log, with ``Log.apply()``. Each field holds the value of the ``Log``
+    property of the same name, or None if the property was not captured.
+    Being a named tuple, a snapshot can be compared, hashed and changed into
+    a new snapshot with ``_replace``.
+
+    Example
+    -------
+    >>> style = borehole.get_log("GR").snapshot()
+    >>> style = style._replace(pen_color=0x0000FF)
+    >>> for name in ("GR2", "GR3"):
+    ...     borehole.get_log(name).apply(style)
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def from_log(cls, log, fields=None):
+        """Reads the display properties of a log.
+
+        Parameters
+        ----------
+        log : Log
+            The log to read from.
+        fields : iterable of str, optional
+            The properties to capture. By default all of them.
+
+        Returns
+        -------
+        LogSnapshot
+            The snapshot. Properties that were not captured are None.
+        """
+        fields = DISPLAY_PROPERTIES if fields is None else cls._check_fields(fields)
+        return cls(**{name: getattr(log, name) if name in fields else None for name in DISPLAY_PROPERTIES})
+
+    def captured(self):
+        """Gets the properties held by the snapshot.
+
+        Returns
+        -------
+        dict
+            Maps the name of each captured property to its value.
+        """
+        return {name: value for name, value in zip(self._fields, self) if value is not None}
+
+    def diff(self, other):
+        """Gets the properties of this snapshot that differ from another one.
+
+        Parameters
+        ----------
+        other : LogSnapshot
+            The snapshot to compare with.
+
+        Returns
+        -------
+        dict
+            Maps the names of the properties captured in this snapshot whose
+            value in ``other`` is different (or not captured) to their value
+            in this snapshot.
+        """
+        return {name: value for name, value in self.captured().items() if getattr(other, name) != value}
+
+    @staticmethod
+    def _check_fields(fields):
+        fields = set(fields)
+        unknown = fields.difference(DISPLAY_PROPERTIES)
+        if unknown:
+            raise ValueError(f"Not a display property: {', '.join(sorted(unknown))}")
+        return fields
@@ -11,6 +11,8 @@ class MarkerItem(DispatchWrapper):
     >>> marker.name = 'shale'
     """
 
+    __slots__ = ()
+
     @property
     def depth(self):
         """float: The depth of the marker in current depth
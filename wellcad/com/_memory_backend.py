@@ -0,0 +1,1250 @@
+import bisect
+import collections
+import copy
+import csv
+import datetime
+import json
+import pathlib
+from ._backend import Backend
+
+E_FAIL = -2147467259
+DISP_E_MEMBERNOTFOUND = -2147352573
+DISP_E_UNKNOWNNAME = -2147352570
+CO_E_CLASSSTRING = -2147221005
+
+# Log types using a depth/value pair per sample.
+_VALUE_LOG_TYPES = {1, 2, 3, 17}
+# Log types holding a trace (row of values) per depth.
+_TRACE_LOG_TYPES = {4, 5, 10, 11, 12, 14, 15}
+# Log types whose index 0 is the bottom depth rather than the top depth.
+_BOTTOM_FIRST_LOG_TYPES = {1, 2, 4, 5, 10, 11, 12, 14}
+
+
+class MemoryComError(Exception):
+    """Raised by the in-memory server wherever WellCAD raises a COM error.
+
+    The arguments mirror ``pywintypes.com_error``: ``(hresult, strerror,
+    excepinfo, argerror)``.
+    """
+
+
+class MemoryBackend(Backend):
+    """A pure Python stand-in for the WellCAD automation server.
+
+    The in-memory server models borehole documents, logs of every
+    ``Log.type`` with their depth indexed data and the item collections of
+    the different log types (structures, litho beds, comment boxes, ...).
+    Members that are not modelled can still be called, they are recorded in
+    ``MemoryApplication.unmodelled_calls`` and return ``None``.
+
+    Every property get, put and method call made on the server objects is
+    counted in ``MemoryApplication.calls`` which makes it possible to measure
+    how many round-trips a piece of code would cost against a real server.
+
+    Documents saved with ``Borehole.save_as`` are written as JSON and can be
+    opened again with ``Application.open_borehole``, also from another
+    process. ``Application.file_import`` reads CSV files with a depth column
+    followed by one column per Well Log.
+
+    Example
+    -------
+    >>> import wellcad.com
+    >>> wellcad.com.set_backend("memory")
+    >>> app = wellcad.com.Application()
+    >>> log = app.new_borehole().insert_new_log(1)
+    >>> log.data_table = (("Depth", "GR"), (1.0, 20.0), (1.5, 25.0))
+    >>> log.nb_of_data
+    2
+    """
+
+    name = "memory"
+
+    def __init__(self):
+        self.application = None
+
+    def create_dispatch(self, prog_id, new_instance=False):
+        if prog_id != "WellCAD.Application":
+            raise MemoryComError(CO_E_CLASSSTRING, "Invalid class string", None, None)
+        if new_instance:
+            return MemoryApplication()
+        if self.application is None or self.application.has_quit:
+            self.application = MemoryApplication()
+        return self.application
+
+    def is_dispatch(self, obj):
+        return isinstance(obj, MemoryObject)
+
+    def interface_key(self, dispatch):
+        return type(dispatch)
+
+    def identity_key(self, dispatch):
+        return dispatch
+
+    def is_method(self, dispatch, name):
+        member = getattr(type(dispatch), name, None)
+        if member is None:
+            # Not modelled, unless it is a plain value property.
+            return name not in dispatch._values and name not in dispatch._defaults
+        return callable(member) and not isinstance(member, property)
+
+    def resolve_names(self, dispatch, names):
+        server = dispatch._server
+        entries = {}
+        for name in names:
+            server.name_lookups += 1
+            if dispatch._has_member(name):
+                entries[name] = name
+        return entries
+
+    def register_names(self, dispatch, methods, attributes):
+        pass
+
+
+class _UnmodelledMethod:
+    """A callable returned for members the in-memory server doesn't model."""
+
+    def __init__(self, owner, name):
+        self._owner = owner
+        self._name = name
+
+    def __call__(self, *args):
+        self._owner._server.unmodelled_calls.append((type(self._owner).__name__, self._name, args))
+        return None
+
+
+class MemoryObject:
+    """Base class of all in-memory server objects.
+
+    Members starting with an upper case letter form the COM interface. They
+    are either Python methods/properties, or plain properties stored in
+    ``_values`` with their defaults declared in ``_PROPERTIES``.
+    """
+
+    _PROPERTIES = {}
+    _READ_ONLY = frozenset()
+    _defaults = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._defaults = {**cls._defaults, **cls.__dict__.get("_PROPERTIES", {})}
+
+    def __init__(self, server, **values):
+        object.__setattr__(self, "_server", server)
+        object.__setattr__(self, "_values", values)
+
+    def __getattribute__(self, name):
+        if "A" <= name[0] <= "Z":
+            object.__getattribute__(self, "_server").calls[name] += 1
+        return object.__getattribute__(self, name)
+
+    def __getattr__(self, name):
+        if not "A" <= name[:1] <= "Z":
+            raise AttributeError(name)
+        values = self._values
+        if name in values:
+            return values[name]
+        if name in self._defaults:
+            return self._defaults[name]
+        return _UnmodelledMethod(self, name)
+
+    def __setattr__(self, name, value):
+        if not "A" <= name[:1] <= "Z":
+            object.__setattr__(self, name, value)
+            return
+        self._server.calls[name] += 1
+        attr = getattr(type(self), name, None)
+        if isinstance(attr, property):
+            if attr.fset is None:
+                raise MemoryComError(DISP_E_MEMBERNOTFOUND, f"{name} is read-only", None, None)
+            attr.fset(self, value)
+        elif name in self._READ_ONLY or callable(attr):
+            raise MemoryComError(DISP_E_MEMBERNOTFOUND, f"{name} is read-only", None, None)
+        else:
+            self._values[name] = value
+
+    def _has_member(self, name):
+        return hasattr(type(self), name) or name in self._defaults
+
+    def _get(self, name):
+        """Reads a stored property without counting it as a call."""
+        values = self._values
+        return values[name] if name in values else self._defaults[name]
+
+
+class MemoryApplication(MemoryObject):
+    """The in-memory ``WellCAD.Application`` server object."""
+
+    def __init__(self):
+        super().__init__(self)
+        self.calls = collections.Counter()
+        self.name_lookups = 0
+        self.unmodelled_calls = []
+        self.documents = []
+        self.active = None
+        self.has_quit = False
+
+    @property
+    def call_count(self):
+        """int: The total number of gets, puts and invokes made so far."""
+        return sum(self.calls.values())
+
+    def reset_calls(self):
+        """Resets the call counters."""
+        self.calls.clear()
+        self.name_lookups = 0
+
+    def _add_document(self, borehole):
+        self.documents.append(borehole)
+        self.active = borehole
+        return borehole
+
+    def _find_document(self, index):
+        if index is None:
+            return self.active
+        if isinstance(index, str):
+            return next((doc for doc in self.documents if doc._get("Name") == index), None)
+        if 0 <= index < len(self.documents):
+            return self.documents[index]
+        return None
+
+    def ShowWindow(self):
+        return True
+
+    def MinimizeWindow(self):
+        pass
+
+    def MaximizeWindow(self):
+        pass
+
+    def Cascade(self):
+        pass
+
+    def TileHorizontally(self):
+        pass
+
+    def TileVertically(self):
+        pass
+
+    def NewBorehole(self, template=None):
+        return self._add_document(MemoryBorehole(self, Name=f"Borehole{len(self.documents) + 1}"))
+
+    def OpenBorehole(self, path=None):
+        if path is None:
+            return None
+        try:
+            with open(path, encoding="utf-8") as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return self._add_document(MemoryBorehole._from_state(self, state))
+
+    def GetBorehole(self, index=None):
+        return self._find_document(index)
+
+    def GetActiveBorehole(self):
+        return self.active
+
+    def CloseBorehole(self, prompt_for_saving=None, index=None):
+        borehole = self._find_document(index)
+        if borehole is not None:
+            self.documents.remove(borehole)
+            self.active = self.documents[-1] if self.documents else None
+
+    @property
+    def NbOfDocuments(self):
+        return len(self.documents)
+
+    def FileImport(self, file_name=None, prompt_user=None, config_file=None, log_file=None):
+        if file_name is None:
+            return None
+        borehole = self._add_document(MemoryBorehole(self, Name=pathlib.Path(file_name).stem))
+        borehole._import_csv(file_name)
+        return borehole
+
+    def MultiFileImport(self, file_name=None, prompt_user=None, config_file=None, log_file=None):
+        if file_name is None:
+            return None
+        paths = [p.strip() for p in file_name.split(",")]
+        borehole = self._add_document(MemoryBorehole(self, Name=pathlib.Path(paths[0]).stem))
+        for path in paths:
+            borehole._import_csv(path)
+        return borehole
+
+    def Quit(self, prompt_for_saving=None):
+        self.documents.clear()
+        self.active = None
+        self.has_quit = True
+
+
+class MemoryDepth(MemoryObject):
+    _PROPERTIES = {"Decimals": 2, "HorizontalGrid": True, "HorizontalGridSpacing": 1.0, "LeftPosition": 0.0,
+                   "RightPosition": 0.1, "Scale": 200.0, "Unit": "m", "UsedAsDepthScale": True}
+
+    def SetPosition(self, left, right):
+        left, right = sorted((min(max(left, 0.0), 1.0), min(max(right, 0.0), 1.0)))
+        self._values.update(LeftPosition=left, RightPosition=right)
+
+
+class MemoryPage(MemoryObject):
+    _PROPERTIES = {"BottomMargin": 0.0, "DocumentWidth": 210.0, "LeftMargin": 0.0, "Numbering": 0,
+                   "PaperMode": 0, "PrintHeader": True, "PrintTitlesOnBottom": False,
+                   "PrintTitlesOnBottomOnEachPage": False, "PrintTitlesOnTop": True,
+                   "PrintTitlesOnTopOnEachPage": False, "RightMargin": 0.0, "TopMargin": 0.0}
+    _READ_ONLY = frozenset({"DocumentHeight"})
+
+    @property
+    def DocumentHeight(self):
+        return 297.0
+
+
+class MemoryHeader(MemoryObject):
+    def __init__(self, server):
+        super().__init__(server)
+        self._items = {}
+
+    @property
+    def NbOfItems(self):
+        return len(self._items)
+
+    def ItemName(self, index):
+        names = list(self._items)
+        return names[index] if 0 <= index < len(names) else ""
+
+    def GetItemText(self, name):
+        return self._items.get(name, "")
+
+    def SetItemText(self, name, text):
+        self._items[name] = text
+
+
+class MemoryFont(MemoryObject):
+    _PROPERTIES = {"Name": "Arial", "Size": 10.0, "Bold": False, "Italic": False, "Underline": False,
+                   "Strikethrough": False, "Weight": 400, "Charset": 0}
+
+
+class MemoryTitle(MemoryObject):
+    _PROPERTIES = {"BackgroundColor": 16777215, "BoxHeight": 10.0, "DisplayComment": False,
+                   "DisplayFrame": True, "DisplayProperties": True, "DisplayTitle": True,
+                   "FrameColor": 0, "FrameStyle": 0, "FrameWidth": 1, "LeftPosition": 0.0,
+                   "RightPosition": 0.25, "TitleText": "", "CommentText": "", "UseColoredBackground": False}
+
+
+class MemoryLithoDictionary(MemoryObject):
+    _PROPERTIES = {"Name": ""}
+
+    @property
+    def NbOfPatterns(self):
+        return 0
+
+    def IsPattern(self, code):
+        return False
+
+    def LithoPattern(self, index_or_code):
+        return None
+
+
+class MemoryBorehole(MemoryObject):
+    """An in-memory borehole document."""
+
+    _PROPERTIES = {"Name": "Borehole", "AutoUpdate": True}
+
+    def __init__(self, server, **values):
+        super().__init__(server, **values)
+        self.logs = []
+        self.metadata = {}
+        self.draft_mode = 0
+        self.refresh_count = 0
+        self._depth = MemoryDepth(server)
+        self._header = MemoryHeader(server)
+        self._page = MemoryPage(server)
+        self._titles = {}
+
+    def _state(self):
+        return {"values": self._values, "metadata": self.metadata, "logs": [log._state() for log in self.logs]}
+
+    @classmethod
+    def _from_state(cls, server, state):
+        borehole = cls(server, **state["values"])
+        borehole.metadata.update(state["metadata"])
+        borehole.logs = [MemoryLog._from_state(server, log) for log in state["logs"]]
+        return borehole
+
+    def _find_log(self, index_or_name):
+        if isinstance(index_or_name, MemoryLog):
+            return index_or_name if index_or_name in self.logs else None
+        if isinstance(index_or_name, str):
+            return next((log for log in self.logs if log._values.get("Name") == index_or_name), None)
+        if isinstance(index_or_name, int) and 0 <= index_or_name < len(self.logs):
+            return self.logs[index_or_name]
+        return None
+
+    def _import_csv(self, path):
+        with open(path, newline="", encoding="utf-8") as f:
+            rows = list(csv.reader(f))
+        header, rows = rows[0], rows[1:]
+        for column, name in enumerate(header[1:], start=1):
+            log = MemoryLog(self._server, 1, Name=name)
+            log._set_value_table([(float(row[0]), float(row[column])) for row in rows])
+            self.logs.append(log)
+
+    @property
+    def VersionMajor(self):
+        return 5
+
+    @property
+    def VersionMinor(self):
+        return 7
+
+    @property
+    def VersionBuild(self):
+        return 0
+
+    @property
+    def TopDepth(self):
+        extents = [log._extent() for log in self.logs]
+        depths = [extent[0] for extent in extents if extent is not None]
+        return min(depths) if depths else 0.0
+
+    @property
+    def BottomDepth(self):
+        extents = [log._extent() for log in self.logs]
+        depths = [extent[1] for extent in extents if extent is not None]
+        return max(depths) if depths else 0.0
+
+    @property
+    def NbOfLogs(self):
+        return len(self.logs)
+
+    @property
+    def Depth(self):
+        return self._depth
+
+    @property
+    def Header(self):
+        return self._header
+
+    @property
+    def Page(self):
+        return self._page
+
+    def RefreshWindow(self):
+        self.refresh_count += 1
+
+    def ShowWindow(self):
+        pass
+
+    def SetDraftMode(self, display_mode=None):
+        if display_mode is None:
+            display_mode = 0 if self.draft_mode else 2
+        self.draft_mode = display_mode
+
+    def MinimizeWindow(self):
+        pass
+
+    def MaximizeWindow(self):
+        pass
+
+    def SetVisibleDepthRange(self, top_depth=None, bottom_depth=None):
+        pass
+
+    def Title(self, name):
+        if self._find_log(name) is None:
+            return None
+        return self._titles.setdefault(name, MemoryTitle(self._server, TitleText=name))
+
+    def GetLog(self, index_or_name):
+        return self._find_log(index_or_name)
+
+    def Log(self, index_or_name):
+        return self._find_log(index_or_name)
+
+    def InsertNewLog(self, log_type):
+        log = MemoryLog(self._server, log_type, Name=f"New Log {len(self.logs) + 1}")
+        self.logs.append(log)
+        return log
+
+    def AddLog(self, log):
+        copied = MemoryLog._from_state(self._server, copy.deepcopy(log._state()))
+        self.logs.append(copied)
+        return copied
+
+    def RemoveLog(self, log):
+        log = self._find_log(log)
+        if log is not None:
+            self.logs.remove(log)
+
+    def ClearLogContents(self, log):
+        log = self._find_log(log)
+        if log is not None:
+            log._clear()
+
+    def SaveAs(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self._state(), f)
+        return True
+
+    def DepthShiftLog(self, log, shift, top_depth=None, bottom_depth=None):
+        log = self._find_log(log)
+        if log is not None:
+            log._shift(shift, top_depth, bottom_depth)
+
+    def ExtendLog(self, log, top_depth, bottom_depth):
+        log = self._find_log(log)
+        if log is not None:
+            log._extend(top_depth, bottom_depth)
+
+    def ResampleLog(self, log, prompt_user=None, config=None):
+        log = self._find_log(log)
+        if log is None:
+            return None
+        rate = float(_parse_config(config).get("SamplingRate", 0) or log._step())
+        log._resample(rate)
+        return log
+
+    def SetMetadata(self, id, value):
+        self.metadata[id] = value
+
+    def GetMetadata(self, id):
+        return self.metadata.get(id, "")
+
+    @property
+    def MetadataKeys(self):
+        return tuple(self.metadata)
+
+    @property
+    def NbMetadata(self):
+        return len(self.metadata)
+
+    def DeleteMetadata(self, id):
+        self.metadata.pop(id, None)
+
+
+def _parse_config(config):
+    """Parses a WellCAD parameter string or configuration file into a dict."""
+    if not config:
+        return {}
+    path = pathlib.Path(config)
+    try:
+        if path.is_file():
+            config = path.read_text()
+    except OSError:
+        pass
+    options = {}
+    for entry in config.replace(";", "\n").splitlines():
+        key, sep, value = entry.partition("=")
+        if sep:
+            options[key.strip()] = value.strip()
+    return options
+
+
+class MemoryItem(MemoryObject):
+    """An item of a log item collection (structure, litho bed, ...)."""
+
+    def __init__(self, server, log, **values):
+        super().__init__(server, **values)
+        self._log = log
+        self._attributes = {}
+
+    def GetAttributeValue(self, attribute_name):
+        return self._attributes.get(attribute_name, "")
+
+    def SetAttributeValue(self, attribute_name, attribute_value):
+        self._attributes[attribute_name] = attribute_value
+
+
+class MemoryIntervalItem(MemoryItem):
+    _PROPERTIES = {"TopDepth": 0.0, "BottomDepth": 0.0, "Value": 0.0}
+    _READ_ONLY = frozenset({"TopDepth", "BottomDepth"})
+
+
+class MemoryStructure(MemoryItem):
+    _PROPERTIES = {"Depth": 0.0, "Azimuth": 0.0, "Tilt": 0.0, "Aperture": 0.0, "Length": 0.0,
+                   "Eccentricity": 0.0, "VisibleAzimuthRanges": ""}
+    _READ_ONLY = frozenset({"Depth", "Eccentricity"})
+
+    @property
+    def FeatureDepth(self):
+        return self._values.get("Depth", 0.0)
+
+
+class MemoryLithoBed(MemoryItem):
+    _PROPERTIES = {"TopDepth": 0.0, "BottomDepth": 0.0, "LithoCode": "", "Value": 0.0,
+                   "TopContact": "", "BottomContact": ""}
+    _READ_ONLY = frozenset({"TopDepth", "BottomDepth"})
+
+
+class MemoryCommentBox(MemoryItem):
+    _PROPERTIES = {"TopDepth": 0.0, "BottomDepth": 0.0, "Text": ""}
+    _READ_ONLY = frozenset({"TopDepth", "BottomDepth"})
+
+
+class MemoryFossilItem(MemoryItem):
+    _PROPERTIES = {"TopDepth": 0.0, "BottomDepth": 0.0, "SymbolCode": "", "Abundance": 1, "Dominance": 0}
+    _READ_ONLY = frozenset({"TopDepth", "BottomDepth"})
+
+
+class MemoryMarkerItem(MemoryItem):
+    _PROPERTIES = {"Depth": 0.0, "Name": "", "Comment": "", "Contact": ""}
+    _READ_ONLY = frozenset({"Depth"})
+
+
+class MemoryStackingPatternItem(MemoryItem):
+    _PROPERTIES = {"TopDepth": 0.0, "BottomDepth": 0.0, "TopWidth": 0.0, "BottomWidth": 0.0}
+    _READ_ONLY = frozenset({"TopDepth", "BottomDepth"})
+
+
+class MemoryPolarAndRoseBox(MemoryItem):
+    _PROPERTIES = {"TopDepth": 0.0, "BottomDepth": 0.0, "Text": ""}
+    _READ_ONLY = frozenset({"TopDepth", "BottomDepth"})
+
+
+class MemoryCrossSectionBox(MemoryItem):
+    _PROPERTIES = {"TopDepth": 0.0, "BottomDepth": 0.0}
+    _READ_ONLY = frozenset({"TopDepth", "BottomDepth"})
+
+
+class MemoryDrillItem(MemoryItem):
+    _PROPERTIES = {"BottomDepth": 0.0, "Diameter": 0.0, "Comment": ""}
+
+
+class MemoryEquipmentItem(MemoryItem):
+    _PROPERTIES = {"TopDepth": 0.0, "BottomDepth": 0.0, "Name": "", "Comment": "", "Description": "",
+                   "Type": 0, "AxisPosition": 0, "ExternalDiameter": 0.0, "InternalDiameter": 0.0,
+                   "Thickness": 0.0, "Weight": 0.0, "Grade": "", "InjectionDepth": 0.0,
+                   "InjectionPosition": 0}
+
+
+# Describes an item collection: the item class, the field items are sorted on,
+# the log types holding the collection and the DataTable columns as
+# (title, field) pairs.
+_Collection = collections.namedtuple("_Collection", ["item_class", "key", "log_types", "columns"])
+
+_COLLECTIONS = {
+    "interval": _Collection(MemoryIntervalItem, "TopDepth", (13,),
+                            (("Top Depth", "TopDepth"), ("Bottom Depth", "BottomDepth"), (None, "Value"))),
+    "structure": _Collection(MemoryStructure, "Depth", (6,),
+                             (("Depth", "Depth"), ("Azimuth", "Azimuth"), ("Dip", "Tilt"),
+                              ("Aperture", "Aperture"))),
+    "breakout": _Collection(MemoryStructure, "Depth", (25,),
+                            (("Depth", "Depth"), ("Azimuth", "Azimuth"), ("Tilt", "Tilt"),
+                             ("Length", "Length"), ("Opening", "Aperture"))),
+    "lineation": _Collection(MemoryStructure, "Depth", (27,),
+                             (("Depth", "Depth"), ("Trend", "Azimuth"), ("Plunge", "Tilt"),
+                              ("Eccentricity", "Eccentricity"))),
+    "litho": _Collection(MemoryLithoBed, "TopDepth", (7,),
+                         (("Top Depth", "TopDepth"), ("Bottom Depth", "BottomDepth"),
+                          ("Litho Code", "LithoCode"), ("Value", "Value"))),
+    "comment": _Collection(MemoryCommentBox, "TopDepth", (8,),
+                           (("Top Depth", "TopDepth"), ("Bottom Depth", "BottomDepth"), ("Text", "Text"))),
+    "fossil": _Collection(MemoryFossilItem, "TopDepth", (16, 26),
+                          (("Top Depth", "TopDepth"), ("Bottom Depth", "BottomDepth"),
+                           ("Symbol Code", "SymbolCode"), ("Abundance", "Abundance"),
+                           ("Dominance", "Dominance"))),
+    "marker": _Collection(MemoryMarkerItem, "Depth", (24,),
+                          (("Depth", "Depth"), ("Name", "Name"), ("Comment", "Comment"),
+                           ("Contact", "Contact"))),
+    "stack": _Collection(MemoryStackingPatternItem, "TopDepth", (19,),
+                         (("Top Depth", "TopDepth"), ("Bottom Depth", "BottomDepth"),
+                          ("Top Width", "TopWidth"), ("Bottom Width", "BottomWidth"))),
+    "schmit": _Collection(MemoryPolarAndRoseBox, "TopDepth", (20,),
+                          (("Top Depth", "TopDepth"), ("Bottom Depth", "BottomDepth"), ("Text", "Text"))),
+    "cross": _Collection(MemoryCrossSectionBox, "TopDepth", (21,),
+                         (("Top Depth", "TopDepth"), ("Bottom Depth", "BottomDepth"))),
+    "drill": _Collection(MemoryDrillItem, "BottomDepth", (9,),
+                         (("Bottom Depth", "BottomDepth"), ("Diameter", "Diameter"), ("Comment", "Comment"))),
+    "eqp": _Collection(MemoryEquipmentItem, "TopDepth", (9,),
+                       (("Top Depth", "TopDepth"), ("Bottom Depth", "BottomDepth"), ("Name", "Name"))),
+}
+
+
+class MemoryLog(MemoryObject):
+    """An in-memory log of any ``Log.type``."""
+
+    _PROPERTIES = {"Name": "", "TitleComment": "", "LogUnit": "", "LeftPosition": 0.0, "RightPosition": 0.25,
+                   "HideLogTitle": False, "HideLogData": False, "LogBackgroundColor": 16777215,
+                   "BorderStyle": 0, "BorderWidth": 1, "BorderColor": 0, "DisplayBorder": False,
+                   "NullValue": -999.25, "MaskContacts": False, "MaskHorizontalGrid": False,
+                   "ScaleLow": 0.0, "ScaleHigh": 100.0, "ScaleMode": 0, "ScaleReversed": False,
+                   "UseLogColoredBackground": False, "MajGridEnable": True, "MinGridEnable": False,
+                   "MajGridSpacing": 10.0, "MinGridSpacing": 5.0, "LockLogData": False, "Formula": "",
+                   "Filter": 1, "FixedBarWidth": 0.0, "PenColor": 0, "PenStyle": 0, "PenWidth": 1,
+                   "Shading": 0, "Style": 0, "LengthUnit": 1.0, "CaliperUnit": 1.0, "ApertureUnit": 1.0,
+                   "UsedAsDepthScale": False, "CommentStyle": 0, "GroundDepth": 0.0, "DiameterHigh": 0.0,
+                   "BackgroundColor": 16777215, "BackgroundHatchStyle": 0, "BackgroundStyle": 0,
+                   "TraceOffset": 0.0, "TraceSampleRate": 1.0}
+
+    def __init__(self, server, log_type, **values):
+        super().__init__(server, **values)
+        self._type = log_type
+        self._depths = []
+        self._data = []
+        self._trace_length = 0
+        self._sample_rate = None
+        self._collections = {name: [] for name, c in _COLLECTIONS.items() if log_type in c.log_types}
+        self._keys = {name: [] for name in self._collections}
+        self._attribute_names = []
+        self._column_names = {}
+        self._font = MemoryFont(server)
+        self._litho_dictionary = MemoryLithoDictionary(server)
+
+    def _state(self):
+        return {"type": self._type, "values": self._values, "depths": self._depths, "data": self._data,
+                "trace_length": self._trace_length, "sample_rate": self._sample_rate,
+                "attributes": self._attribute_names,
+                "items": {name: [{"values": item._values, "attributes": item._attributes} for item in items]
+                          for name, items in self._collections.items()}}
+
+    @classmethod
+    def _from_state(cls, server, state):
+        log = cls(server, state["type"], **state["values"])
+        log._depths = state["depths"]
+        log._data = state["data"]
+        log._trace_length = state["trace_length"]
+        log._sample_rate = state["sample_rate"]
+        log._attribute_names = state["attributes"]
+        for name, items in state["items"].items():
+            for item in items:
+                log._insert_item(name, item["values"])._attributes.update(item["attributes"])
+        return log
+
+    # -- Internal helpers ---------------------------------------------------
+
+    @property
+    def _bottom_first(self):
+        return self._type in _BOTTOM_FIRST_LOG_TYPES
+
+    @property
+    def _main_collection(self):
+        return next(iter(self._collections), None)
+
+    def _row(self, index):
+        """Converts a server index into an index of the top-down sorted data."""
+        n = len(self._depths)
+        if not 0 <= index < n:
+            return None
+        return n - 1 - index if self._bottom_first else index
+
+    def _nearest_row(self, depth):
+        depths = self._depths
+        if not depths or depth < depths[0] - 1e-6 or depth > depths[-1] + 1e-6:
+            return None
+        i = bisect.bisect_left(depths, depth)
+        if i == len(depths) or (i > 0 and depth - depths[i - 1] <= depths[i] - depth):
+            i -= 1
+        return i
+
+    def _extent(self):
+        if self._depths:
+            return self._depths[0], self._depths[-1]
+        tops, bottoms = [], []
+        for name, items in self._collections.items():
+            for item in items:
+                values = item._values
+                bottom = values.get("BottomDepth", values.get("Depth", 0.0))
+                tops.append(values.get("TopDepth", values.get("Depth", bottom)))
+                bottoms.append(bottom)
+        if not tops:
+            return None
+        return min(tops), max(bottoms)
+
+    def _clear(self):
+        self._depths = []
+        self._data = []
+        for name in self._collections:
+            self._collections[name] = []
+            self._keys[name] = []
+
+    def _insert_item(self, collection, values):
+        spec = _COLLECTIONS[collection]
+        item = spec.item_class(self._server, self, **values)
+        key = values.get(spec.key, 0.0)
+        i = bisect.bisect_right(self._keys[collection], key)
+        self._keys[collection].insert(i, key)
+        self._collections[collection].insert(i, item)
+        return item
+
+    def _item_at_depth(self, collection, depth):
+        items = self._collections.get(collection)
+        if not items:
+            return None
+        spec = _COLLECTIONS[collection]
+        if spec.key == "Depth":
+            keys = self._keys[collection]
+            if depth < keys[0] - 1e-6 or depth > keys[-1] + 1e-6:
+                return None
+            i = bisect.bisect_left(keys, depth)
+            if i == len(keys) or (i > 0 and depth - keys[i - 1] <= keys[i] - depth):
+                i -= 1
+            return items[i]
+        if spec.key == "BottomDepth":
+            i = bisect.bisect_left(self._keys[collection], depth)
+            return items[i] if i < len(items) else None
+        for item in items:
+            if item._values["TopDepth"] <= depth <= item._values["BottomDepth"]:
+                return item
+        return None
+
+    def _remove_item(self, collection, item):
+        if item is not None:
+            i = self._collections[collection].index(item)
+            del self._collections[collection][i]
+            del self._keys[collection][i]
+
+    def _rebuild_keys(self):
+        for name, items in self._collections.items():
+            key = _COLLECTIONS[name].key
+            items.sort(key=lambda item: item._values.get(key, 0.0))
+            self._keys[name] = [item._values.get(key, 0.0) for item in items]
+
+    def _shift(self, shift, top_depth, bottom_depth):
+        top = float("-inf") if top_depth is None else top_depth
+        bottom = float("inf") if bottom_depth is None else bottom_depth
+        self._depths = [d + shift if top <= d <= bottom else d for d in self._depths]
+        for items in self._collections.values():
+            for item in items:
+                values = item._values
+                for field in ("Depth", "TopDepth", "BottomDepth"):
+                    if field in values and top <= values[field] <= bottom:
+                        values[field] += shift
+        self._rebuild_keys()
+
+    def _step(self):
+        if self._sample_rate:
+            return self._sample_rate
+        if len(self._depths) > 1:
+            return (self._depths[-1] - self._depths[0]) / (len(self._depths) - 1)
+        return 0.0
+
+    def _null_row(self):
+        null = self._get("NullValue")
+        return [null] * self._trace_length if self._type in _TRACE_LOG_TYPES else null
+
+    def _extend(self, top_depth, bottom_depth):
+        step = self._step()
+        if not self._depths or step <= 0:
+            return
+        above = []
+        depth = self._depths[0] - step
+        while depth >= top_depth - 1e-9:
+            above.append(depth)
+            depth -= step
+        below = []
+        depth = self._depths[-1] + step
+        while depth <= bottom_depth + 1e-9:
+            below.append(depth)
+            depth += step
+        above.reverse()
+        self._depths = above + self._depths + below
+        self._data = ([self._null_row() for _ in above] + self._data + [self._null_row() for _ in below])
+
+    def _resample(self, rate):
+        if not self._depths or rate <= 0 or self._type not in _VALUE_LOG_TYPES:
+            return
+        top, bottom = self._depths[0], self._depths[-1]
+        depths = []
+        depth = top
+        while depth <= bottom + 1e-9:
+            depths.append(depth)
+            depth = top + len(depths) * rate
+        rows = [self._nearest_row(d) for d in depths]
+        self._data = [self._data[i] for i in rows]
+        self._depths = depths
+        self._sample_rate = rate
+
+    def _set_value_table(self, rows):
+        rows = sorted(rows, key=lambda row: row[0])
+        self._depths, self._data = [row[0] for row in rows], [row[1] for row in rows]
+
+    def _set_trace_table(self, rows):
+        rows = sorted(((row[0], list(row[1:])) for row in rows), key=lambda row: row[0])
+        self._depths, self._data = [row[0] for row in rows], [row[1] for row in rows]
+        if rows:
+            self._trace_length = len(rows[0][1])
+
+    def _columns(self, collection):
+        spec = _COLLECTIONS[collection]
+        columns = [(title or self._values.get("Name", ""), field) for title, field in spec.columns]
+        return columns + [(name, None) for name in self._attribute_names]
+
+    def _item_rows(self, collection):
+        columns = self._columns(collection)
+        rows = []
+        for item in self._collections[collection]:
+            values, attributes = item._values, item._attributes
+            defaults = item._defaults
+            rows.append(tuple(values.get(field, defaults.get(field)) if field else attributes.get(title, "")
+                              for title, field in columns))
+        return rows
+
+    def _set_item_table(self, collection, rows):
+        columns = self._columns(collection)
+        self._collections[collection] = []
+        self._keys[collection] = []
+        for row in rows:
+            values = {field: value for (title, field), value in zip(columns, row) if field}
+            item = self._insert_item(collection, values)
+            item._attributes.update({title: value for (title, field), value in zip(columns, row) if not field})
+
+    # -- General properties -------------------------------------------------
+
+    @property
+    def Type(self):
+        return self._type
+
+    @property
+    def NbOfData(self):
+        if self._depths or self._main_collection is None:
+            return len(self._depths)
+        return len(self._collections[self._main_collection])
+
+    @property
+    def TopDepth(self):
+        extent = self._extent()
+        return extent[0] if extent else 0.0
+
+    @property
+    def BottomDepth(self):
+        extent = self._extent()
+        return extent[1] if extent else 0.0
+
+    @property
+    def DataTable(self):
+        if self._type in _VALUE_LOG_TYPES:
+            return (("Depth", self._values.get("Name", "")),) + tuple(zip(self._depths, self._data))
+        if self._type in _TRACE_LOG_TYPES:
+            offset, rate = self._get("TraceOffset"), self._get("TraceSampleRate")
+            header = ("Depth",) + tuple(f"{offset + i * rate:g}" for i in range(self._trace_length))
+            return (header,) + tuple((depth,) + tuple(row) for depth, row in zip(self._depths, self._data))
+        collection = self._main_collection
+        if collection is None:
+            return ()
+        header = tuple(title for title, field in self._columns(collection))
+        return (header,) + tuple(self._item_rows(collection))
+
+    @DataTable.setter
+    def DataTable(self, data):
+        # A put replaces all the data or items of the log. The wrappers never
+        # rely on a put keeping the data outside the rows it holds.
+        if self._get("LockLogData"):
+            raise MemoryComError(E_FAIL, "The log data is locked", None, None)
+        rows = tuple(data)[1:]
+        if self._type in _VALUE_LOG_TYPES:
+            self._set_value_table(rows)
+        elif self._type in _TRACE_LOG_TYPES:
+            self._set_trace_table(rows)
+        elif self._main_collection is not None:
+            self._set_item_table(self._main_collection, rows)
+
+    @property
+    def DataMin(self):
+        values = self._valid_values()
+        return min(values) if values else self._get("NullValue")
+
+    @property
+    def DataMax(self):
+        values = self._valid_values()
+        return max(values) if values else self._get("NullValue")
+
+    def _valid_values(self):
+        null = self._get("NullValue")
+        if self._type == 13:
+            return [item._values.get("Value", 0.0) for item in self._collections["interval"]]
+        return [v for v in self._data if v != null] if self._type in _VALUE_LOG_TYPES else []
+
+    @property
+    def SampleRate(self):
+        return self._step()
+
+    @SampleRate.setter
+    def SampleRate(self, rate):
+        self._sample_rate = rate
+
+    @property
+    def NbOfHistoryItem(self):
+        return 0
+
+    def ClearHistory(self):
+        pass
+
+    def HistoryItemDate(self, index):
+        return datetime.datetime.now()
+
+    def HistoryItemDescription(self, index):
+        return ""
+
+    def SetPosition(self, left, right):
+        left, right = sorted((min(max(left, 0.0), 1.0), min(max(right, 0.0), 1.0)))
+        self._values.update(LeftPosition=left, RightPosition=right)
+
+    @property
+    def Font(self):
+        return self._font
+
+    @Font.setter
+    def Font(self, font):
+        self._font = font
+
+    @property
+    def LithoDictionary(self):
+        return self._litho_dictionary
+
+    @LithoDictionary.setter
+    def LithoDictionary(self, dictionary):
+        self._litho_dictionary = dictionary
+
+    def AttachLithoDictionary(self, dictionary):
+        self._litho_dictionary = MemoryLithoDictionary(self._server, Name=str(dictionary))
+        return self._litho_dictionary
+
+    def FileExport(self, directory, file_title=None, extension=None, prompt_user=None, config_filename=None):
+        path = pathlib.Path(directory) / f"{file_title or self._values.get('Name', 'Log')}.{extension or 'csv'}"
+        try:
+            with open(path, "w", newline="", encoding="utf-8") as f:
+                csv.writer(f).writerows(MemoryLog.DataTable.fget(self))
+        except OSError:
+            return False
+        return True
+
+    # -- Well, Mud, Formula and Depth logs ----------------------------------
+
+    def GetData(self, index):
+        if self._type == 13:
+            items = self._collections["interval"]
+            item = items[index] if 0 <= index < len(items) else None
+            return item._values.get("Value", 0.0) if item is not None else self._get("NullValue")
+        row = self._row(index)
+        return self._data[row] if row is not None else self._get("NullValue")
+
+    def SetData(self, index, value):
+        row = self._row(index)
+        if row is not None:
+            self._data[row] = value
+
+    def GetDataAtDepth(self, depth):
+        if self._type == 13:
+            item = self._item_at_depth("interval", depth)
+            return item._values.get("Value", 0.0) if item is not None else self._get("NullValue")
+        row = self._nearest_row(depth)
+        return self._data[row] if row is not None else self._get("NullValue")
+
+    def SetDataAtDepth(self, depth, value):
+        row = self._nearest_row(depth)
+        if row is not None:
+            self._data[row] = value
+
+    def DataDepth(self, index):
+        row = self._row(index)
+        if row is not None:
+            return self._depths[row]
+        if self._type in (1, 2) and self._depths:
+            step = self._step()
+            if self._bottom_first:
+                return self._depths[-1] - index * step
+            return self._depths[0] + index * step
+        return 0.0
+
+    def InsertData(self, index, value):
+        n = len(self._depths)
+        if not 0 <= index <= n:
+            return
+        row = n - index if self._bottom_first else index
+        if self._type in (1, 2):
+            # Constant sample rate: the values shift, the depth grid grows.
+            step = self._step()
+            self._data.insert(row, value)
+            self._depths.append(self._depths[-1] + step if self._depths else 0.0)
+        else:
+            depth = self._depths[row] if row < n else (self._depths[-1] if n else 0.0)
+            self._depths.insert(row, depth)
+            self._data.insert(row, value)
+
+    def InsertDataAtDepth(self, depth, value):
+        i = bisect.bisect_left(self._depths, depth)
+        self._depths.insert(i, depth)
+        self._data.insert(i, value)
+
+    def RemoveData(self, index):
+        row = self._row(index)
+        if row is not None:
+            del self._depths[row]
+            del self._data[row]
+
+    def RemoveDataAtDepth(self, depth):
+        row = self._nearest_row(depth)
+        if row is not None:
+            del self._depths[row]
+            del self._data[row]
+
+    # -- Trace logs ---------------------------------------------------------
+
+    @property
+    def TraceLength(self):
+        return self._trace_length
+
+    @TraceLength.setter
+    def TraceLength(self, length):
+        null = self._get("NullValue")
+        self._data = [(row + [null] * length)[:length] for row in self._data]
+        self._trace_length = length
+
+    def _trace_column(self, trace_position):
+        rate = self._get("TraceSampleRate") or 1.0
+        column = int(round((trace_position - self._get("TraceOffset")) / rate))
+        return column if 0 <= column < self._trace_length else None
+
+    def GetTraceData(self, depth_index, trace_index):
+        row = self._row(depth_index)
+        if row is None or not 0 <= trace_index < self._trace_length:
+            return self._get("NullValue")
+        return self._data[row][trace_index]
+
+    def SetTraceData(self, depth_index, trace_index, value):
+        row = self._row(depth_index)
+        if row is not None and 0 <= trace_index < self._trace_length:
+            self._data[row][trace_index] = value
+
+    def GetTraceDataAtDepth(self, depth, trace_position):
+        row, column = self._nearest_row(depth), self._trace_column(trace_position)
+        if row is None or column is None:
+            return self._get("NullValue")
+        return self._data[row][column]
+
+    def SetTraceDataAtDepth(self, depth, trace_position, value):
+        row, column = self._nearest_row(depth), self._trace_column(trace_position)
+        if row is not None and column is not None:
+            self._data[row][column] = value
+
+    def InsertTrace(self, index):
+        n = len(self._depths)
+        if not 0 <= index <= n:
+            return
+        row = n - index if self._bottom_first else index
+        depth = self._depths[row] if row < n else (self._depths[-1] + self._step() if n else 0.0)
+        self._depths.insert(row, depth)
+        self._data.insert(row, [self._get("NullValue")] * self._trace_length)
+
+    def InsertTraceAtDepth(self, depth):
+        i = bisect.bisect_left(self._depths, depth)
+        self._depths.insert(i, depth)
+        self._data.insert(i, [self._get("NullValue")] * self._trace_length)
+
+    def RemoveTrace(self, index):
+        row = self._row(index)
+        if row is not None:
+            del self._depths[row]
+            del self._data[row]
+
+    def RemoveTraceAtDepth(self, depth):
+        row = self._nearest_row(depth)
+        if row is not None:
+            del self._depths[row]
+            del self._data[row]
+
+    def GetColumnName(self, column):
+        return self._column_names.get(column, "")
+
+    def SetColumnName(self, column, name):
+        self._column_names[column] = name
+
+    GetComponentName = GetColumnName
+    SetComponentName = SetColumnName
+
+    # -- Attributes of structure logs ---------------------------------------
+
+    def InsertNewAttribute(self, attribute_name):
+        if attribute_name not in self._attribute_names:
+            self._attribute_names.append(attribute_name)
+
+    def GetAttributeName(self, index):
+        names = self._attribute_names
+        return names[index] if 0 <= index < len(names) else ""
+
+    def SetAttributeName(self, index, name):
+        if 0 <= index < len(self._attribute_names):
+            self._attribute_names[index] = name
+
+    # -- Litho logs ---------------------------------------------------------
+
+    def SetLithoBed(self, index, litho_bed):
+        beds = self._collections.get("litho", ())
+        bed = beds[index] if 0 <= index < len(beds) else None
+        if bed is not None:
+            bed._values.update(LithoCode=litho_bed._values.get("LithoCode", ""),
+                               Value=litho_bed._values.get("Value", 0.0))
+
+    def SetLithoBedAtDepth(self, depth, litho_bed):
+        bed = self._item_at_depth("litho", depth)
+        if bed is not None:
+            bed._values.update(LithoCode=litho_bed._values.get("LithoCode", ""),
+                               Value=litho_bed._values.get("Value", 0.0))
+
+    def MarkerByName(self, name):
+        return next((m for m in self._collections.get("marker", ()) if m._values.get("Name") == name), None)
+
+    @property
+    def NbOfDrillItem(self):
+        return len(self._collections.get("drill", ()))
+
+    @property
+    def NbOfEqpItem(self):
+        return len(self._collections.get("eqp", ()))
+
+
+def _install_collection(collection, accessor, at_depth, insert, fields, remove, remove_at_depth):
+    """Adds the COM methods of an item collection to ``MemoryLog``."""
+
+    def get_item(self, index):
+        items = self._collections.get(collection)
+        return items[index] if items is not None and 0 <= index < len(items) else None
+
+    def get_item_at_depth(self, depth):
+        return self._item_at_depth(collection, depth)
+
+    def insert_item(self, *args):
+        if collection not in self._collections:
+            return None
+        return self._insert_item(collection, dict(zip(fields, args)))
+
+    def remove_item(self, index):
+        if collection in self._collections:
+            self._remove_item(collection, get_item(self, index))
+
+    def remove_item_at_depth(self, depth):
+        if collection in self._collections:
+            self._remove_item(collection, self._item_at_depth(collection, depth))
+
+    for name, function in ((accessor, get_item), (at_depth, get_item_at_depth), (insert, insert_item),
+                           (remove, remove_item), (remove_at_depth, remove_item_at_depth)):
+        if name is not None:
+            function.__name__ = name
+            setattr(MemoryLog, name, function)
+
+
+_install_collection("interval", "IntervalItem", "IntervalItemAtDepth", "InsertNewIntervalItem",
+                    ("TopDepth", "BottomDepth", "Value"), "RemoveIntervalItem", "RemoveIntervalItemAtDepth")
+_install_collection("structure", "Structure", "StructureAtDepth", "InsertNewStructureEx",
+                    ("Depth", "Azimuth", "Tilt", "Aperture"), "RemoveStructure", "RemoveStructureAtDepth")
+_install_collection("breakout", "Breakout", "BreakoutAtDepth", "InsertNewBreakoutEx",
+                    ("Depth", "Azimuth", "Tilt", "Length", "Aperture"), "RemoveBreakout", "RemoveBreakoutAtDepth")
+_install_collection("lineation", "Lineation", "LineationAtDepth", "InsertNewLineationEx",
+                    ("Depth", "Azimuth", "Tilt", "Eccentricity"), "RemoveLineation", "RemoveLineationAtDepth")
+_install_collection("litho", "GetLithoBed", "GetLithoBedAtDepth", "InsertNewLithoBed",
+                    ("TopDepth", "BottomDepth", "LithoCode", "Value", "Position"),
+                    "RemoveLithoBed", "RemoveLithoBedAtDepth")
+_install_collection("comment", "CommentBox", "CommentBoxAtDepth", "InsertNewCommentBox",
+                    ("TopDepth", "BottomDepth", "Text"), "RemoveCommentBox", "RemoveCommentBoxAtDepth")
+_install_collection("fossil", "FossilItem", "FossilItemAtDepth", "InsertNewFossilItem",
+                    ("TopDepth", "BottomDepth", "SymbolCode", "Abundance", "Dominance", "Position"),
+                    "RemoveFossilItem", "RemoveFossilItemAtDepth")
+_install_collection("marker", "Marker", None, "InsertNewMarker",
+                    ("Depth", "Name", "Comment", "Contact"), "RemoveMarker", None)
+_install_collection("stack", "StackItem", "StackItemAtDepth", "InsertNewStackItem",
+                    ("TopDepth", "BottomDepth", "TopWidth", "BottomWidth"), "RemoveStackItem", "RemoveStackItemAtDepth")
+_install_collection("schmit", "SchmitBox", "SchmitBoxAtDepth", "InsertNewSchmitBox",
+                    ("TopDepth", "BottomDepth", "Text"), "RemoveSchmitBox", "RemoveSchmitBoxAtDepth")
+_install_collection("cross", "CrossBox", "CrossBoxAtDepth", "InsertNewCrossBox",
+                    ("TopDepth", "BottomDepth"), "RemoveCrossBox", "RemoveCrossBoxAtDepth")
+_install_collection("drill", "DrillItem", "DrillItemAtDepth", "InsertNewDrillItem",
+                    ("BottomDepth", "Diameter"), "RemoveDrillItem", None)
+_install_collection("eqp", "EqpItem", None, "InsertNewEqpItem",
+                    ("TopDepth", "BottomDepth", "Name"), "RemoveEqpItem", None)
@@ -10,6 +10,8 @@ class Odbc(DispatchWrapper):
     >>> odbc.interpret_sql_statement('$log = SELECT Depth, Value FROM tblGamma')
     """
 
+    __slots__ = ()
+
     def interpret_sql_statement(self, statement):
         """Executes the SQL statement provided
 
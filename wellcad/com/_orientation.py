@@ -0,0 +1,264 @@
+import numpy as np
+
+
+class Deviation:
+    """The deviation survey of a borehole, for the orientation of structures.
+
+    Holds the azimuth and tilt of the borehole axis against depth, e.g. as
+    read from the deviation logs of a document. The direction of the axis at
+    any depth is found by linear interpolation of the unit vectors along the
+    axis between the survey stations, so azimuths wrap around north and
+    vertical sections are handled without special cases. Above the first
+    and below the last station the direction of the closest station is
+    used. Requires NumPy.
+
+    Parameters
+    ----------
+    depth : array_like
+        The depths of the survey stations in current depth units.
+    azimuth : array_like
+        The azimuth of the borehole axis at each station, in degrees
+        clockwise from north.
+    tilt : array_like
+        The tilt of the borehole axis from the vertical at each station, in
+        degrees.
+
+    Raises
+    ------
+    ValueError
+        If the arrays do not have matching lengths or hold no station with
+        finite values.
+
+    Example
+    -------
+    >>> deviation = wellcad.com.Deviation.from_logs(borehole.get_log("AZI"), borehole.get_log("TILT"))
+    >>> deviation
+    <Deviation with 1840 stations from 12.5 to 472.3>
+    """
+
+    __slots__ = ("depth", "azimuth", "tilt")
+
+    def __init__(self, depth, azimuth, tilt):
+        depth, azimuth, tilt = (np.asarray(a, np.float64).ravel() for a in (depth, azimuth, tilt))
+        if not len(depth) == len(azimuth) == len(tilt):
+            raise ValueError("The depth, azimuth and tilt arrays must have the same length")
+        valid = np.isfinite(depth) & np.isfinite(azimuth) & np.isfinite(tilt)
+        if not valid.any():
+            raise ValueError("The deviation survey has no valid station")
+        order = np.argsort(depth[valid], kind="stable")
+        self.depth = depth[valid][order]
+        self.azimuth = azimuth[valid][order]
+        self.tilt = tilt[valid][order]
+
+    def __repr__(self):
+        return f"<Deviation with {len(self.depth)} stations from {self.depth[0]:g} to {self.depth[-1]:g}>"
+
+    @classmethod
+    def from_logs(cls, azimuth_log, tilt_log):
+        """Reads a deviation survey from the azimuth and tilt logs of a
+        borehole.
+
+        Each log is read with a single ``data_table`` call. Null values are
+        skipped, and the tilt is interpolated at the depths of the azimuth
+        log if the two logs are not sampled alike.
+
+        Parameters
+        ----------
+        azimuth_log : Log
+            The Well Log holding the borehole azimuth in degrees.
+        tilt_log : Log
+            The Well Log holding the borehole tilt in degrees.
+
+        Returns
+        -------
+        Deviation
+            The deviation survey.
+        """
+        depth, azimuth = azimuth_log.to_numpy()
+        tilt_depth, tilt = tilt_log.to_numpy()
+        valid = np.isfinite(tilt)
+        if len(tilt_depth) != len(depth) or not np.array_equal(tilt_depth, depth):
+            tilt = np.interp(depth, tilt_depth[valid], tilt[valid]) if valid.any() else np.full(len(depth), np.nan)
+        return cls(depth, azimuth, tilt)
+
+    def direction(self, depths):
+        """Gets the downhole unit vector along the borehole axis at some
+        depths.
+
+        Parameters
+        ----------
+        depths : array_like
+            The depths in current depth units.
+
+        Returns
+        -------
+        numpy.ndarray
+            An array of shape ``(n, 3)`` holding the north, east and down
+            components of the axis at each depth.
+        """
+        depths = np.asarray(depths, np.float64).ravel()
+        stations = _unit_vectors(self.azimuth, self.tilt)
+        axis = np.column_stack([np.interp(depths, self.depth, stations[:, i]) for i in range(3)])
+        return axis / np.linalg.norm(axis, axis=1, keepdims=True)
+
+
+def apparent_to_true(picks, deviation, reference="north"):
+    """Corrects the apparent azimuth and dip of structures for the deviation
+    of the borehole.
+
+    Does the same correction as
+    :meth:`Borehole.apply_structure_apparent_to_true_correction`, for all the
+    picks at once and without a round trip through WellCAD. The pole of each
+    plane is rotated from the frame of the borehole, interpolated at the
+    depth of the pick, to the geographic frame. Requires NumPy.
+
+    Parameters
+    ----------
+    picks : numpy.ndarray or list of numpy.ndarray
+        A structured array with (at least) the fields ``depth``,
+        ``azimuth`` and ``dip``, as returned by
+        :meth:`Log.structures_to_array`, holding the apparent dip azimuths
+        and dips in degrees. To correct several wells at once, a list of
+        such arrays, one per well.
+    deviation : Deviation or list of Deviation
+        The deviation survey of the borehole, or one per well if ``picks``
+        is a list.
+    reference : {"north", "high side"}, optional
+        The azimuth reference of the image the structures were picked on.
+        For north referenced images (the default) the apparent azimuths are
+        measured from the projection of north on the plane perpendicular to
+        the borehole axis, for high side referenced images from the high
+        side of the borehole.
+
+    Returns
+    -------
+    numpy.ndarray or list of numpy.ndarray
+        Copies of the picks holding the true dip azimuths and dips.
+
+    Raises
+    ------
+    ValueError
+        If the reference is unknown, a field is missing or the number of
+        pick arrays and deviation surveys do not match.
+
+    Example
+    -------
+    >>> deviation = wellcad.com.Deviation.from_logs(borehole.get_log("AZI"), borehole.get_log("TILT"))
+    >>> true_picks = wellcad.com.apparent_to_true(log.structures_to_array(), deviation)
+    >>> true_picks["dip"].mean()
+    34.2
+    """
+    return _correct(picks, deviation, reference, inverse=False)
+
+
+def true_to_apparent(picks, deviation, reference="north"):
+    """Computes the apparent azimuth and dip of structures in a deviated
+    borehole from their true azimuth and dip.
+
+    The inverse of :func:`apparent_to_true`, doing the same correction as
+    :meth:`Borehole.apply_structure_true_to_apparent_correction` for all
+    the picks at once. Requires NumPy.
+
+    Parameters
+    ----------
+    picks : numpy.ndarray or list of numpy.ndarray
+        A structured array with (at least) the fields ``depth``,
+        ``azimuth`` and ``dip`` holding the true dip azimuths and dips in
+        degrees, or a list of such arrays, one per well.
+    deviation : Deviation or list of Deviation
+        The deviation survey of the borehole, or one per well.
+    reference : {"north", "high side"}, optional
+        The azimuth reference of the apparent azimuths, see
+        :func:`apparent_to_true`.
+
+    Returns
+    -------
+    numpy.ndarray or list of numpy.ndarray
+        Copies of the picks holding the apparent dip azimuths and dips.
+    """
+    return _correct(picks, deviation, reference, inverse=True)
+
+
+def _correct(picks, deviation, reference, inverse):
+    if reference not in ("north", "high side"):
+        raise ValueError(f"reference must be 'north' or 'high side', not {reference!r}")
+    batch = isinstance(picks, (list, tuple))
+    wells = list(picks) if batch else [picks]
+    surveys = list(deviation) if isinstance(deviation, (list, tuple)) else [deviation]
+    if len(surveys) != len(wells):
+        raise ValueError(f"Got {len(wells)} pick arrays but {len(surveys)} deviation surveys")
+    for array in wells:
+        missing = [name for name in ("depth", "azimuth", "dip") if name not in (array.dtype.names or ())]
+        if missing:
+            raise ValueError(f"The picks have no {', '.join(missing)} field")
+    # The borehole axes are interpolated well by well, the rotation is done
+    # once for the picks of all the wells.
+    axis = np.concatenate([survey.direction(array["depth"]) for array, survey in zip(wells, surveys)])
+    azimuth = np.concatenate([np.asarray(array["azimuth"], np.float64) for array in wells])
+    dip = np.concatenate([np.asarray(array["dip"], np.float64) for array in wells])
+    frames = _borehole_frames(axis, reference)
+    pole = _poles(azimuth, dip)
+    if inverse:
+        pole = np.einsum("nji,nj->ni", frames, pole)
+    else:
+        pole = np.einsum("nij,nj->ni", frames, pole)
+    azimuth, dip = _angles(pole)
+    results, start = [], 0
+    for array in wells:
+        result = array.copy()
+        result["azimuth"] = azimuth[start:start + len(array)]
+        result["dip"] = dip[start:start + len(array)]
+        results.append(result)
+        start += len(array)
+    return results if batch else results[0]
+
+
+def _unit_vectors(azimuth, tilt):
+    """Gets the north, east and down components of directions given by their
+    azimuth and tilt from the vertical in degrees."""
+    azimuth, tilt = np.radians(azimuth), np.radians(tilt)
+    return np.column_stack((np.sin(tilt) * np.cos(azimuth), np.sin(tilt) * np.sin(azimuth), np.cos(tilt)))
+
+
+def _borehole_frames(axis, reference):
+    """Gets the rotation matrices from borehole to geographic coordinates.
+
+    The columns of each matrix are the azimuth reference of the image, the
+    direction 90 degrees clockwise from it (looking downhole) and the
+    borehole axis, in north, east and down components. The high side is
+    undefined in vertical sections, where north is used instead.
+    """
+    if reference == "high side":
+        up = np.array([0.0, 0.0, -1.0])
+        x = up - (axis @ up)[:, np.newaxis] * axis
+        norm = np.linalg.norm(x, axis=1)
+        vertical = norm < 1e-9
+    else:
+        vertical = np.ones(len(axis), bool)
+        x = np.empty_like(axis)
+    if vertical.any():
+        north = np.array([1.0, 0.0, 0.0])
+        x[vertical] = north - (axis[vertical] @ north)[:, np.newaxis] * axis[vertical]
+        # A horizontal borehole pointing north has no north reference, its
+        # image is then referenced to the top of the hole.
+        along_north = np.linalg.norm(x, axis=1) < 1e-9
+        x[vertical & along_north] = [0.0, 0.0, -1.0]
+    x /= np.linalg.norm(x, axis=1, keepdims=True)
+    y = np.cross(axis, x)
+    return np.stack((x, y, axis), axis=2)
+
+
+def _poles(azimuth, dip):
+    """Gets the downward pointing poles of planes given by their dip azimuth
+    and dip in degrees. The pole points away from the dip direction."""
+    azimuth, dip = np.radians(azimuth), np.radians(dip)
+    return np.column_stack((-np.sin(dip) * np.cos(azimuth), -np.sin(dip) * np.sin(azimuth), np.cos(dip)))
+
+
+def _angles(pole):
+    """Gets the dip azimuths and dips in degrees of planes from their poles."""
+    pole = np.where(pole[:, 2:] < 0, -pole, pole)
+    dip = np.degrees(np.arccos(np.clip(pole[:, 2], -1.0, 1.0)))
+    azimuth = np.degrees(np.arctan2(-pole[:, 1], -pole[:, 0])) % 360.0
+    azimuth[(dip < 1e-9) | (azimuth >= 360.0)] = 0.0
+    return azimuth, dip
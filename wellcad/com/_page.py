@@ -14,6 +14,8 @@ class Page(DispatchWrapper):
     >>> page = borehole.page
     """
 
+    __slots__ = ()
+
     @property
     def depth_range(self):
         """int : Identify the depth range mode
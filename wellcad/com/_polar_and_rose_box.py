@@ -14,6 +14,8 @@ class PolarAndRoseBox(DispatchWrapper):
     "Intervals Automatically Determined"
     """
 
+    __slots__ = ()
+
     @property
     def top_depth(self):
         """float: The top depth of the Polar & Rose box in current
@@ -0,0 +1,113 @@
+import collections
+from . import _hooks
+from ._dispatch_wrapper import CacheInfo
+
+# Method name prefixes that only read from the document.
+_QUERY_PREFIXES = ("Get", "NbOf")
+
+
+class PropertyCache(_hooks.DispatchHook):
+    """A read-through cache of the property values of wrapper objects.
+
+    While the cache is active, the first read of a property of a wrapper
+    object (e.g. ``log.name``) is forwarded to WellCAD and later reads of the
+    same property of the same object are answered from the cache. The cache
+    is active inside a ``with`` block, usually opened with
+    ``Borehole.cached()``, and applies to all wrapper objects.
+
+    Any property put and any method call that may modify a document empties
+    the whole cache, since a change to one object can affect the properties
+    of others (e.g. inserting data into a log moves the bottom depth of the
+    borehole). Method calls that only read, i.e. methods whose name starts
+    with ``Get`` or ``NbOf`` or that are listed in the ``_QUERY_METHODS`` of
+    the wrapper class, leave the cache untouched. Changes made in WellCAD
+    itself are not detected.
+
+    Example
+    -------
+    >>> with borehole.cached() as cache:
+    ...     for i in range(borehole.nb_of_logs):
+    ...         report(borehole.get_log(i))
+    >>> cache.cache_info(wellcad.com.Log)
+    CacheInfo(hits=1520, misses=190, currsize=0)
+    """
+
+    def __init__(self):
+        # Maps id(wrapper) to (wrapper, {property name: value}). The wrapper
+        # is kept alive so that its id cannot be reused while cached.
+        self._entries = {}
+        # Maps wrapper class to a [hits, misses] counter.
+        self._stats = collections.defaultdict(lambda: [0, 0])
+
+    def __enter__(self):
+        _hooks.install(self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        _hooks.uninstall(self)
+        self.clear()
+
+    def get(self, wrapper, name, fetch):
+        entry = self._entries.get(id(wrapper))
+        stats = self._stats[type(wrapper)]
+        if entry is not None and name in entry[1]:
+            stats[0] += 1
+            return entry[1][name]
+        stats[1] += 1
+        value = fetch()
+        if entry is None:
+            entry = self._entries[id(wrapper)] = (wrapper, {})
+        entry[1][name] = value
+        return value
+
+    def put(self, wrapper, name, value, store):
+        try:
+            store()
+        finally:
+            self.clear()
+
+    def invoke(self, wrapper, name, args, call):
+        if name.startswith(_QUERY_PREFIXES) or name in wrapper._QUERY_METHODS:
+            return call()
+        try:
+            return call()
+        finally:
+            self.clear()
+
+    def clear(self):
+        """Empties the cache. The statistics are kept."""
+        self._entries.clear()
+
+    def cache_info(self, cls=None):
+        """Reports how effective the cache has been.
+
+        Parameters
+        ----------
+        cls : type, optional
+            A wrapper class, e.g. ``wellcad.com.Log``. By default the
+            statistics are summed over all classes.
+
+        Returns
+        -------
+        CacheInfo
+            A named tuple of ``hits``, ``misses`` and ``currsize`` (the number
+            of cached property values).
+        """
+        entries = [values for wrapper, values in self._entries.values() if cls is None or type(wrapper) is cls]
+        if cls is None:
+            hits = sum(stats[0] for stats in self._stats.values())
+            misses = sum(stats[1] for stats in self._stats.values())
+        else:
+            hits, misses = self._stats.get(cls, (0, 0))
+        return CacheInfo(hits, misses, sum(len(values) for values in entries))
+
+    def hit_rates(self):
+        """Gets the fraction of property reads answered from the cache.
+
+        Returns
+        -------
+        dict
+            Maps the name of each wrapper class that was read from to its hit
+            rate, between 0 and 1.
+        """
+        return {cls.__name__: hits / (hits + misses) for cls, (hits, misses) in self._stats.items() if hits + misses}
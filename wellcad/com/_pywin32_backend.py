@@ -0,0 +1,70 @@
+import pythoncom
+import pywintypes
+import win32com.client
+import win32com.client.build
+from win32com.client.dynamic import CDispatch
+from ._backend import Backend
+
+DISP_E_UNKNOWNNAME = -2147352570
+
+
+class Pywin32Backend(Backend):
+    """Drives a real WellCAD instance through ``pywin32`` dynamic dispatch."""
+
+    name = "pywin32"
+
+    def create_dispatch(self, prog_id, new_instance=False):
+        if new_instance:
+            return win32com.client.DispatchEx(prog_id)
+        return win32com.client.Dispatch(prog_id)
+
+    def initialize_thread(self):
+        # A single-threaded apartment, as WellCAD is an STA server.
+        pythoncom.CoInitialize()
+
+    def uninitialize_thread(self):
+        pythoncom.CoUninitialize()
+
+    def is_dispatch(self, obj):
+        return isinstance(obj, CDispatch)
+
+    def interface_key(self, dispatch):
+        # The interface id changes along with the server interface, so a
+        # different WellCAD version never reuses stale DISPIDs.
+        return getattr(dispatch._olerepr_, "clsid", None)
+
+    def identity_key(self, dispatch):
+        # The COM identity of an object is its IUnknown pointer. The proxy of
+        # an out-of-process server answers this query without a round-trip.
+        unknown = dispatch._oleobj_.QueryInterface(pythoncom.IID_IUnknown)
+        try:
+            hash(unknown)
+        except TypeError:
+            return None
+        return unknown
+
+    def is_method(self, dispatch, name):
+        olerepr = dispatch._olerepr_
+        if name not in olerepr.mapFuncs and name not in olerepr.propMap and name not in olerepr.propMapGet:
+            # Look the name up in the type information, as CDispatch does on
+            # first access, but without invoking it as a property get.
+            dispatch._LazyAddAttr_(name)
+        return name in olerepr.mapFuncs
+
+    def resolve_names(self, dispatch, names):
+        entries = {}
+        for name in names:
+            try:
+                dispid = dispatch._oleobj_.GetIDsOfNames(0, name)
+            except pywintypes.com_error as e:
+                if e.args[0] == DISP_E_UNKNOWNNAME:
+                    continue  # name doesn't exist in this version of wellcad or was not found, ignoring.
+                raise
+            entries[name] = win32com.client.build.MapEntry(dispid, (name,))
+        return entries
+
+    def register_names(self, dispatch, methods, attributes):
+        # Equivalent to dispatch._FlagAsMethod for the methods, and forces
+        # pywin32 to treat the attributes as actual properties.
+        dispatch._olerepr_.mapFuncs.update(methods)
+        dispatch._olerepr_.propMap.update(attributes)
@@ -0,0 +1,443 @@
+import collections
+import datetime
+import functools
+import gzip
+import io
+import pickle
+import threading
+import weakref
+from ._backend import Backend, _create_backend, get_backend, set_backend
+
+_FORMAT = "wellcad-session"
+_VERSION = 1
+
+# The kinds of recorded events.
+_CREATE = "n"
+_GET = "g"
+_PUT = "p"
+_CALL = "c"
+
+# The value types the server hands out as they are.
+_PLAIN_TYPES = (type(None), bool, int, float, str, bytes)
+
+
+class ReplayError(RuntimeError):
+    """Raised by the replay backend when a call was not recorded."""
+
+
+class ReplayComError(Exception):
+    """Raised by the replay backend where the recorded server raised an
+    error.
+
+    The arguments are those of the recorded error, i.e. ``(hresult,
+    strerror, excepinfo, argerror)`` for a ``pywintypes.com_error``.
+    """
+
+
+class _Marker:
+    __slots__ = ()
+
+
+class _Ref(_Marker):
+    """A dispatch object in a recording, by its id in the session."""
+
+    __slots__ = ("id",)
+
+    def __init__(self, id):
+        self.id = id
+
+    def __reduce__(self):
+        return _Ref, (self.id,)
+
+    def __eq__(self, other):
+        return isinstance(other, _Ref) and other.id == self.id
+
+    def __hash__(self):
+        return hash(self.id)
+
+    def replay(self, backend):
+        return ReplayDispatch(self.id, backend)
+
+
+class _Raised(_Marker):
+    """An error raised by the server in a recording."""
+
+    __slots__ = ("args",)
+
+    def __init__(self, args):
+        self.args = args
+
+    def __reduce__(self):
+        return _Raised, (self.args,)
+
+    def replay(self, backend):
+        raise ReplayComError(*self.args)
+
+
+class RecordingBackend(Backend):
+    """Records a COM session to a file that :class:`ReplayBackend` can
+    replay.
+
+    The recording backend sits in front of another backend, usually
+    ``"pywin32"`` driving a real WellCAD instance, and records every
+    property get, property put and method call made on the dispatch objects,
+    with their arguments and results. Used as a context manager, it is made
+    the active backend for the duration of the ``with`` block and the
+    session is saved when the block is left.
+
+    Dates are recorded as ``datetime.datetime`` objects with a fixed UTC
+    offset and server errors as :class:`ReplayComError`, so that the
+    recording can be replayed on any platform.
+
+    Parameters
+    ----------
+    path : str or os.PathLike
+        The file to save the session to.
+    backend : Backend or str, optional
+        The backend to record, or its name. Defaults to the active backend.
+
+    Example
+    -------
+    On the machine running WellCAD:
+
+    >>> with wellcad.com.RecordingBackend("pipeline.wcs"):
+    ...     run_pipeline(wellcad.com.Application())
+
+    Anywhere else:
+
+    >>> wellcad.com.set_backend(wellcad.com.ReplayBackend("pipeline.wcs"))
+    >>> run_pipeline(wellcad.com.Application())
+    """
+
+    name = "recording"
+
+    def __init__(self, path, backend=None):
+        if backend is None:
+            backend = get_backend()
+        elif isinstance(backend, str):
+            backend = _create_backend(backend)
+        self.path = path
+        self.backend = backend
+        self.events = []
+        self._next_id = 0
+        # Maps the identity keys of the recorded backend to the dispatch
+        # objects handed out, so that a server object keeps its id when it is
+        # handed out again. An entry, and the identity key it holds, goes
+        # away with the last reference to its dispatch object.
+        self._dispatches = weakref.WeakValueDictionary()
+        self._lock = threading.Lock()
+        self._previous = None
+
+    def __enter__(self):
+        self._previous = get_backend()
+        set_backend(self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        set_backend(self._previous)
+        self.save()
+
+    def save(self, path=None):
+        """Writes the session recorded so far.
+
+        Parameters
+        ----------
+        path : str or os.PathLike, optional
+            The file to write to. Defaults to the ``path`` given to the
+            constructor.
+        """
+        with self._lock:
+            events = list(self.events)
+        with gzip.open(self.path if path is None else path, "wb", compresslevel=6) as f:
+            pickle.dump({"format": _FORMAT, "version": _VERSION, "events": events}, f,
+                        protocol=pickle.HIGHEST_PROTOCOL)
+
+    def create_dispatch(self, prog_id, new_instance=False):
+        try:
+            dispatch = self.backend.create_dispatch(prog_id, new_instance)
+        except Exception as e:
+            self._record(_CREATE, None, prog_id, new_instance, _Raised(_plain(e.args)))
+            raise
+        return self._result(_CREATE, None, prog_id, new_instance, dispatch)
+
+    def initialize_thread(self):
+        self.backend.initialize_thread()
+
+    def uninitialize_thread(self):
+        self.backend.uninitialize_thread()
+
+    def is_dispatch(self, obj):
+        return isinstance(obj, RecordedDispatch)
+
+    def interface_key(self, dispatch):
+        return self.backend.interface_key(dispatch._target)
+
+    def identity_key(self, dispatch):
+        return dispatch._id
+
+    def is_method(self, dispatch, name):
+        return self.backend.is_method(dispatch._target, name)
+
+    def resolve_names(self, dispatch, names):
+        return self.backend.resolve_names(dispatch._target, names)
+
+    def register_names(self, dispatch, methods, attributes):
+        self.backend.register_names(dispatch._target, methods, attributes)
+
+    def _record(self, kind, obj, name, payload, result):
+        with self._lock:
+            self.events.append((kind, obj, name, payload, result))
+
+    def _result(self, kind, obj, name, payload, value):
+        """Records the result of a call and returns it to the caller."""
+        if self.backend.is_dispatch(value):
+            identity = self.backend.identity_key(value)
+            with self._lock:
+                dispatch = self._dispatches.get(identity) if identity is not None else None
+                if dispatch is None:
+                    dispatch = RecordedDispatch(value, self._next_id, self)
+                    self._next_id += 1
+                    if identity is not None:
+                        self._dispatches[identity] = dispatch
+                self.events.append((kind, obj, name, payload, _Ref(dispatch._id)))
+            return dispatch
+        self._record(kind, obj, name, payload, _plain(value))
+        return value
+
+
+class RecordedDispatch:
+    """The dispatch objects handed out by :class:`RecordingBackend`.
+
+    Parameters
+    ----------
+    target : object
+        The dispatch object of the recorded backend.
+    id : int
+        The id of the dispatch object in the session.
+    recorder : RecordingBackend
+        The backend recording the session.
+    """
+
+    __slots__ = ("_target", "_id", "_recorder", "__weakref__")
+
+    def __init__(self, target, id, recorder):
+        object.__setattr__(self, "_target", target)
+        object.__setattr__(self, "_id", id)
+        object.__setattr__(self, "_recorder", recorder)
+
+    def __getattr__(self, name):
+        if name in RecordedDispatch.__slots__:
+            raise AttributeError(name)
+        target = self._target
+        if name.startswith("_"):
+            return getattr(target, name)
+        recorder = self._recorder
+        backend = recorder.backend
+        if not backend.is_method(target, name):
+            try:
+                value = getattr(target, name)
+            except AttributeError:
+                raise  # Not a member of the server object, nothing to replay.
+            except Exception as e:
+                recorder._record(_GET, self._id, name, None, _Raised(_plain(e.args)))
+                raise
+            if not callable(value) or backend.is_dispatch(value):
+                return recorder._result(_GET, self._id, name, None, value)
+        return functools.partial(self._invoke, name)
+
+    def __setattr__(self, name, value):
+        if name.startswith("_"):
+            setattr(self._target, name, value)
+            return
+        recorder = self._recorder
+        try:
+            setattr(self._target, name, _unwrap(value))
+        except Exception as e:
+            recorder._record(_PUT, self._id, name, _encode(value), _Raised(_plain(e.args)))
+            raise
+        recorder._record(_PUT, self._id, name, _encode(value), None)
+
+    def _invoke(self, name, *args):
+        recorder = self._recorder
+        payload = tuple(_encode(arg) for arg in args)
+        try:
+            value = getattr(self._target, name)(*(_unwrap(arg) for arg in args))
+        except Exception as e:
+            recorder._record(_CALL, self._id, name, payload, _Raised(_plain(e.args)))
+            raise
+        return recorder._result(_CALL, self._id, name, payload, value)
+
+
+def _unwrap(value):
+    return value._target if isinstance(value, RecordedDispatch) else value
+
+
+def _encode(value):
+    if isinstance(value, RecordedDispatch):
+        return _Ref(value._id)
+    return _plain(value)
+
+
+def _plain(value):
+    """Converts a value to types that can be replayed on any platform."""
+    if isinstance(value, _PLAIN_TYPES):
+        return value
+    if isinstance(value, (tuple, list)):
+        if all(isinstance(item, _PLAIN_TYPES) for item in value):
+            return value
+        return type(value)(_plain(item) for item in value)
+    if isinstance(value, datetime.datetime):
+        # pywintypes.datetime and its time zones only exist on Windows.
+        offset = value.utcoffset()
+        return datetime.datetime(value.year, value.month, value.day, value.hour, value.minute, value.second,
+                                 value.microsecond, None if offset is None else datetime.timezone(offset))
+    return value
+
+
+class _Unpickler(pickle.Unpickler):
+    """Only loads the types a recording is made of."""
+
+    _ALLOWED = {("datetime", "datetime"), ("datetime", "timezone"), ("datetime", "timedelta"),
+                (__name__, "_Ref"), (__name__, "_Raised")}
+
+    def find_class(self, module, name):
+        if (module, name) not in self._ALLOWED:
+            raise pickle.UnpicklingError(f"{module}.{name} is not allowed in a WellCAD session")
+        return super().find_class(module, name)
+
+
+class ReplayBackend(Backend):
+    """Replays a session recorded with :class:`RecordingBackend`.
+
+    Every call answers with the recorded result (or raises the recorded
+    error) without doing any work, which makes it possible to measure the
+    Python side of a pipeline, on any platform and without WellCAD. The
+    calls made on each dispatch object must match the recording member by
+    member, but the calls on different objects may be interleaved
+    differently. A call that was not recorded, or more often than recorded,
+    raises a :class:`ReplayError`.
+
+    Parameters
+    ----------
+    path : str or os.PathLike
+        The session file written by :class:`RecordingBackend`.
+    strict : bool, optional
+        If True, also check that the arguments of the calls and the values
+        put match the recording. Defaults to False, which is faster.
+    """
+
+    name = "replay"
+
+    def __init__(self, path, strict=False):
+        with gzip.open(path, "rb") as f:
+            session = _Unpickler(io.BufferedReader(f)).load()
+        if not isinstance(session, dict) or session.get("format") != _FORMAT:
+            raise ValueError(f"{path} is not a WellCAD session")
+        if session["version"] > _VERSION:
+            raise ValueError(f"{path} was recorded with a newer version of pywellcad")
+        self.events = session["events"]
+        self.strict = strict
+        self.rewind()
+
+    def rewind(self):
+        """Starts the replay over, e.g. to run a benchmark again.
+
+        Dispatch objects handed out before must not be used afterwards.
+        """
+        queues = collections.defaultdict(collections.deque)
+        for kind, obj, name, payload, result in self.events:
+            queues[obj, name].append((kind, payload, result))
+        self._queues = dict(queues)
+
+    @property
+    def remaining(self):
+        """int: The number of recorded calls that have not been replayed."""
+        return sum(len(queue) for queue in self._queues.values())
+
+    def create_dispatch(self, prog_id, new_instance=False):
+        return self._next(None, prog_id, _CREATE, new_instance)
+
+    def is_dispatch(self, obj):
+        return isinstance(obj, ReplayDispatch)
+
+    def identity_key(self, dispatch):
+        return dispatch._id
+
+    def is_method(self, dispatch, name):
+        queue = self._queues.get((dispatch._id, name))
+        return bool(queue) and queue[0][0] == _CALL
+
+    def resolve_names(self, dispatch, names):
+        return {name: name for name in names}
+
+    def register_names(self, dispatch, methods, attributes):
+        pass
+
+    def _next(self, obj, name, kind, payload=None):
+        queue = self._queues.get((obj, name))
+        if not queue or queue[0][0] != kind:
+            raise ReplayError(f"No recorded {_KIND_NAMES[kind]} {_describe(obj, name)} left to replay")
+        recorded_kind, recorded, result = queue.popleft()
+        if self.strict and kind != _GET and _encode_replayed(payload) != recorded:
+            raise ReplayError(f"The {_KIND_NAMES[kind]} {_describe(obj, name)} differs from the recording: "
+                              f"{payload!r} instead of {recorded!r}")
+        if isinstance(result, _Marker):
+            return result.replay(self)
+        return result
+
+
+class ReplayDispatch:
+    """The dispatch objects handed out by :class:`ReplayBackend`.
+
+    Parameters
+    ----------
+    id : int
+        The id of the dispatch object in the session.
+    backend : ReplayBackend
+        The backend replaying the session.
+    """
+
+    __slots__ = ("_id", "_backend")
+
+    def __init__(self, id, backend):
+        object.__setattr__(self, "_id", id)
+        object.__setattr__(self, "_backend", backend)
+
+    def __repr__(self):
+        return f"<ReplayDispatch #{self._id}>"
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        backend = self._backend
+        queue = backend._queues.get((self._id, name))
+        if queue:
+            kind, _, result = queue[0]
+            if kind == _CALL:
+                return functools.partial(self._invoke, name)
+            if kind == _GET:
+                # The fast path of _next, for the most frequent call.
+                queue.popleft()
+                return result.replay(backend) if isinstance(result, _Marker) else result
+        return backend._next(self._id, name, _GET)
+
+    def __setattr__(self, name, value):
+        self._backend._next(self._id, name, _PUT, value)
+
+    def _invoke(self, name, *args):
+        return self._backend._next(self._id, name, _CALL, args)
+
+
+_KIND_NAMES = {_CREATE: "creation of", _GET: "get of", _PUT: "put of", _CALL: "call to"}
+
+
+def _describe(obj, name):
+    return name if obj is None else f"#{obj}.{name}"
+
+
+def _encode_replayed(value):
+    if isinstance(value, ReplayDispatch):
+        return _Ref(value._id)
+    if isinstance(value, (tuple, list)) and any(isinstance(item, ReplayDispatch) for item in value):
+        return type(value)(_encode_replayed(item) for item in value)
+    return value
@@ -18,6 +18,8 @@ class StackingPatternItem(DispatchWrapper):
     12.5
     """
 
+    __slots__ = ()
+
     @property
     def top_depth(self):
         """float: The top depth of the item in current depth
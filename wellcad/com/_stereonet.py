@@ -0,0 +1,342 @@
+import numbers
+import numpy as np
+from ._orientation import _poles, _angles, _unit_vectors
+
+# The number of pick vectors compared to all the grid nodes at once when
+# computing density grids, to bound the memory used.
+_DENSITY_CHUNK = 4096
+
+
+def rose_histograms(picks, intervals, bins=36, measure="azimuth", bidirectional=False):
+    """Counts the picks of each depth interval in azimuth bins, as in the rose
+    diagrams of a Polar & Rose Log.
+
+    The picks are assigned to the intervals in O(n log n) and counted with a
+    single ``numpy.bincount`` call for all the intervals. Requires NumPy.
+
+    Parameters
+    ----------
+    picks : numpy.ndarray or list of numpy.ndarray
+        A structured array of picks as returned by
+        :meth:`Log.structures_to_array`, or a list of such arrays, one per
+        well, to process several wells in one run.
+    intervals : array_like, Log or float
+        The depth intervals: an array of shape ``(m, 2)`` holding the top
+        and bottom depth of each interval, a Polar & Rose Log whose boxes are
+        used as intervals, or a depth step for intervals of fixed thickness
+        covering the picks. For several wells, a list with one entry per
+        well, or a single depth step.
+    bins : int, optional
+        The number of bins over 360 degrees, starting at north. Defaults to
+        36, i.e. 10 degree bins.
+    measure : {"azimuth", "strike"}, optional
+        The angle counted: the ``azimuth`` field of the picks (the dip
+        direction of Structure picks), or ``trend`` if there is none, or the
+        strike, 90 degrees counter-clockwise from the dip direction.
+    bidirectional : bool, optional
+        If True, each pick is also counted in the opposite bin, as is usual
+        for strikes. Defaults to False.
+
+    Returns
+    -------
+    intervals : numpy.ndarray
+        The ``(m, 2)`` top and bottom depths of the intervals, sorted by top
+        depth.
+    counts : numpy.ndarray
+        The integer counts, of shape ``(m, bins)``.
+
+    For a list of wells, a list with one ``(intervals, counts)`` tuple per
+    well is returned.
+
+    Example
+    -------
+    >>> intervals, counts = wellcad.com.rose_histograms(log.structures_to_array(), 10.0)
+    >>> counts.shape
+    (25, 36)
+    """
+    if measure not in ("azimuth", "strike"):
+        raise ValueError(f"measure must be 'azimuth' or 'strike', not {measure!r}")
+    if bins < 1:
+        raise ValueError("bins must be at least 1")
+    zones, index = _assign(picks, intervals)
+    angle = np.concatenate([_field(array, "azimuth", "trend") for array in zones.picks])
+    if measure == "strike":
+        angle = angle - 90.0
+    inside = index >= 0
+    index, angle = index[inside], angle[inside]
+    if bidirectional:
+        index, angle = np.concatenate((index, index)), np.concatenate((angle, angle + 180.0))
+    flat = index * bins + np.floor(angle % 360.0 * (bins / 360.0)).astype(np.intp) % bins
+    counts = np.bincount(flat, minlength=zones.count * bins).reshape(zones.count, bins)
+    return zones.split(counts)
+
+
+def mean_vectors(picks, intervals):
+    """Computes the mean orientation of the picks of each depth interval.
+
+    The mean is the direction of the resultant of the unit vectors of the
+    picks: the poles of the planes of Structure picks, or the lines of
+    Lineation picks, taken in the lower hemisphere. Requires NumPy.
+
+    Parameters
+    ----------
+    picks : numpy.ndarray or list of numpy.ndarray
+        A structured array of Structure picks (with ``azimuth`` and ``dip``
+        fields) or Lineation picks (with ``trend`` and ``plunge`` fields),
+        or a list of such arrays, one per well.
+    intervals : array_like, Log or float
+        The depth intervals, see :func:`rose_histograms`.
+
+    Returns
+    -------
+    intervals : numpy.ndarray
+        The ``(m, 2)`` top and bottom depths of the intervals, sorted by top
+        depth.
+    means : numpy.ndarray
+        A structured array with one record per interval and the fields
+        ``count``, the number of picks, ``azimuth`` and ``dip`` (or
+        ``trend`` and ``plunge`` for lineations) of the mean orientation in
+        degrees, ``resultant_length``, the length of the mean resultant
+        between 0 (dispersed) and 1 (parallel), and ``kappa``, the
+        estimate ``(n - 1) / (n - R)`` of the Fisher concentration. The
+        fields are NaN for intervals holding no pick.
+
+    For a list of wells, a list with one ``(intervals, means)`` tuple per
+    well is returned.
+
+    Example
+    -------
+    >>> intervals, means = wellcad.com.mean_vectors(picks, borehole.get_log("Rose"))
+    >>> means[["azimuth", "dip"]][0]
+    (132.5, 41.8)
+    """
+    zones, index = _assign(picks, intervals)
+    vectors, lines = _vectors(zones.picks)
+    inside = index >= 0
+    index, vectors = index[inside], vectors[inside]
+    count = np.bincount(index, minlength=zones.count).astype(np.float64)
+    # Axial data: the vectors are aligned on the first principal direction of
+    # their interval before summing, so antipodal picks add up.
+    tensor = np.stack([np.column_stack([np.bincount(index, vectors[:, i] * vectors[:, j], zones.count)
+                                        for j in range(3)]) for i in range(3)], axis=1)
+    principal = np.linalg.eigh(tensor)[1][:, :, -1]
+    sign = np.where(np.einsum("ij,ij->i", vectors, principal[index]) < 0, -1.0, 1.0)
+    resultant = np.column_stack([np.bincount(index, sign * vectors[:, i], zones.count) for i in range(3)])
+    length = np.linalg.norm(resultant, axis=1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = resultant / length[:, np.newaxis]
+        resultant_length = length / count
+        kappa = np.where(count > length, (count - 1.0) / (count - length), np.inf)
+    azimuth, dip = _line_angles(mean) if lines else _angles(mean)
+    names = ("trend", "plunge") if lines else ("azimuth", "dip")
+    means = np.empty(zones.count, [("count", np.int64), (names[0], np.float64), (names[1], np.float64),
+                                   ("resultant_length", np.float64), ("kappa", np.float64)])
+    empty = count == 0
+    means["count"] = count
+    for name, values in zip(names + ("resultant_length", "kappa"), (azimuth, dip, resultant_length, kappa)):
+        values[empty] = np.nan
+        means[name] = values
+    return zones.split(means)
+
+
+def density_grids(picks, intervals, method="kamb", sigma=3.0, grid=51):
+    """Computes the density of the picks of each depth interval on a lower
+    hemisphere equal area (Schmidt) stereonet, for contouring.
+
+    The poles of the planes of Structure picks, or the lines of Lineation
+    picks, are counted around each node of a square grid covering the
+    stereonet. Requires NumPy.
+
+    Parameters
+    ----------
+    picks : numpy.ndarray or list of numpy.ndarray
+        A structured array of Structure or Lineation picks, or a list of
+        such arrays, one per well.
+    intervals : array_like, Log or float
+        The depth intervals, see :func:`rose_histograms`.
+    method : {"kamb", "fisher"}, optional
+        ``"kamb"`` (the default) counts the vectors in a cone around each
+        node, with the cone size of Kamb (1959). ``"fisher"`` sums a Fisher
+        distribution kernel around each vector instead, giving smooth
+        contours.
+    sigma : float, optional
+        The number of standard deviations setting the size of the counting
+        cone or the width of the kernel for the number of picks of the
+        interval. Defaults to 3.
+    grid : int, optional
+        The number of nodes along each side of the grid. Defaults to 51.
+
+    Returns
+    -------
+    intervals : numpy.ndarray
+        The ``(m, 2)`` top and bottom depths of the intervals, sorted by top
+        depth.
+    densities : numpy.ndarray
+        The densities in multiples of a uniform distribution, of shape
+        ``(m, grid, grid)``. Node ``[i, j]`` lies at ``x = u[j]`` (east) and
+        ``y = u[i]`` (north), where ``u = numpy.linspace(-1, 1, grid)``, with
+        the primitive circle of the stereonet of radius 1. Nodes outside the
+        stereonet and the grids of intervals holding no pick are NaN.
+
+    For a list of wells, a list with one ``(intervals, densities)`` tuple
+    per well is returned.
+
+    Example
+    -------
+    >>> intervals, densities = wellcad.com.density_grids(picks, 25.0, method="fisher")
+    >>> matplotlib.pyplot.contourf(numpy.linspace(-1, 1, 51), numpy.linspace(-1, 1, 51), densities[0])
+    """
+    if method not in ("kamb", "fisher"):
+        raise ValueError(f"method must be 'kamb' or 'fisher', not {method!r}")
+    if grid < 2:
+        raise ValueError("grid must be at least 2")
+    zones, index = _assign(picks, intervals)
+    vectors, _ = _vectors(zones.picks)
+    nodes, outside = _grid_nodes(grid)
+    densities = np.full((zones.count, grid * grid), np.nan)
+    inside = index >= 0
+    order = np.argsort(index[inside], kind="stable")
+    index, vectors = index[inside][order], vectors[inside][order]
+    bounds = np.searchsorted(index, np.arange(zones.count + 1))
+    for zone in range(zones.count):
+        members = vectors[bounds[zone]:bounds[zone + 1]]
+        n = len(members)
+        if not n:
+            continue
+        total = np.zeros(len(nodes))
+        if method == "kamb":
+            area = sigma ** 2 / (n + sigma ** 2)
+            for start in range(0, n, _DENSITY_CHUNK):
+                cosine = np.abs(members[start:start + _DENSITY_CHUNK] @ nodes.T)
+                total += (cosine >= 1.0 - area).sum(axis=0)
+            densities[zone] = total / (n * area)
+        else:
+            kappa = 2.0 * (1.0 + n / sigma ** 2)
+            for start in range(0, n, _DENSITY_CHUNK):
+                cosine = np.abs(members[start:start + _DENSITY_CHUNK] @ nodes.T)
+                total += (np.exp(kappa * (cosine - 1.0)) + np.exp(-kappa * (cosine + 1.0))).sum(axis=0)
+            densities[zone] = total * kappa / (n * -np.expm1(-2.0 * kappa))
+    densities[:, outside] = np.nan
+    return zones.split(densities.reshape(zones.count, grid, grid))
+
+
+class _Zones:
+    """The intervals of one or several wells, numbered one after the other."""
+
+    def __init__(self, picks, intervals, batch):
+        self.picks = picks
+        self.intervals = intervals
+        self.batch = batch
+        self.offsets = np.cumsum([0] + [len(i) for i in intervals])
+        self.count = int(self.offsets[-1])
+
+    def split(self, values):
+        results = [(intervals, values[start:stop]) for intervals, start, stop
+                   in zip(self.intervals, self.offsets[:-1], self.offsets[1:])]
+        return results if self.batch else results[0]
+
+
+def _assign(picks, intervals):
+    """Assigns the picks of each well to the intervals holding their depth.
+
+    Returns the zones and, for the picks of all the wells one after the
+    other, the index of their interval among all the intervals, or -1 if no
+    interval holds them. Intervals hold their top and bottom depths, a depth
+    shared by two intervals belongs to the deeper one.
+    """
+    batch = isinstance(picks, (list, tuple))
+    wells = list(picks) if batch else [picks]
+    if batch and isinstance(intervals, (list, tuple)):
+        if len(intervals) != len(wells):
+            raise ValueError(f"Got {len(wells)} pick arrays but {len(intervals)} intervals")
+        sources = list(intervals)
+    else:
+        sources = [intervals] * len(wells)
+    for array in wells:
+        if "depth" not in (array.dtype.names or ()):
+            raise ValueError("The picks have no depth field")
+    tables = [_intervals(source, array["depth"]) for source, array in zip(sources, wells)]
+    zones = _Zones(wells, tables, batch)
+    indices = []
+    for array, table, offset in zip(wells, tables, zones.offsets):
+        depth = np.asarray(array["depth"], np.float64)
+        position = np.searchsorted(table[:, 0], depth, side="right") - 1
+        inside = (position >= 0) & (depth <= table[np.maximum(position, 0), 1]) if len(table) else \
+            np.zeros(len(depth), bool)
+        indices.append(np.where(inside, position + offset, -1))
+    return zones, np.concatenate(indices) if indices else np.empty(0, np.intp)
+
+
+def _intervals(source, depths):
+    """Gets the sorted ``(m, 2)`` intervals given as an array, a Polar & Rose
+    Log or a depth step."""
+    if isinstance(source, numbers.Real):
+        step = float(source)
+        if not step > 0:
+            raise ValueError("The depth step must be positive")
+        depths = np.asarray(depths, np.float64)
+        depths = depths[np.isfinite(depths)]
+        if not len(depths):
+            return np.empty((0, 2))
+        top = np.floor(depths.min() / step) * step
+        count = int(np.floor((depths.max() - top) / step)) + 1
+        tops = top + step * np.arange(count)
+        return np.column_stack((tops, tops + step))
+    if hasattr(source, "data_table"):
+        from ._arrays import table_to_array
+        if source.type != 20:
+            raise ValueError(f"{source.name!r} is not a Polar & Rose Log")
+        table = table_to_array(source.data_table)
+        source = table[:, :2] if len(table) else np.empty((0, 2))
+    table = np.asarray(source, np.float64)
+    if table.size == 0:
+        return np.empty((0, 2))
+    if table.ndim != 2 or table.shape[1] != 2:
+        raise ValueError(f"Expected intervals of shape (m, 2), got shape {table.shape}")
+    if not np.isfinite(table).all() or (table[:, 1] < table[:, 0]).any():
+        raise ValueError("The intervals must be finite and have their bottom below their top")
+    return table[np.argsort(table[:, 0], kind="stable")]
+
+
+def _field(picks, *names):
+    for name in names:
+        if name in (picks.dtype.names or ()):
+            return np.asarray(picks[name], np.float64)
+    raise ValueError(f"The picks have no {' or '.join(names)} field")
+
+
+def _vectors(picks):
+    """Gets the lower hemisphere unit vectors of the picks of all the wells:
+    the poles of planes, or lines for picks with trend and plunge fields."""
+    lines = all("plunge" in (array.dtype.names or ()) for array in picks)
+    if lines:
+        trend = np.concatenate([_field(array, "trend") for array in picks])
+        plunge = np.concatenate([_field(array, "plunge") for array in picks])
+        return _unit_vectors(trend, 90.0 - plunge), True
+    azimuth = np.concatenate([_field(array, "azimuth") for array in picks])
+    dip = np.concatenate([_field(array, "dip") for array in picks])
+    return _poles(azimuth, dip), False
+
+
+def _line_angles(vectors):
+    """Gets the trends and plunges in degrees of lower hemisphere lines."""
+    vectors = np.where(vectors[:, 2:] < 0, -vectors, vectors)
+    plunge = np.degrees(np.arcsin(np.clip(vectors[:, 2], -1.0, 1.0)))
+    trend = np.degrees(np.arctan2(vectors[:, 1], vectors[:, 0])) % 360.0
+    trend[(plunge > 90.0 - 1e-9) | (trend >= 360.0)] = 0.0
+    return trend, plunge
+
+
+def _grid_nodes(grid):
+    """Gets the lower hemisphere unit vectors of the nodes of an equal area
+    stereonet grid, and the mask of the nodes outside the stereonet."""
+    u = np.linspace(-1.0, 1.0, grid)
+    x, y = np.meshgrid(u, u)
+    x, y = x.ravel(), y.ravel()
+    radius = np.hypot(x, y)
+    outside = radius > 1.0 + 1e-12
+    # Inverse of the Lambert azimuthal equal area projection, scaled so that
+    # the horizontal plane maps to the unit circle.
+    angle = 2.0 * np.arcsin(np.clip(radius, 0.0, 1.0) / np.sqrt(2.0))
+    azimuth = np.degrees(np.arctan2(x, y))
+    return _unit_vectors(azimuth, np.degrees(angle)), outside
@@ -103,6 +103,8 @@ class Structure(DispatchWrapper):
     '2 - Bed / Lamina'
     """
 
+    __slots__ = ()
+
     @property
     def depth(self):
         """float : The depth of the center of a structure object in
@@ -32,6 +32,8 @@ class Title(DispatchWrapper):
     >>> title.box_height = 200
     """
 
+    __slots__ = ()
+
     @property
     def left_position(self):
         """float: The position of the left side of a title for a log or group,
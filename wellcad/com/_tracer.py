@@ -0,0 +1,210 @@
+import collections
+import json
+import sys
+import threading
+import time
+from . import _hooks
+
+CallStats = collections.namedtuple("CallStats", ["count", "errors", "total", "p50", "p99", "args_size",
+                                                 "result_size"])
+
+# Frames of these modules are left out of the recorded call stacks.
+_INTERNAL_MODULES = {_hooks.__name__, __name__, "functools"}
+
+
+class ComTracer(_hooks.DispatchHook):
+    """Records the COM calls made by the wrapper objects and their latency.
+
+    Used as a context manager, the tracer records every property get,
+    property put and method call made through a wrapper object inside the
+    ``with`` block, under the name ``"Class.Member"`` (e.g. ``"Log.GetData"``
+    or ``"Borehole.FilterLog"``). Property puts are recorded as
+    ``"Class.Member="``. Outside of the block, or when no tracer is used,
+    the wrapper objects call the dispatch objects directly and tracing costs
+    nothing.
+
+    The sizes of the arguments and results are measured as the number of
+    values they hold, so that a ``DataTable`` of 1000 rows and 2 columns
+    counts 2000 and a single number counts 1.
+
+    Parameters
+    ----------
+    stacks : bool, optional
+        Whether to record the Python call stack of each COM call, which is
+        needed by :meth:`to_collapsed`. Defaults to True.
+
+    Example
+    -------
+    >>> with wellcad.com.ComTracer() as tracer:
+    ...     borehole.filter_log("GR", 5)
+    ...     data = borehole.get_log("GR").to_numpy()
+    >>> print(tracer.report())
+    member                  count   total (s)    p50 (ms)    p99 (ms)   args size  result size
+    Borehole.FilterLog          1       2.310    2310.000    2310.000           2            1
+    ...
+    >>> tracer.to_collapsed("gr.folded")  # for flamegraph.pl or speedscope
+    """
+
+    def __init__(self, stacks=True):
+        self._stacks_enabled = stacks
+        self._lock = threading.Lock()
+        self.clear()
+
+    def __enter__(self):
+        _hooks.install(self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        _hooks.uninstall(self)
+
+    def clear(self):
+        """Forgets all recorded calls."""
+        with self._lock:
+            self._latencies = collections.defaultdict(list)
+            self._errors = collections.Counter()
+            self._args_sizes = collections.Counter()
+            self._result_sizes = collections.Counter()
+            self._stacks = collections.Counter()
+
+    def get(self, wrapper, name, fetch):
+        return self._record(f"{type(wrapper).__name__}.{name}", 0, fetch)
+
+    def put(self, wrapper, name, value, store):
+        self._record(f"{type(wrapper).__name__}.{name}=", _size(value), store)
+
+    def invoke(self, wrapper, name, args, call):
+        return self._record(f"{type(wrapper).__name__}.{name}", _size(args), call)
+
+    def _record(self, key, args_size, call):
+        stack = self._caller_stack() if self._stacks_enabled else None
+        start = time.perf_counter()
+        try:
+            result = call()
+        except BaseException:
+            elapsed = time.perf_counter() - start
+            with self._lock:
+                self._errors[key] += 1
+                self._add(key, elapsed, args_size, 0, stack)
+            raise
+        elapsed = time.perf_counter() - start
+        result_size = _size(result)
+        with self._lock:
+            self._add(key, elapsed, args_size, result_size, stack)
+        return result
+
+    def _add(self, key, elapsed, args_size, result_size, stack):
+        self._latencies[key].append(elapsed)
+        self._args_sizes[key] += args_size
+        self._result_sizes[key] += result_size
+        if stack is not None:
+            self._stacks[f"{stack};{key}" if stack else key] += elapsed
+
+    @staticmethod
+    def _caller_stack():
+        frames = []
+        frame = sys._getframe(2)
+        while frame is not None:
+            module = frame.f_globals.get("__name__", "?")
+            if module not in _INTERNAL_MODULES:
+                frames.append(f"{module}:{frame.f_code.co_name}")
+            frame = frame.f_back
+        return ";".join(reversed(frames))
+
+    def stats(self):
+        """Summarizes the recorded calls.
+
+        Returns
+        -------
+        dict
+            Maps each ``"Class.Member"`` name to a ``CallStats`` named tuple
+            of ``count``, ``errors``, ``total`` (seconds), ``p50`` and ``p99``
+            (seconds), and the total ``args_size`` and ``result_size``. The
+            members are sorted by decreasing total time.
+        """
+        with self._lock:
+            stats = {key: CallStats(len(latencies), self._errors[key], sum(latencies),
+                                    _percentile(latencies, 50), _percentile(latencies, 99),
+                                    self._args_sizes[key], self._result_sizes[key])
+                     for key, latencies in self._latencies.items()}
+        return dict(sorted(stats.items(), key=lambda item: item[1].total, reverse=True))
+
+    def report(self, top=None):
+        """Formats the statistics as a text table.
+
+        Parameters
+        ----------
+        top : int, optional
+            The number of members to show, by decreasing total time. By
+            default all of them.
+
+        Returns
+        -------
+        str
+            The table.
+        """
+        lines = [f"{'member':<40}{'count':>8}{'total (s)':>12}{'p50 (ms)':>12}{'p99 (ms)':>12}"
+                 f"{'args size':>12}{'result size':>13}"]
+        for key, s in list(self.stats().items())[:top]:
+            lines.append(f"{key:<40}{s.count:>8}{s.total:>12.3f}{s.p50 * 1e3:>12.3f}{s.p99 * 1e3:>12.3f}"
+                         f"{s.args_size:>12}{s.result_size:>13}")
+        return "\n".join(lines)
+
+    def to_json(self, path=None):
+        """Exports the statistics as JSON.
+
+        Parameters
+        ----------
+        path : str, optional
+            If given, the JSON document is also written to this file.
+
+        Returns
+        -------
+        str
+            A JSON object mapping each member to its statistics, with the
+            times in seconds.
+        """
+        text = json.dumps({key: s._asdict() for key, s in self.stats().items()}, indent=2)
+        if path is not None:
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(text)
+        return text
+
+    def to_collapsed(self, path=None):
+        """Exports the time spent in COM calls in the collapsed stack format.
+
+        Each line holds a Python call stack, from the outermost frame to the
+        COM member, separated by semicolons, followed by the time spent in
+        microseconds. This is the input format of ``flamegraph.pl``,
+        speedscope and similar flame graph tools. Requires ``stacks=True``.
+
+        Parameters
+        ----------
+        path : str, optional
+            If given, the text is also written to this file.
+
+        Returns
+        -------
+        str
+            The collapsed stacks, one per line.
+        """
+        with self._lock:
+            stacks = sorted(self._stacks.items())
+        text = "".join(f"{stack} {max(round(seconds * 1e6), 1)}\n" for stack, seconds in stacks)
+        if path is not None:
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(text)
+        return text
+
+
+def _percentile(values, percent):
+    ordered = sorted(values)
+    rank = max(int(-(-len(ordered) * percent // 100)), 1)
+    return ordered[rank - 1]
+
+
+def _size(value):
+    if value is None:
+        return 0
+    if isinstance(value, (tuple, list)):
+        return sum(_size(item) for item in value)
+    return 1
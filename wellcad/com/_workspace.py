@@ -11,6 +11,9 @@ class Workspace(DispatchWrapper):
     >>> workspace = borehole.workspace("ISI workspace")
     >>> workspace.representative_picks(config_file_name=config_file)
     """
+
+    __slots__ = ()
+
     _DISPATCH_METHODS = ("PickSimilarFeatures", "RepresentativePicks", )
 
     def auto_detect_zones(self):